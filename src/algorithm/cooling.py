@@ -0,0 +1,140 @@
+import math
+import statistics
+from abc import ABC, abstractmethod
+
+# Cooling schedule untuk simulated_annealing. start(t0, iteration) dipanggil di awal run dan setiap
+# reheat, next(...) memberi suhu untuk iterasi berikutnya. Schedule dengan `steps` selesai setelah
+# sekian iterasi sejak start terakhir, geometric berhenti karena suhu turun di bawah min_temp.
+SCHEDULES = ('geometric', 'linear', 'logarithmic', 'lundy_mees', 'adaptive')
+
+
+class CoolingSchedule(ABC):
+    name = None
+    steps = None
+
+    def start(self, t0, iteration=0, min_temp=1e-3):
+        self.t0 = t0
+        self.origin = iteration
+        self.min_temp = min_temp
+
+    @abstractmethod
+    def next(self, temperature, iteration, delta, accepted):
+        pass
+
+    def finished(self, iteration):
+        return self.steps is not None and iteration - self.origin >= self.steps
+
+
+class Geometric(CoolingSchedule):
+    name = 'geometric'
+
+    def __init__(self, rate=0.99):
+        self.rate = rate
+
+    def next(self, temperature, iteration, delta, accepted):
+        return temperature * self.rate
+
+
+class Linear(CoolingSchedule):
+    # T_k = T0 * (1 - k / steps), sampai min_temp tepat di akhir
+    name = 'linear'
+
+    def __init__(self, steps=10000):
+        self.steps = steps
+
+    def next(self, temperature, iteration, delta, accepted):
+        k = iteration - self.origin
+        return max(self.min_temp, self.t0 * (1 - k / self.steps))
+
+
+class Logarithmic(CoolingSchedule):
+    # T_k = T0 / (1 + scale * ln(1 + k)), sangat lambat sehingga selalu dibatasi steps
+    name = 'logarithmic'
+
+    def __init__(self, steps=10000, scale=1.0):
+        self.steps = steps
+        self.scale = scale
+
+    def next(self, temperature, iteration, delta, accepted):
+        k = iteration - self.origin
+        return self.t0 / (1 + self.scale * math.log1p(k))
+
+
+class LundyMees(CoolingSchedule):
+    # T_{k+1} = T_k / (1 + beta * T_k), beta dipilih agar suhu mencapai min_temp setelah steps iterasi
+    name = 'lundy_mees'
+
+    def __init__(self, steps=10000, beta=None):
+        self.steps = steps
+        self.fixed_beta = beta
+
+    def start(self, t0, iteration=0, min_temp=1e-3):
+        super().start(t0, iteration, min_temp)
+        self.beta = self.fixed_beta
+        if self.beta is None:
+            self.beta = (1 / min_temp - 1 / t0) / self.steps
+
+    def next(self, temperature, iteration, delta, accepted):
+        return temperature / (1 + self.beta * temperature)
+
+
+class Adaptive(CoolingSchedule):
+    # Suhu diatur agar acceptance ratio move yang memburuk mengikuti target yang turun linear dari
+    # target_start ke target_end selama steps iterasi; dievaluasi setiap `window` iterasi
+    name = 'adaptive'
+
+    def __init__(self, steps=10000, target_start=0.5, target_end=0.01, window=100, gain=2.0):
+        self.steps = steps
+        self.target_start = target_start
+        self.target_end = target_end
+        self.window = window
+        self.gain = gain
+
+    def start(self, t0, iteration=0, min_temp=1e-3):
+        super().start(t0, iteration, min_temp)
+        self.proposed = 0
+        self.accepted = 0
+
+    def target(self, iteration):
+        progress = min(1.0, (iteration - self.origin) / self.steps)
+        return self.target_start + (self.target_end - self.target_start) * progress
+
+    def next(self, temperature, iteration, delta, accepted):
+        if delta > 0:
+            self.proposed += 1
+            self.accepted += accepted
+        if (iteration - self.origin) % self.window or not self.proposed:
+            return temperature
+        ratio = self.accepted / self.proposed
+        self.proposed = 0
+        self.accepted = 0
+        # acceptance terlalu tinggi -> suhu turun, terlalu rendah -> suhu naik
+        return max(self.min_temp, temperature * math.exp(self.gain * (self.target(iteration) - ratio)))
+
+
+def make_schedule(name='geometric', cooling_rate=0.99, steps=10000):
+    if name == 'geometric':
+        return Geometric(cooling_rate)
+    if name == 'linear':
+        return Linear(steps)
+    if name == 'logarithmic':
+        return Logarithmic(steps)
+    if name == 'lundy_mees':
+        return LundyMees(steps)
+    if name == 'adaptive':
+        return Adaptive(steps)
+    raise ValueError(f"Cooling schedule tidak dikenal: {name}")
+
+
+def estimate_initial_temperature(state, neighbor, samples=200, acceptance=0.8):
+    # T0 agar move memburuk rata-rata diterima dengan peluang `acceptance`: exp(-mean_delta / T0) = acceptance.
+    # Delta diambil dari `samples` tetangga acak state awal (neighbor = generate_neighbor).
+    score = state.count_penalty()
+    uphill = []
+    for _ in range(samples):
+        delta = neighbor(state).count_penalty() - score
+        if delta > 0:
+            uphill.append(delta)
+    if not uphill:
+        return 1.0
+    return -statistics.fmean(uphill) / math.log(acceptance)
@@ -2,37 +2,87 @@ import random
 import time
 import os
 import sys
-import matplotlib.pyplot as plt
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from state import State, Container
-from input_manager import load_problem
+from compact_state import CompactState
+from input_manager import get_problem
+from parallel import make_executor, spawn_seeds
+from recorder import make_recorder
+from residual_tree import ResidualTree
+from reporting import plot_ga_experiments
+from profiler import profiling, merge_reports, print_profile
+from stopping import StoppingPolicy
+from construction import INITIAL_STATES, CONSTRUCTORS, shuffled_first_fit
+
+ISLAND_TOPOLOGIES = ('ring', 'fully_connected', 'random')
+# cut: potong-sambung dua parent, group: group crossover Falkenauer berbasis kontainer
+CROSSOVER_TYPES = ('cut', 'group')
+
+
+def _evolve_island(problem, settings, population, best_state, generations, seed):
+    # populasi dan state terbaik pulau dikirim dan disimpan sebagai CompactState di antara epoch,
+    # hanya selama evolve dibentuk kembali menjadi State
+    random.seed(seed)
+    island_size, mutation_rate, crossover_rate, crossover_type = settings
+    ga = GeneticAlgorithm(problem, island_size, mutation_rate, crossover_rate, generations,
+                          crossover_type=crossover_type)
+    ga.population = [state.to_state() for state in population]
+    ga.best_state = best_state.to_state()
+    ga.best_penalty = best_state.count_penalty()
+    ga.max_penalty = ga.best_penalty
+    ga.evolve(generations)
+    ga.history['offspring_reuse'] = ga.reuse_stats()
+    population = [CompactState.from_state(state, problem) for state in ga.population]
+    return population, ga.history, CompactState.from_state(ga.best_state, problem)
 
 # coba commit aja test account :D
 class GeneticAlgorithm:
-    def __init__(self, problem_file, population_size, mutation_rate, crossover_rate, generations):
+    def __init__(self, problem_file, population_size, mutation_rate, crossover_rate, generations,
+                 history_policy='full', history_options=None, crossover_type='cut',
+                 vectorized=False, initial='random'):
+        if crossover_type not in CROSSOVER_TYPES:
+            raise ValueError(f"Tipe crossover tidak dikenal: {crossover_type}")
+        if initial not in INITIAL_STATES:
+            raise ValueError(f"State awal tidak dikenal: {initial}")
         self.problem_file = problem_file
         self.population_size = population_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.generations = generations
+        self.crossover_type = crossover_type
+        self.vectorized = vectorized
+        self.initial = initial
+        self.stop_reason = None
 
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(script_dir)
-        project_root = os.path.dirname(parent_dir)
-        self.problem_path = os.path.join(project_root, 'data', f'{self.problem_file}.json')
-        self.all_items, self.capacity = load_problem(self.problem_path)
+        self.problem = get_problem(problem_file)
+        self.problem_path = self.problem.path
+        self.all_items = list(self.problem.items)
+        self.capacity = self.problem.capacity
         self.population = []
+        # anak yang memakai ulang objek State parent/elite (tanpa salinan) dan total anak yang dibentuk
+        self.reused_children = 0
+        self.total_children = 0
+        history_options = history_options or {}
         self.history = {
-            'best_objective': [],
-            'max_objective': [],
-            'avg_objective': []
+            'best_objective': make_recorder(history_policy, 'best_objective', **history_options),
+            'max_objective': make_recorder(history_policy, 'max_objective', **history_options),
+            'avg_objective': make_recorder(history_policy, 'avg_objective', **history_options)
         }
 
-    def initialize_population(self):
+    def initialize_population(self, size=None):
+        # warm start: individu pertama dari heuristik konstruktif, sisanya first fit dengan urutan acak.
+        # size: jumlah individu (default population_size), dipakai run_islands untuk ukuran satu pulau
+        if size is None:
+            size = self.population_size
         self.population = []
-        for _ in range(self.population_size):
-            state = State()
-            state.generate_random_state(self.problem_file)
+        if self.initial != 'random':
+            self.population.append(CONSTRUCTORS[self.initial](self.problem))
+        while len(self.population) < size:
+            if self.initial != 'random':
+                state = shuffled_first_fit(self.problem)
+            else:
+                state = State()
+                state.generate_random_state(self.problem)
             self.population.append(state)
 
     def _selection(self, k=3):
@@ -41,6 +91,8 @@ class GeneticAlgorithm:
         return tournament_contenders[0][0]
 
     def crossover(self, parent1, parent2):
+        if self.crossover_type == 'group':
+            return self.group_crossover(parent1, parent2)
         child = State()
         p1_containers = parent1.list_container
         p2_containers = parent2.list_container
@@ -49,52 +101,78 @@ class GeneticAlgorithm:
         
         child_containers = []
         for c in p1_containers[:cut1]:
-            new_c = Container(c.capacity)
-            new_c.item_list = c.item_list.copy()
-            child_containers.append(new_c)
+            child_containers.append(c.copy())
             
         for c in p2_containers[cut2:]:
-            new_c = Container(c.capacity)
-            new_c.item_list = c.item_list.copy()
-            child_containers.append(new_c)
+            child_containers.append(c.copy())
 
         child.list_container = child_containers
         self.repair(child)
         return child
 
-    def repair(self, state):
-        items_in_state = set()
+    def group_crossover(self, parent1, parent2):
+        # Group crossover berbasis kontainer (representasi grouping Falkenauer): kontainer utuh dari
+        # kedua parent diwariskan mulai dari yang paling penuh selama barangnya belum terpakai,
+        # kontainer overflow tidak diwariskan, sisa barang disusun ulang oleh repair (FFD)
+        candidates = [c for c in parent1.list_container + parent2.list_container if c.load <= c.capacity]
+        random.shuffle(candidates)
+        candidates.sort(key=lambda c: c.load, reverse=True)
+
+        index = self.problem.index
+        taken = bytearray(len(self.problem))
+        inherited = []
+        for container in candidates:
+            positions = [index[item['id']] for item in container.item_list]
+            if any(taken[position] for position in positions):
+                continue
+            for position in positions:
+                taken[position] = 1
+            inherited.append(container.copy())
+
+        child = State()
+        child.list_container = inherited
+        self.repair(child)
+        return child
 
+    def repair(self, state):
+        # O(n + k log k + k log m) untuk k barang yang hilang dan m kontainer
+        index = self.problem.index
+        seen = bytearray(len(self.problem))
         for container in state.list_container:
-            for item in container.item_list[:]:
-                if item['id'] in items_in_state:
-                    container.item_list.remove(item)
+            kept = []
+            for item in container.item_list:
+                position = index[item['id']]
+                if not seen[position]:
+                    seen[position] = 1
+                    kept.append(item)
+            if len(kept) != len(container.item_list):
+                container.set_items(kept)
+
+        missing = [item for item, present in zip(self.problem.items, seen) if not present]
+        if missing:
+            # first fit decreasing: barang terbesar dulu, kontainer pertama yang muat dicari lewat segment tree
+            missing.sort(key=lambda item: item['ukuran'], reverse=True)
+            containers = state.list_container
+            residuals = ResidualTree(container.capacity - container.load for container in containers)
+            for item in missing:
+                position = residuals.first_fit(item['ukuran'])
+                if position < 0:
+                    container = Container(self.capacity)
+                    state.add_container(container)
+                    position = residuals.append(self.capacity)
                 else:
-                    items_in_state.add(item['id'])
+                    container = containers[position]
+                container.add_item(item)
+                residuals.update(position, container.capacity - container.load)
 
-        all_item_ids = set(item['id'] for item in self.all_items)
-        missing_item_ids = all_item_ids - items_in_state
-        
-        if missing_item_ids:
-            for item_id in missing_item_ids:
-                item_to_add = next(item for item in self.all_items if item['id'] == item_id)
-                placed = False
-                for container in state.list_container:
-                    if container.total_size() + item_to_add['ukuran'] <= container.capacity:
-                        container.item_list.append(item_to_add)
-                        placed = True
-                        break
-                if not placed:
-                    new_container = Container(self.capacity)
-                    new_container.item_list.append(item_to_add)
-                    state.list_container.append(new_container)
-        
-        state.list_container = [c for c in state.list_container if c.item_list]
+        state.remove_empty_containers()
 
     def mutate(self, state):
         if random.random() > self.mutation_rate:
             return
-        
+        self._mutate(state)
+
+    def _mutate(self, state):
         move_type = random.randint(1, 2)
         
         if not state.list_container:
@@ -106,17 +184,17 @@ class GeneticAlgorithm:
                 return
             
             item_to_move = random.choice(container_from.item_list)
-            container_from.item_list.remove(item_to_move)
+            container_from.remove_item(item_to_move)
 
             if random.random() < 0.1:
                 target_container = Container(self.capacity)
-                state.list_container.append(target_container)
+                state.add_container(target_container)
             else:
                 target_container = random.choice(state.list_container)
-            target_container.item_list.append(item_to_move)
+            target_container.add_item(item_to_move)
 
             if not container_from.item_list:
-                state.list_container.remove(container_from)
+                state.remove_container(container_from)
         else:
             non_empty_containers = [c for c in state.list_container if c.item_list]
             if len(non_empty_containers) < 2:
@@ -124,59 +202,223 @@ class GeneticAlgorithm:
             c1, c2 = random.sample(non_empty_containers, 2)
             item1 = random.choice(c1.item_list)
             item2 = random.choice(c2.item_list)
-            c1.item_list.remove(item1)
-            c2.item_list.remove(item2)
-            c1.item_list.append(item2)
-            c2.item_list.append(item1)
+            c1.remove_item(item1)
+            c2.remove_item(item2)
+            c1.add_item(item2)
+            c2.add_item(item1)
 
-    def run(self):
+    def run(self, profile=False, stopping=None):
         start_time = time.time()
-        self.initialize_population()
-        initial_best_state = min(self.population, key=lambda s: s.count_penalty()).copy()
-        best_state_overall = initial_best_state
-        best_penalty_overall = best_state_overall.count_penalty()
-        max_penalty_overall = best_penalty_overall
+        stopping = (stopping or StoppingPolicy()).start(self.problem)
+        with profiling(profile) as profiler:
+            if self.vectorized:
+                initial_best_state = self._run_vectorized(stopping)
+            else:
+                self.initialize_population()
+                initial_best_state = min(self.population, key=lambda s: s.count_penalty()).copy()
+                self.best_state = initial_best_state
+                self.best_penalty = self.best_state.count_penalty()
+                self.max_penalty = self.best_penalty
+
+                self.evolve(self.generations, stopping)
+        self.stop_reason = self.history['stop_reason'] = stopping.finish('generations')
+        self.history['max_objective_overall'] = self.max_penalty
+        if not self.vectorized:
+            self.history['offspring_reuse'] = self.reuse_stats()
+        if profiler is not None:
+            self.history['profile'] = profiler.report()
+
+        end_time = time.time()
+        duration = end_time - start_time
+        return initial_best_state, self.best_state, self.history, duration
+
+    def _run_vectorized(self, stopping):
+        # populasi sebagai matriks NumPy (individu x barang -> kontainer); self.population tidak dipakai
+        import numpy as np
+        from algorithm import vectorized_genetic as engine
+
+        rng = np.random.default_rng(random.getrandbits(64))
+        sizes = np.asarray(self.problem.sizes, dtype=np.float64)
+        population = engine.random_population(rng, self.population_size, len(self.problem))
+        if self.initial != 'random':
+            # hanya individu pertama yang di-warm start, membangun seluruh populasi dengan heuristik terlalu mahal
+            row = engine.from_state(CONSTRUCTORS[self.initial](self.problem), self.problem)
+            population = engine.compact(np.vstack([row[None, :], population[1:]]))
+        penalties, loads = engine.evaluate(population, sizes, self.capacity)
+        best = int(np.argmin(penalties))
+        best_row = population[best].copy()
+        initial_best_state = engine.to_state(best_row, self.problem)
+        self.best_penalty = float(penalties[best])
+        self.max_penalty = self.best_penalty
 
         for gen in range(self.generations):
-            self.population_with_penalty = []
-            penalties = []
-            for state in self.population:
-                penalty = state.count_penalty()
-                self.population_with_penalty.append((state, penalty))
-                penalties.append(penalty)
-                if penalty < best_penalty_overall:
-                    best_penalty_overall = penalty
-                    best_state_overall = state.copy()
-
-            best_objective = min(penalties)
-            max_objective = max(penalties)
-            avg_objective = sum(penalties) / len(penalties)
-            
-            if max_objective > max_penalty_overall:
-                max_penalty_overall = max_objective
-            
-            self.history['best_objective'].append(best_objective)
+            if gen:
+                population = engine.next_generation(rng, population, penalties, loads, best_row, self.capacity,
+                                                    self.mutation_rate, self.crossover_rate)
+                penalties, loads = engine.evaluate(population, sizes, self.capacity)
+            best = int(np.argmin(penalties))
+            if penalties[best] < self.best_penalty:
+                self.best_penalty = float(penalties[best])
+                best_row = population[best].copy()
+            max_objective = float(penalties.max())
+            self.max_penalty = max(self.max_penalty, max_objective)
+            self.history['best_objective'].append(float(penalties[best]))
             self.history['max_objective'].append(max_objective)
-            self.history['avg_objective'].append(avg_objective)
-            
-            new_population = []
-            new_population.append(best_state_overall.copy())
-
-            while len(new_population) < self.population_size:
-                parent1 = self._selection()
-                parent2 = self._selection()
-                if random.random() < self.crossover_rate:
-                    child = self.crossover(parent1, parent2)
-                else:
+            self.history['avg_objective'].append(float(penalties.mean()))
+            if stopping.record(self.best_penalty, len(population)):
+                break
+
+        self.best_state = engine.to_state(best_row, self.problem)
+        return initial_best_state
+
+    def evolve(self, generations, stopping=None):
+        for gen in range(generations):
+            self._evaluate_population()
+            if stopping is not None and stopping.record(self.best_penalty, len(self.population)):
+                return
+            self._next_generation()
+
+    def _evaluate_population(self):
+        self.population_with_penalty = []
+        penalties = []
+        for state in self.population:
+            penalty = state.count_penalty()
+            self.population_with_penalty.append((state, penalty))
+            penalties.append(penalty)
+            if penalty < self.best_penalty:
+                self.best_penalty = penalty
+                self.best_state = state.copy()
+
+        best_objective = min(penalties)
+        max_objective = max(penalties)
+        avg_objective = sum(penalties) / len(penalties)
+        
+        if max_objective > self.max_penalty:
+            self.max_penalty = max_objective
+        
+        self.history['best_objective'].append(best_objective)
+        self.history['max_objective'].append(max_objective)
+        self.history['avg_objective'].append(avg_objective)
+
+    def _next_generation(self):
+        # individu tidak pernah diubah in place setelah masuk populasi, jadi elite dan anak salinan parent
+        # yang tidak dimutasi memakai objek State yang sama; salinan baru hanya dibuat sebelum mutasi
+        new_population = [self.best_state]
+        self.reused_children += 1
+        self.total_children += 1
+
+        while len(new_population) < self.population_size:
+            parent1 = self._selection()
+            parent2 = self._selection()
+            if random.random() < self.crossover_rate:
+                child = self.crossover(parent1, parent2)
+            else:
+                child = parent1
+            if random.random() <= self.mutation_rate:
+                if child is parent1:
                     child = parent1.copy()
-                self.mutate(child)
-                new_population.append(child)
-            self.population = new_population
-        self.history['max_objective_overall'] = max_penalty_overall
+                self._mutate(child)
+            if child is parent1:
+                self.reused_children += 1
+            self.total_children += 1
+            new_population.append(child)
+        self.population = new_population
 
-        end_time = time.time()
-        duration = end_time - start_time
-        return initial_best_state, best_state_overall, self.history, duration
+    def reuse_stats(self):
+        return {
+            'reused': self.reused_children,
+            'total': self.total_children,
+            'reuse_rate': self.reused_children / self.total_children if self.total_children else 0.0,
+        }
+
+    def run_islands(self, num_islands=4, migration_interval=10, migration_size=2, topology='ring', workers=None,
+                    stopping=None):
+        if topology not in ISLAND_TOPOLOGIES:
+            raise ValueError(f"Topologi tidak dikenal: {topology}")
+        start_time = time.time()
+        stopping = (stopping or StoppingPolicy()).start(self.problem)
+        island_size = max(3, self.population_size // num_islands)
+        islands = []
+        for _ in range(num_islands):
+            self.initialize_population(island_size)
+            islands.append([CompactState.from_state(state, self.problem) for state in self.population])
+        initial_best_state = min((s for island in islands for s in island), key=lambda s: s.count_penalty()).to_state()
+        bests = [min(island, key=lambda s: s.count_penalty()).copy() for island in islands]
+        self.best_state = initial_best_state
+        self.best_penalty = self.best_state.count_penalty()
+        self.max_penalty = self.best_penalty
+        settings = (island_size, self.mutation_rate, self.crossover_rate, self.crossover_type)
+
+        with make_executor(workers) as executor:
+            done = 0
+            while done < self.generations:
+                epoch = min(migration_interval, self.generations - done)
+                futures = [
+                    executor.submit(_evolve_island, self.problem, settings, island, best, epoch, seed)
+                    for island, best, seed in zip(islands, bests, spawn_seeds(num_islands))
+                ]
+                outcomes = [future.result() for future in futures]
+                islands = [population for population, _, _ in outcomes]
+                bests = [best for _, _, best in outcomes]
+                self._merge_island_histories([history for _, history, _ in outcomes])
+                for best in bests:
+                    if best.count_penalty() < self.best_penalty:
+                        self.best_penalty = best.count_penalty()
+                        self.best_state = best.to_state()
+                done += epoch
+                # island berjalan di proses lain, jadi kriteria berhenti baru diperiksa setelah setiap epoch
+                for _ in range(epoch):
+                    stopping.record(self.best_penalty, island_size * num_islands)
+                if stopping.should_stop():
+                    break
+                if done < self.generations:
+                    self._migrate(islands, migration_size, topology)
+
+        self.population = [state.to_state() for island in islands for state in island]
+        self.stop_reason = self.history['stop_reason'] = stopping.finish('generations')
+        self.history['max_objective_overall'] = self.max_penalty
+        self.history['offspring_reuse'] = self.reuse_stats()
+        duration = time.time() - start_time
+        return initial_best_state, self.best_state, self.history, duration
+
+    def _merge_island_histories(self, histories):
+        bests = zip(*(h['best_objective'].values() for h in histories))
+        maxes = zip(*(h['max_objective'].values() for h in histories))
+        avgs = zip(*(h['avg_objective'].values() for h in histories))
+        for best_objectives, max_objectives, avg_objectives in zip(bests, maxes, avgs):
+            self.history['best_objective'].append(min(best_objectives))
+            max_objective = max(max_objectives)
+            self.history['max_objective'].append(max_objective)
+            self.history['avg_objective'].append(sum(avg_objectives) / len(avg_objectives))
+            if max_objective > self.max_penalty:
+                self.max_penalty = max_objective
+        for history in histories:
+            self.reused_children += history['offspring_reuse']['reused']
+            self.total_children += history['offspring_reuse']['total']
+
+    @staticmethod
+    def _migrate(islands, migration_size, topology):
+        num_islands = len(islands)
+        emigrants = [
+            [state.copy() for state in sorted(island, key=lambda s: s.count_penalty())[:migration_size]]
+            for island in islands
+        ]
+        for source in range(num_islands):
+            if topology == 'ring':
+                targets = [(source + 1) % num_islands]
+            elif topology == 'fully_connected':
+                targets = [t for t in range(num_islands) if t != source]
+            else:
+                targets = [random.choice([t for t in range(num_islands) if t != source] or [source])]
+            for target in targets:
+                if target == source:
+                    continue
+                island = islands[target]
+                island.sort(key=lambda s: s.count_penalty())
+                for k, migrant in enumerate(emigrants[source]):
+                    if k >= len(island) - 1:
+                        break
+                    island[-(k + 1)] = migrant.copy()
 
     @staticmethod
     def print_solution(state, title):
@@ -194,71 +436,48 @@ class GeneticAlgorithm:
                 print(f"  {item['id']} ({item['ukuran']})")
 
     @staticmethod
-    def plot_multiple_experiments(experiments_data):
+    def plot_multiple_experiments(experiments_data, show=True, plot_dir=None):
         if not experiments_data:
             print("Tidak ada data eksperimen untuk di-plot.")
             return
         
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(script_dir)
-        project_root = os.path.dirname(parent_dir)
-        plot_dir = os.path.join(project_root, 'result', 'plot')
-        
-        if not os.path.exists(plot_dir):
-            os.makedirs(plot_dir)
-
-        plt.figure(figsize=(10, 6))
-        
-        for label, history in experiments_data:
-            plt.plot(history['best_objective'], label=f"{label} (Best)", linewidth=2)
-            plt.plot(history['avg_objective'], label=f"{label} (Avg)", linewidth=2, linestyle='--', alpha=0.7)
-        
-        plt.title('Perbandingan Nilai Objektif (Best & Average) vs. Generasi', fontsize=14, fontweight='bold')
-        plt.xlabel('Generasi')
-        plt.ylabel('Nilai Objektif (Penalti)')
-        plt.legend(loc='best')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        filename = f"ga_plot_{timestamp}.png"
-        filepath = os.path.join(plot_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        print(f"\nPlot perbandingan disimpan ke: {filepath}")
-        
-        plt.show()
-        plt.close()
+        plot_ga_experiments(experiments_data, show=show, plot_dir=plot_dir)
         
         print("\n" + "="*80)
         print("RINGKASAN PERBANDINGAN EKSPERIMEN")
         print("="*80)
         for label, history in experiments_data:
-            best_pen = history['best_objective'][-1]
+            best_pen = history['best_objective'].last
             max_pen = history.get('max_objective_overall', max(history['max_objective']))
-            avg_pen = history['avg_objective'][-1]
-            initial_pen = history['best_objective'][0]
+            avg_pen = history['avg_objective'].last
+            initial_pen = history['best_objective'].first
             
             print(f"\n{label}:")
             print(f"  Nilai Objektif Awal: {initial_pen:.2f}")
             print(f"  Nilai Objektif Akhir: {best_pen:.2f}")
             print(f"  Nilai Objektif Maximum: {max_pen:.2f}")
             print(f"  Rata-Rata Nilai Objektif: {avg_pen:.2f}")
+            if 'offspring_reuse' in history:
+                reuse = history['offspring_reuse']
+                print(f"  Anak Tanpa Salinan: {reuse['reuse_rate']:.2%} ({reuse['reused']} dari {reuse['total']})")
 
     @staticmethod
-    def save_ga(experiments_results, file_path, mutation_rate):
+    def save_ga(experiments_results, file_path, mutation_rate, filename=None, result_dir=None):
         print(f"\n{'='*80}")
         print("SIMPAN HASIL EKSPERIMEN")
         print(f"{'='*80}")
-        filename = input("Masukkan nama file untuk menyimpan hasil (tanpa .txt): ").strip()
+        if filename is None:
+            filename = input("Masukkan nama file untuk menyimpan hasil (tanpa .txt): ").strip()
         
         if not filename:
             print("Nama file tidak valid. Hasil tidak disimpan.")
             return
         
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(script_dir)
-        project_root = os.path.dirname(parent_dir)
-        result_dir = os.path.join(project_root, 'result')
+        if result_dir is None:
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            parent_dir = os.path.dirname(script_dir)
+            project_root = os.path.dirname(parent_dir)
+            result_dir = os.path.join(project_root, 'result')
         filepath = os.path.join(result_dir, f"{filename}.txt")
 
         if not os.path.exists(result_dir):
@@ -290,7 +509,7 @@ class GeneticAlgorithm:
                     final_obj = result['final_state'].count_penalty()
                     history = result['history']
                     max_obj = history.get('max_objective_overall', max(history['max_objective']))
-                    avg_obj = history['avg_objective'][-1]
+                    avg_obj = history['avg_objective'].last
                     f.write(f"Nilai Objective Function Awal: {initial_obj}\n")
                     f.write(f"Nilai Objective Function Akhir: {final_obj}\n")
                     f.write(f"Nilai Objective Function Maximum: {max_obj:.2f}\n")
@@ -328,21 +547,27 @@ class GeneticAlgorithm:
 
 
     @staticmethod
-    def run_genetic_algorithm_experiments(file_path):
+    def run_genetic_algorithm_experiments(file_path, parameters=None, filename=None, show=True, profile=False,
+                                          stopping=None):
+        num_experiments = len(parameters) if parameters else 3
         print("=== MULTIPLE EXPERIMENTS - GENETIC ALGORITHM ===")
-        print("Anda akan menjalankan 3 eksperimen dengan parameter berbeda.")
+        print(f"Anda akan menjalankan {num_experiments} eksperimen dengan parameter berbeda.")
         print()
 
         MUTATION_RATE = 0.1
         CROSSOVER_RATE = 0.8
         experiments_results = []
+        problem = get_problem(file_path)
 
-        for i in range(3):
+        for i in range(num_experiments):
             print(f"\n{'='*80}")
-            print(f"EKSPERIMEN {i + 1} dari 3")
+            print(f"EKSPERIMEN {i + 1} dari {num_experiments}")
             print(f"{'='*80}")
             
-            while True:
+            if parameters:
+                population_size, generations = parameters[i]
+            
+            while not parameters:
                 try:
                     population_size = int(input(f"Eksperimen {i + 1} - Masukkan population size: "))
                     if population_size <= 0:
@@ -352,7 +577,7 @@ class GeneticAlgorithm:
                 except ValueError:
                     print("Input tidak valid! Masukkan angka.")
             
-            while True:
+            while not parameters:
                 try:
                     generations = int(input(f"Eksperimen {i + 1} - Masukkan jumlah generations: "))
                     if generations <= 0:
@@ -363,14 +588,14 @@ class GeneticAlgorithm:
                     print("Input tidak valid! Masukkan angka.")
             
             ga = GeneticAlgorithm(
-                problem_file=file_path,
+                problem_file=problem,
                 population_size=population_size,
                 mutation_rate=MUTATION_RATE,
                 crossover_rate=CROSSOVER_RATE,
                 generations=generations
             )
             
-            initial_state, final_state, history, duration = ga.run()
+            initial_state, final_state, history, duration = ga.run(profile=profile, stopping=stopping)
             
             experiment_label = f"Exp{i+1}: Pop={population_size}, Gen={generations}"
             experiments_results.append({
@@ -416,5 +641,14 @@ class GeneticAlgorithm:
         print(f"{'='*80}")
         
         experiments_data = [(result['label'], result['history']) for result in experiments_results]
-        GeneticAlgorithm.plot_multiple_experiments(experiments_data)
-        GeneticAlgorithm.save_ga(experiments_results, file_path, MUTATION_RATE)
\ No newline at end of file
+        with profiling(profile) as profiler:
+            GeneticAlgorithm.plot_multiple_experiments(experiments_data, show=show)
+            GeneticAlgorithm.save_ga(experiments_results, file_path, MUTATION_RATE, filename=filename)
+
+        if profiler is not None:
+            # plot dan penulisan hasil dilakukan sekali untuk semua eksperimen
+            shared = profiler.report()
+            for i, result in enumerate(experiments_results):
+                result['history']['profile'] = merge_reports(result['history']['profile'], shared)
+                print_profile(result['history']['profile'], f"Profil Eksperimen {i + 1}")
+        return experiments_results
\ No newline at end of file
@@ -1,161 +1,370 @@
+import math
 import random
 import time
+import contextlib
 import os
 import sys
-import matplotlib.pyplot as plt
+from concurrent.futures import as_completed, wait, FIRST_COMPLETED
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from state import State, Container
-from input_manager import load_problem
+from state import Move
+from input_manager import get_problem
+from parallel import make_executor, spawn_seeds
+from recorder import make_recorder
+from reporting import plot_hill_climbing_progress, plot_hill_climbing_runs
+from profiler import profiling, merge_reports, print_profile
+from stopping import StoppingPolicy
+from construction import initial_state
+
+# mode hcStochastic: full memilih acak di antara semua move yang memperbaiki (mengevaluasi seluruh
+# neighborhood), first menelusuri neighborhood dalam urutan acak dan sampled mengambil move acak,
+# keduanya menerima move pertama yang memperbaiki
+STOCHASTIC_MODES = ('full', 'first', 'sampled')
+# batas default move yang dievaluasi per langkah pada mode first/sampled sebelum local optimum
+DEFAULT_MAX_SAMPLES = 1000
+
+
+def _random_walk(m):
+    # permutasi acak 0..m-1 yang dihitung per posisi dalam O(1): start + k*step (mod m) dengan step koprima
+    # terhadap m, tanpa membuat atau mengacak daftar berukuran m
+    if m <= 1:
+        return lambda k: 0
+    start = random.randrange(m)
+    step = random.randrange(1, m)
+    while math.gcd(step, m) != 1:
+        step = random.randrange(1, m)
+    return lambda k: (start + k * step) % m
+
+def _restart_worker(problem, seed, max_iterations, vectorized, stopping, deadline=None):
+    # hanya melaporkan statistik (state akhir, iterasi, evaluasi); alasan berhenti ditentukan policy utama.
+    # deadline: time.time() saat batas waktu run habis; restart yang baru mulai setelahnya dilewati (None)
+    if deadline is not None:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return None
+        limit = stopping.elapsed() + remaining
+        stopping.time_limit = limit if stopping.time_limit is None else min(stopping.time_limit, limit)
+    random.seed(seed)
+    evaluations = stopping.evaluations
+    hc = HillClimbing(problem, 'steepest', vectorized=vectorized)
+    final_state, _ = hc.hcSteepest(max_iterations=max_iterations, save_plot=False, stopping=stopping)
+    return final_state, hc.iterations, stopping.evaluations - evaluations
+
+
+def _quiet_experiment_worker(problem, algorithm_type, experiment_num, seed, profile=False, stopping=None):
+    random.seed(seed)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        return HillClimbing._run_experiment(problem, algorithm_type, experiment_num, profile, stopping)
+
 
 class HillClimbing:
-    def __init__(self, problem_file, algorithm_type="steepest"):
+    def __init__(self, problem_file, algorithm_type="steepest", vectorized=False,
+                 history_policy='full', history_options=None, initial='random'):
+        # initial: 'random' (generate_random_state) atau heuristik konstruktif dari construction.py
         self.problem_file = problem_file
         self.algorithm_type = algorithm_type
+        self.vectorized = vectorized
+        self.history_policy = history_policy
+        self.history_options = history_options or {}
         self.iterations = 0
         self.sideways_moves = 0
         self.restarts = 0
+        self.stop_reason = None
         
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(script_dir)
-        project_root = os.path.dirname(parent_dir)
-        self.problem_path = os.path.join(project_root, 'data', f'{self.problem_file}.json')
-        _, self.capacity = load_problem(self.problem_path)
+        self.problem = get_problem(problem_file)
+        self.problem_path = self.problem.path
+        self.capacity = self.problem.capacity
         
-        self.original_state = State()
-        self.original_state.generate_random_state(problem_file)
+        self.original_state = initial_state(self.problem, initial)
         self.current_state = self.original_state.copy()
         self.best_state = self.current_state.copy()
         
-        self.values = []
+        self._start_values()
+
+    def _start_values(self, initial_penalty=None):
+        self.values = make_recorder(self.history_policy, 'hill_climbing', **self.history_options)
+        if initial_penalty is not None:
+            self.values.append(initial_penalty)
    
-    def generate_successors(self, state):
-        successors = []
-        
-        for i, container_from in enumerate(state.list_container):
+    def neighborhood(self, state):
+        containers = state.list_container
+        empty_cost = state.empty_container_cost()
+
+        for i, container_from in enumerate(containers):
             for item in container_from.item_list:
-                for j, _ in enumerate(state.list_container):
-                    if i != j:  
-                        new_state = state.copy()
-                        new_state.list_container[i].item_list.remove(item)
-                        new_state.list_container[j].item_list.append(item)
-                        new_state.list_container = [c for c in new_state.list_container if c.item_list]
-                        successors.append(new_state)
-                
-                new_state = state.copy()
-                new_state.list_container[i].item_list.remove(item)
-                new_container = Container(self.capacity)
-                new_container.item_list.append(item)
-                new_state.list_container.append(new_container)
-                new_state.list_container = [c for c in new_state.list_container if c.item_list]
-                successors.append(new_state)
-        
-        for i, container1 in enumerate(state.list_container):
-            for j, container2 in enumerate(state.list_container):
-                if i < j: 
-                    for item1 in container1.item_list:
-                        for item2 in container2.item_list:
-                            new_state = state.copy()
-                            new_state.list_container[i].item_list.remove(item1)
-                            new_state.list_container[j].item_list.remove(item2)
+                for j in range(len(containers)):
+                    if i != j:
+                        yield Move(state.relocate_delta(i, j, item, empty_cost), item, i, j, None)
+                yield Move(state.relocate_delta(i, None, item, empty_cost), item, i, None, None)
 
-                            new_state.list_container[i].item_list.append(item2)
-                            new_state.list_container[j].item_list.append(item1)
-                            successors.append(new_state)
-        return successors
+        for i, container1 in enumerate(containers):
+            for j in range(i + 1, len(containers)):
+                container2 = containers[j]
+                for item1 in container1.item_list:
+                    for item2 in container2.item_list:
+                        yield Move(state.swap_delta(i, j, item1, item2), item1, i, j, item2)
+
+    @staticmethod
+    def neighborhood_size(state):
+        # jumlah move yang dievaluasi neighborhood(): relokasi n*m dan swap antar pasangan kontainer
+        counts = [len(container.item_list) for container in state.list_container]
+        total = sum(counts)
+        return total * len(counts) + (total * total - sum(count * count for count in counts)) // 2
+
+    def shuffled_neighborhood(self, state, empty_cost=None):
+        # move yang sama seperti neighborhood() (swap dari kedua sisi) dalam urutan acak tanpa menyalin atau
+        # mengacak daftar kontainer: pasangan (sumber, tujuan) ditelusuri lewat _random_walk atas m*m pasangan,
+        # lalu semua move antara keduanya dimulai dari barang acak; tujuan i sendiri = kontainer baru
+        if empty_cost is None:
+            empty_cost = state.empty_container_cost()
+        containers = state.list_container
+        m = len(containers)
+        pair_walk = _random_walk(m * m)
+        for k in range(m * m):
+            i, j = divmod(pair_walk(k), m)
+            items = containers[i].item_list
+            if not items:
+                continue
+            partners = containers[j].item_list if j != i else ()
+            first_item = random.randrange(len(items))
+            for a in range(len(items)):
+                item = items[(first_item + a) % len(items)]
+                if j == i:
+                    yield Move(state.relocate_delta(i, None, item, empty_cost), item, i, None, None)
+                    continue
+                yield Move(state.relocate_delta(i, j, item, empty_cost), item, i, j, None)
+                for partner in partners:
+                    yield Move(state.swap_delta(i, j, item, partner), item, i, j, partner)
+
+    def sample_move(self, state, empty_cost=None):
+        # satu move acak dari neighborhood(): relokasi atau swap dengan peluang sama (tujuan i sendiri =
+        # kontainer baru), None jika kontainer sumber yang terpilih kosong
+        if empty_cost is None:
+            empty_cost = state.empty_container_cost()
+        containers = state.list_container
+        i = random.randrange(len(containers))
+        if not containers[i].item_list:
+            return None
+        item = random.choice(containers[i].item_list)
+        j = random.randrange(len(containers))
+        if j == i:
+            return Move(state.relocate_delta(i, None, item, empty_cost), item, i, None, None)
+        if containers[j].item_list and random.random() < 0.5:
+            partner = random.choice(containers[j].item_list)
+            return Move(state.swap_delta(i, j, item, partner), item, i, j, partner)
+        return Move(state.relocate_delta(i, j, item, empty_cost), item, i, j, None)
+
+    def first_improving_move(self, state, mode, max_samples=DEFAULT_MAX_SAMPLES, empty_cost=None):
+        # mengembalikan (move pertama yang memperbaiki atau None, jumlah move yang dievaluasi). max_samples
+        # membatasi evaluasi per langkah; None hanya boleh untuk mode first (seluruh neighborhood).
+        # empty_cost: biaya kontainer kosong state jika sudah diketahui (hcStochastic membuang kontainer
+        # kosong di awal sehingga 0), supaya satu langkah tidak perlu memeriksa seluruh kontainer
+        if max_samples is None and mode != 'first':
+            raise ValueError("Mode sampled membutuhkan max_samples")
+        if not state.list_container:
+            return None, 0
+        if empty_cost is None:
+            empty_cost = state.empty_container_cost()
+        if mode == 'first':
+            moves = self.shuffled_neighborhood(state, empty_cost)
+        else:
+            moves = (self.sample_move(state, empty_cost) for _ in range(max_samples))
+        evaluations = 0
+        for move in moves:
+            if max_samples is not None and evaluations >= max_samples:
+                break
+            evaluations += 1
+            if move is not None and move.delta < 0:
+                return move, evaluations
+        return None, evaluations
+
+    def generate_successors(self, state):
+        return [state.copy().apply_move(move) for move in self.neighborhood(state)]
+
+    def best_move(self, state):
+        if self.vectorized:
+            from algorithm.vectorized_neighborhood import best_move
+            return best_move(state)
+        return min(self.neighborhood(state), key=lambda move: move.delta, default=None)
     
-    def hcSteepest(self, max_iterations=1000, save_plot=True):
+    def hcSteepest(self, max_iterations=1000, save_plot=True, stopping=None):
+        stopping = (stopping or StoppingPolicy()).start(self.problem)
+        reason = 'max_iterations'
         self.iterations = 0
-        self.values = [self.current_state.count_penalty()]
+        self._start_values(self.current_state.count_penalty())
         print(f"Initial Penalty: {self.current_state.count_penalty()}")
         while self.iterations < max_iterations:
             self.iterations += 1
-            successors = self.generate_successors(self.current_state)
-            if not successors:
+            evaluations = self.neighborhood_size(self.current_state)
+            best_move = self.best_move(self.current_state)
+            if best_move is None:
+                reason = 'local_optimum'
                 break
-            best_successor = min(successors, key=lambda state: state.count_penalty())
-            if best_successor.count_penalty() < self.current_state.count_penalty():
-                self.current_state = best_successor
+            if best_move.delta < 0:
+                self.current_state.apply_move(best_move)
                 self.values.append(self.current_state.count_penalty())
                 if self.current_state.count_penalty() < self.best_state.count_penalty():
                     self.best_state = self.current_state.copy()
             else:
+                reason = 'local_optimum'
+                break
+            if stopping.record(self.best_state.count_penalty(), evaluations):
                 break
+        self.stop_reason = stopping.finish(reason)
         fig = self.plot_progress("Steepest Ascent Hill Climbing Progress", save=save_plot)
         return self.current_state, fig
     
-    def hcSideways(self, max_sideways=10, max_iterations=1000, save_plot=True):
+    def hcSideways(self, max_sideways=10, max_iterations=1000, save_plot=True, stopping=None):
+        stopping = (stopping or StoppingPolicy()).start(self.problem)
+        reason = 'max_iterations'
         self.iterations = 0
         self.sideways_moves = 0
-        self.values = [self.current_state.count_penalty()]
+        self._start_values(self.current_state.count_penalty())
         print(f"Initial Penalty: {self.current_state.count_penalty()}")
         while self.iterations < max_iterations and self.sideways_moves < max_sideways:
             self.iterations += 1
-            successors = self.generate_successors(self.current_state)
-            if not successors:
+            evaluations = self.neighborhood_size(self.current_state)
+            best_move = self.best_move(self.current_state)
+            if best_move is None:
+                reason = 'local_optimum'
                 break
-            best_successor = min(successors, key=lambda state: state.count_penalty())
-            if best_successor.count_penalty() < self.current_state.count_penalty():
-                self.current_state = best_successor
+            if best_move.delta < 0:
+                self.current_state.apply_move(best_move)
                 self.sideways_moves = 0  
                 self.values.append(self.current_state.count_penalty())
                 if self.current_state.count_penalty() < self.best_state.count_penalty():
                     self.best_state = self.current_state.copy()
-            elif best_successor.count_penalty() == self.current_state.count_penalty():
-                self.current_state = best_successor
+            elif best_move.delta == 0:
+                self.current_state.apply_move(best_move)
                 self.sideways_moves += 1
                 self.values.append(self.current_state.count_penalty())
             else:
+                reason = 'local_optimum'
+                break
+            if stopping.record(self.best_state.count_penalty(), evaluations):
                 break
+        if self.sideways_moves >= max_sideways:
+            reason = 'max_sideways'
+        self.stop_reason = stopping.finish(reason)
         fig = self.plot_progress("Sideways Hill Climbing Progress", save=save_plot)
         return self.current_state, fig
     
-    def hcStochastic(self, max_iterations=1000, save_plot=True):
+    def hcStochastic(self, max_iterations=1000, save_plot=True, stopping=None, mode='full',
+                     max_samples=DEFAULT_MAX_SAMPLES):
+        # mode: lihat STOCHASTIC_MODES. Pada first/sampled satu langkah hanya mengevaluasi move sampai yang
+        # pertama memperbaiki; local optimum dinyatakan setelah max_samples move tanpa perbaikan. Kontainer
+        # kosong dibuang sekali di awal dan move diterapkan tanpa menjaga urutan kontainer, sehingga satu
+        # langkah tidak bergantung pada jumlah kontainer
+        if mode not in STOCHASTIC_MODES:
+            raise ValueError(f"Mode stochastic tidak dikenal: {mode}")
+        if max_samples is None and mode == 'sampled':
+            raise ValueError("Mode sampled membutuhkan max_samples")
+        stopping = (stopping or StoppingPolicy()).start(self.problem)
+        reason = 'max_iterations'
         self.iterations = 0
-        self.values = [self.current_state.count_penalty()]
+        self._start_values(self.current_state.count_penalty())
         print(f"Initial Penalty: {self.current_state.count_penalty()}")
+        if mode != 'full':
+            self.current_state.remove_empty_containers()
         for _ in range(max_iterations):
             self.iterations += 1
-            successors = self.generate_successors(self.current_state)
-            if not successors:
-                break
-            current_penalty = self.current_state.count_penalty()
-            improving = [s for s in successors if s.count_penalty() < current_penalty]
-            if not improving:
+            if mode == 'full':
+                evaluations = self.neighborhood_size(self.current_state)
+                improving = [move for move in self.neighborhood(self.current_state) if move.delta < 0]
+                chosen = random.choice(improving) if improving else None
+            else:
+                chosen, evaluations = self.first_improving_move(self.current_state, mode, max_samples, 0)
+            if chosen is None:
+                reason = 'local_optimum'
                 break
-            chosen = random.choice(improving)
-            self.current_state = chosen
+            self.current_state.apply_move(chosen, keep_order=(mode == 'full'))
             new_penalty = self.current_state.count_penalty()
             self.values.append(new_penalty)
-            if new_penalty < self.best_state.count_penalty():
-                self.best_state = self.current_state.copy()
+            # setiap move yang diterima memperbaiki penalti, jadi current selalu yang terbaik; disalin sekali
+            # di akhir, bukan setiap langkah
+            if stopping.record(new_penalty, evaluations):
+                break
+        if self.current_state.count_penalty() < self.best_state.count_penalty():
+            self.best_state = self.current_state.copy()
+        self.stop_reason = stopping.finish(reason)
         
         fig = self.plot_progress("Stochastic Hill Climbing Progress", save=save_plot)
         return self.current_state, fig
     
-    def hcRandomRestart(self, max_restarts=10, max_iterations_per_restart=100, save_plot=True):
+    def hcRandomRestart(self, max_restarts=10, max_iterations_per_restart=100, save_plot=True, workers=1,
+                        stopping=None):
+        # dengan workers > 1 paling banyak `workers` restart berjalan bersamaan, masing-masing dengan salinan
+        # policy dan deadline dari awal run. Hasilnya digabung ke policy utama lewat merge, dan restart baru
+        # hanya dikirim selama policy utama belum menyuruh berhenti
+        stopping = (stopping or StoppingPolicy()).start(self.problem)
         self.restarts = 0
         best_overall_state = None
         best_overall_penalty = float('inf')
         self.iterations_per_restart = []
         per_restart_final_penalties = []
 
-        for _ in range(max_restarts):
-            self.restarts += 1
-            temp_hc = HillClimbing(self.problem_file, 'steepest')
-            _final_state, _ = temp_hc.hcSteepest(max_iterations=max_iterations_per_restart, save_plot=False)
-            self.iterations_per_restart.append(temp_hc.iterations)
+        if workers == 1:
+            for _ in range(max_restarts):
+                if self.restarts and stopping.should_stop():
+                    break
+                self.restarts += 1
+                temp_hc = HillClimbing(self.problem, 'steepest', vectorized=self.vectorized)
+                _final_state, _ = temp_hc.hcSteepest(max_iterations=max_iterations_per_restart, save_plot=False,
+                                                     stopping=stopping)
+                self.iterations_per_restart.append(temp_hc.iterations)
 
-            final_penalty = _final_state.count_penalty()
-            print(f"Final Penalty: {final_penalty}")
-            per_restart_final_penalties.append(final_penalty)
-            if final_penalty < best_overall_penalty:
-                best_overall_penalty = final_penalty
-                best_overall_state = _final_state.copy()
+                final_penalty = _final_state.count_penalty()
+                print(f"Final Penalty: {final_penalty}")
+                per_restart_final_penalties.append(final_penalty)
+                if final_penalty < best_overall_penalty:
+                    best_overall_penalty = final_penalty
+                    best_overall_state = _final_state.copy()
+        else:
+            seeds = spawn_seeds(max_restarts)
+            restart_results = [None] * max_restarts
+            deadline = None
+            if stopping.time_limit is not None:
+                deadline = time.time() + stopping.time_limit - stopping.elapsed()
+            queue = list(enumerate(seeds))
+            queue.reverse()
+            with make_executor(workers) as executor:
+                running = {}
+                while queue or running:
+                    while queue and len(running) < workers and not stopping.should_stop():
+                        idx, seed = queue.pop()
+                        future = executor.submit(_restart_worker, self.problem, seed, max_iterations_per_restart,
+                                                 self.vectorized, stopping, deadline)
+                        running[future] = idx
+                    if not running:
+                        break
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        idx = running.pop(future)
+                        outcome = future.result()
+                        if outcome is None:
+                            continue
+                        _final_state, iterations, evaluations = outcome
+                        self.restarts += 1
+                        final_penalty = _final_state.count_penalty()
+                        restart_results[idx] = (final_penalty, iterations)
+                        print(f"Final Penalty: {final_penalty}")
+                        if final_penalty < best_overall_penalty:
+                            best_overall_penalty = final_penalty
+                            best_overall_state = _final_state
+                        stopping.merge(final_penalty, evaluations, iterations)
+            restart_results = [result for result in restart_results if result is not None]
+            if best_overall_state is None:
+                # batas waktu habis sebelum satu restart pun mulai
+                best_overall_state = self.current_state.copy()
+            per_restart_final_penalties = [penalty for penalty, _ in restart_results]
+            self.iterations_per_restart = [iterations for _, iterations in restart_results]
 
         self.current_state = best_overall_state
         self.best_state = best_overall_state.copy()
-        self.values = per_restart_final_penalties
+        self._start_values()
+        for final_penalty in per_restart_final_penalties:
+            self.values.append(final_penalty)
         self.iterations = sum(self.iterations_per_restart)
+        self.stop_reason = stopping.finish('max_restarts')
 
         print(f"Total Restarts: {self.restarts}, Iterations per Restart: {self.iterations_per_restart}")
 
@@ -164,43 +373,22 @@ class HillClimbing:
     
     
     def plot_progress(self, title="Hill Climbing Progress", save=True):
-        fig, ax = plt.subplots(figsize=(10, 6))
-        x_vals = list(range(1, len(self.values) + 1))
-        if self.algorithm_type == 'random_restart':
-            ax.plot(x_vals, self.values, linestyle='-', marker='o', color='b', linewidth=1.5, markersize=4)
-            ax.set_title('Random Restart - Final Penalty per Restart')
-            ax.set_xlabel('Restart')
-            ax.set_ylabel('Final Penalty')
-        else:
-            ax.plot(x_vals, self.values, linestyle='-', marker='o', color='b', linewidth=1.5, markersize=4)
-            ax.set_title(f'{title} - Objective Function')
-            ax.set_xlabel('Iteration')
-            ax.set_ylabel('Penalty Value')
-        ax.grid(True, linestyle='--', alpha=0.6)
-        plt.tight_layout()
-        if save:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            parent_dir = os.path.dirname(script_dir)
-            project_root = os.path.dirname(parent_dir)
-            plot_dir = os.path.join(project_root, 'result', 'plot')
-            if not os.path.exists(plot_dir):
-                os.makedirs(plot_dir)
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            filename = f"hill_{self.algorithm_type}_{timestamp}.png"
-            filepath = os.path.join(plot_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            print(f"Plot saved to: {filepath}")
-        return fig
+        # tanpa save tidak ada plot yang dibuat, jadi matplotlib tidak perlu di-import
+        if not save:
+            return None
+        return plot_hill_climbing_progress(self.values, self.algorithm_type, title, save=save)
     
     def printhasil(self, state, title):
+        HillClimbing.print_state(state, title, self.iterations, self.sideways_moves, self.restarts)
+
+    @staticmethod
+    def print_state(state, title, iterations, sideways_moves, restarts):
         print(f"\n--- {title} ---")
         print(f"Total Kontainer Digunakan: {len(state.list_container)}")
         print(f"Nilai Objektif (Penalti): {state.count_penalty()}")
-        print(f"Jumlah Iterasi: {self.iterations}")
-        if hasattr(self, 'sideways_moves'):
-            print(f"Jumlah Sideways Moves: {self.sideways_moves}")
-        if hasattr(self, 'restarts'):
-            print(f"Jumlah Restarts: {self.restarts}")
+        print(f"Jumlah Iterasi: {iterations}")
+        print(f"Jumlah Sideways Moves: {sideways_moves}")
+        print(f"Jumlah Restarts: {restarts}")
         print("-" * 20)
         for i, container in enumerate(state.list_container):
             total_size = container.total_size()
@@ -213,99 +401,115 @@ class HillClimbing:
     
     
     @staticmethod
-    def plott(results, algorithm_type, save=True):
-        fig, ax = plt.subplots(figsize=(10, 6))
-        colors = ['b', 'g', 'r']
-        
-        for i, result in enumerate(results):
-            if algorithm_type == 'random_restart':                
-                num_runs = len(results)
-                bar_width = 0.8 / num_runs
-                
-                iterations_per_restart = result['iterations_per_restart']
-                num_restarts = len(iterations_per_restart)
-                
-                base_x = list(range(1, num_restarts + 1))
-                bar_positions = [x + i * bar_width for x in base_x]
-                
-                ax.bar(bar_positions, iterations_per_restart, width=bar_width, color=colors[i % len(colors)], label=f"Run {i+1}")
-                
-                ax.set_xticks([r + bar_width * (num_runs - 1) / 2 for r in base_x])
-                ax.set_xticklabels(base_x)
-            else:
-                values = result['values']
-                x_vals = list(range(1, len(values) + 1))
-                ax.plot(x_vals, values, linestyle='-', marker='o', color=colors[i % len(colors)], linewidth=1.5, markersize=4, label=f"Run {i+1}")
+    def plott(results, algorithm_type, save=True, plot_dir=None):
+        return plot_hill_climbing_runs(results, algorithm_type, save=save, plot_dir=plot_dir)
 
-        if algorithm_type == 'random_restart':
-            ax.set_title(f'Random Restart - Iterations Until Stop per Restart')
-            ax.set_xlabel('Restart Number (Grouped by Run)')
-            ax.set_ylabel('Iterations Until Stop')
-        else:
-            ax.set_title(f'{algorithm_type.replace("_", " ").title()} - Objective Function (3 Runs)')
-            ax.set_xlabel('Iteration')
-            ax.set_ylabel('Penalty Value')
+    @staticmethod
+    def _run_experiment(problem, algorithm_type, experiment_num, profile=False, stopping=None):
+        start_time = time.time()
+        with profiling(profile) as profiler:
+            if algorithm_type == "tabu":
+                from algorithm.tabu_search import TabuSearch
+                hc_run = TabuSearch(problem)
+            else:
+                hc_run = HillClimbing(problem, algorithm_type)
+            hc_run.printhasil(hc_run.original_state, f"Initial State - Eksperimen {experiment_num}")
+            if algorithm_type == "steepest": final_state, _ = hc_run.hcSteepest(save_plot=False, stopping=stopping)
+            elif algorithm_type == "sideways": final_state, _ = hc_run.hcSideways(save_plot=False, stopping=stopping)
+            elif algorithm_type == "stochastic": final_state, _ = hc_run.hcStochastic(save_plot=False, stopping=stopping)
+            elif algorithm_type == "random_restart": final_state, _ = hc_run.hcRandomRestart(save_plot=False, stopping=stopping)
+            elif algorithm_type == "tabu": final_state, _ = hc_run.hcTabu(save_plot=False, stopping=stopping)
         
-        ax.legend()
-        ax.grid(True, linestyle='--', alpha=0.6)
-        plt.tight_layout()
+        duration = time.time() - start_time
+        
+        result = {
+            'experiment_num': experiment_num,
+            'algorithm_type': algorithm_type,
+            'initial_state': hc_run.original_state.copy(),
+            'final_state': final_state,
+            'duration': duration,
+            'iterations': hc_run.iterations,
+            'stop_reason': hc_run.stop_reason,
+            'values': hc_run.values.copy(),
+            'iterations_per_restart': hc_run.iterations_per_restart.copy() if hasattr(hc_run, 'iterations_per_restart') else []
+        }
+        if hasattr(hc_run, 'sideways_moves'): result['sideways_moves'] = hc_run.sideways_moves
+        if hasattr(hc_run, 'restarts'): result['restarts'] = hc_run.restarts
+        if profiler is not None: result['profile'] = profiler.report()
+        
+        hc_run.printhasil(final_state, f"Final State - Eksperimen {experiment_num}")
+        print(f"Durasi: {duration:.4f} detik")
+        return result
 
-        if save:
-            plot_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'result', 'plot')
-            if not os.path.exists(plot_dir):
-                os.makedirs(plot_dir)
-            filename = f"hill_{algorithm_type}.png"
-            filepath = os.path.join(plot_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            print(f"Plot disimpan ke: {filepath}")
-        return fig
+    @staticmethod
+    def print_experiment(result):
+        num = result['experiment_num']
+        HillClimbing.print_state(result['initial_state'], f"Initial State - Eksperimen {num}", 0, 0, 0)
+        HillClimbing.print_state(result['final_state'], f"Final State - Eksperimen {num}", result['iterations'],
+                                 result.get('sideways_moves', 0), result.get('restarts', 0))
+        print(f"Durasi: {result['duration']:.4f} detik")
 
-    def run_hill_climbing_experiments(problem_file, algorithm_type="steepest"):
+    @staticmethod
+    def run_parallel_experiments(problem, algorithms, num_runs=3, workers=None, profile=False, stopping=None):
+        problem = get_problem(problem)
+        jobs = [(algorithm, i + 1) for algorithm in algorithms for i in range(num_runs)]
+        seeds = spawn_seeds(len(jobs))
+        all_results = {algorithm: [None] * num_runs for algorithm in algorithms}
+        with make_executor(workers) as executor:
+            futures = {
+                executor.submit(_quiet_experiment_worker, problem, algorithm, num, seed, profile, stopping): (algorithm, num)
+                for (algorithm, num), seed in zip(jobs, seeds)
+            }
+            for future in as_completed(futures):
+                algorithm, num = futures[future]
+                all_results[algorithm][num - 1] = future.result()
+                print(f"Selesai: {algorithm} - Eksperimen {num}")
+        return all_results
+
+    def run_hill_climbing_experiments(problem_file, algorithm_type="steepest", workers=1, results=None, profile=False,
+                                      stopping=None):
         print(f"=== HILL CLIMBING EXPERIMENTS - {algorithm_type.upper()} ===")
-        experiments_results = []
-        final_state = None 
+        problem = get_problem(problem_file)
 
         num_runs = 3
-        for i in range(num_runs):
-            print(f"\n--- Running Experiment {i+1}/{num_runs} for {algorithm_type.upper()} ---")
-            start_time = time.time()
-            hc_run = HillClimbing(problem_file, algorithm_type)
-            hc_run.printhasil(hc_run.original_state, f"Initial State - Eksperimen {i+1}")
-            if algorithm_type == "steepest": final_state, _ = hc_run.hcSteepest(save_plot=False)
-            elif algorithm_type == "sideways": final_state, _ = hc_run.hcSideways(save_plot=False)
-            elif algorithm_type == "stochastic": final_state, _ = hc_run.hcStochastic(save_plot=False)
-            elif algorithm_type == "random_restart": final_state, _ = hc_run.hcRandomRestart(save_plot=False)
-            
-            duration = time.time() - start_time
-            
-            result = {
-                'experiment_num': i + 1,
-                'algorithm_type': algorithm_type,
-                'initial_state': hc_run.original_state.copy(),
-                'final_state': final_state,
-                'duration': duration,
-                'iterations': hc_run.iterations,
-                'values': hc_run.values.copy(),
-                'iterations_per_restart': hc_run.iterations_per_restart.copy() if hasattr(hc_run, 'iterations_per_restart') else []
-            }
-            if hasattr(hc_run, 'sideways_moves'): result['sideways_moves'] = hc_run.sideways_moves
-            if hasattr(hc_run, 'restarts'): result['restarts'] = hc_run.restarts
-            
-            experiments_results.append(result)
-            hc_run.printhasil(final_state, f"Final State - Eksperimen {i+1}")
-            print(f"Durasi: {duration:.4f} detik")
+        if results is None and workers != 1:
+            results = HillClimbing.run_parallel_experiments(problem, [algorithm_type], num_runs, workers, profile,
+                                                            stopping)[algorithm_type]
+
+        if results is None:
+            experiments_results = []
+            for i in range(num_runs):
+                print(f"\n--- Running Experiment {i+1}/{num_runs} for {algorithm_type.upper()} ---")
+                experiments_results.append(HillClimbing._run_experiment(problem, algorithm_type, i + 1, profile, stopping))
+        else:
+            experiments_results = results
+            for result in experiments_results:
+                print(f"\n--- Experiment {result['experiment_num']}/{num_runs} for {algorithm_type.upper()} ---")
+                HillClimbing.print_experiment(result)
+
+        with profiling(profile) as profiler:
+            HillClimbing.plott(experiments_results, algorithm_type, save=True)
 
-        HillClimbing.plott(experiments_results, algorithm_type, save=True)
+        if profiler is not None:
+            # plot dibuat sekali untuk semua eksperimen
+            shared = profiler.report()
+            for result in experiments_results:
+                result['profile'] = merge_reports(result.get('profile'), shared)
+                print_profile(result['profile'], f"Profil Eksperimen {result['experiment_num']}")
         return experiments_results
     
     @staticmethod
-    def compare_algorithms(problem_file):
-        algorithms = ["steepest", "sideways", "stochastic", "random_restart"]
+    def compare_algorithms(problem_file, workers=1):
+        algorithms = ["steepest", "sideways", "stochastic", "random_restart", "tabu"]
         all_results = {}
         print("=== COMPARING ALL HILL CLIMBING ALGORITHMS ===")
+        parallel_results = None
+        if workers != 1:
+            parallel_results = HillClimbing.run_parallel_experiments(problem_file, algorithms, 3, workers)
         for algorithm in algorithms:
             print(f"\nRunning {algorithm}...")
-            results = HillClimbing.run_hill_climbing_experiments(problem_file, algorithm)
+            results = HillClimbing.run_hill_climbing_experiments(
+                problem_file, algorithm, results=parallel_results[algorithm] if parallel_results else None)
             all_results[algorithm] = results
         print(f"\n{'='*100}")
         print("COMPARISON SUMMARY")
@@ -2,13 +2,20 @@ import random
 import math
 import time
 import os
-import matplotlib.pyplot as plt
 from copy import deepcopy
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from state import State, Container
-from input_manager import load_problem
+from state import State, Container, Move
+from compact_state import CompactState
+from input_manager import get_problem
+from parallel import make_executor, spawn_seeds
+from recorder import make_recorder
+from reporting import plot_sa_experiments
+from profiler import profiling, merge_reports, print_profile
+from stopping import StoppingPolicy
+from construction import initial_state as construct_initial_state
+from algorithm.cooling import CoolingSchedule, make_schedule, estimate_initial_temperature
 
 
 def cool_down(current_temp: float, cooling_rate: float) -> float:
@@ -35,36 +42,71 @@ def generate_neighbor(state: State) -> State:
         item_to_move = random.choice(container_from.item_list)
         
         try:
-            container_from.item_list.remove(item_to_move)
+            container_from.remove_item(item_to_move)
         except ValueError:
             return new_state
         
         if random.random() < 0.12:
             target_container = Container(new_state.list_container[0].capacity)
-            new_state.list_container.append(target_container)
+            new_state.add_container(target_container)
         else:
             target_container = random.choice(new_state.list_container)
         
-        target_container.item_list.append(item_to_move)
-        new_state.list_container = [c for c in new_state.list_container if c.item_list]
+        target_container.add_item(item_to_move)
+        new_state.remove_empty_containers()
     
     else:  # swap
         c1, c2 = random.sample(non_empty, 2)
         i1 = random.choice(c1.item_list)
         i2 = random.choice(c2.item_list)
         
-        try:
-            idx1 = c1.item_list.index(i1)
-            idx2 = c2.item_list.index(i2)
-            c1.item_list[idx1], c2.item_list[idx2] = c2.item_list[idx2], c1.item_list[idx1]
-        except ValueError:
-            pass
+        c1.remove_item(i1)
+        c2.remove_item(i2)
+        c1.add_item(i2)
+        c2.add_item(i1)
     
     return new_state
 
 
-def simulated_annealing(file_path: str, initial_temp: float, cooling_rate: float):
-    """Menjalankan algoritma Simulated Annealing"""
+def random_move(state: State):
+    """Memilih move acak dengan distribusi yang sama seperti generate_neighbor tanpa menyalin state.
+    Delta dihitung dari dua kontainer yang terlibat saja, dengan asumsi state tidak punya kontainer kosong.
+    Mengembalikan None jika move tidak mengubah state (barang dipindah ke kontainernya sendiri)"""
+    containers = state.list_container
+    if not containers:
+        return None
+    
+    if len(containers) >= 2 and random.choice(['move', 'swap']) == 'swap':
+        source, target = random.sample(range(len(containers)), 2)
+        item = random.choice(containers[source].item_list)
+        partner = random.choice(containers[target].item_list)
+        return Move(state.swap_delta(source, target, item, partner), item, source, target, partner)
+    
+    source = random.randrange(len(containers))
+    item = random.choice(containers[source].item_list)
+    target = None if random.random() < 0.12 else random.randrange(len(containers))
+    if target == source:
+        return None
+    return Move(state.relocate_delta(source, target, item, empty_cost=0), item, source, target, None)
+
+
+def simulated_annealing(file_path, initial_temp: float, cooling_rate: float,
+                        history_policy: str = 'full', history_options: dict = None, profile=False,
+                        stopping: StoppingPolicy = None, initial: str = 'random', schedule=None,
+                        min_temp: float = 1e-3, reheat_after: int = None, reheat_ratio: float = 0.5,
+                        max_reheats: int = 3, steps: int = 10000):
+    """Menjalankan algoritma Simulated Annealing, profile=True/'memory' menambahkan result['profile'] per phase,
+    initial memilih state awal ('random' atau heuristik konstruktif dari construction.py).
+    initial_temp=None mengestimasi T0 dari sampel delta generate_neighbor. schedule: None (geometric dengan
+    cooling_rate), nama di cooling.SCHEDULES atau objek CoolingSchedule; steps adalah panjang run (iterasi) untuk
+    schedule bernama selain geometric, yang mencapai min_temp tepat di akhir. Jika penalti terbaik tidak membaik
+    selama reheat_after iterasi, suhu dinaikkan lagi ke reheat_ratio * T0 (maksimal max_reheats kali).
+    Move diterapkan in place pada current_state (O(1) per iterasi). State terbaik hanya disalin ketika
+    current_state meninggalkannya lewat move yang memburuk, bukan setiap kali best baru ditemukan."""
+    history_options = history_options or {}
+    if not isinstance(schedule, CoolingSchedule):
+        schedule = make_schedule(schedule or 'geometric', cooling_rate, steps)
+    stopping = stopping or StoppingPolicy()
     result = {
         'algorithm': 'Simulated Annealing',
         'initial_score': None,
@@ -72,89 +114,282 @@ def simulated_annealing(file_path: str, initial_temp: float, cooling_rate: float
         'duration': 0.0,
         'iterations': 0,
         'stuck_iterations': 0,
-        'objective_history': [],
-        'temperature_history': [],
-        'acceptance_prob_history': []
+        'stop_reason': None,
+        'initial_temp': None,
+        'schedule': schedule.name,
+        'reheats': 0,
+        'objective_history': make_recorder(history_policy, 'objective', **history_options),
+        'temperature_history': make_recorder(history_policy, 'temperature', **history_options),
+        'acceptance_prob_history': make_recorder(history_policy, 'acceptance', **history_options)
     }
     
-    # Inisialisasi state awal
-    initial_state = State()
-    initial_state.generate_random_state(file_path)
+    with profiling(profile) as profiler:
+        # Inisialisasi state awal
+        problem = get_problem(file_path)
+        initial_state = construct_initial_state(problem, initial)
     
-    current_state = initial_state
-    current_score = current_state.count_penalty()
-    result['initial_score'] = current_score
+        current_state = initial_state
+        current_score = current_state.count_penalty()
+        result['initial_score'] = current_score
+        # random_move mengasumsikan tidak ada kontainer kosong
+        current_state.remove_empty_containers()
+        current_score = current_state.count_penalty()
     
-    best_state = current_state.copy()
-    best_score = current_score
+        # None berarti state terbaik adalah current_state itu sendiri, selain itu snapshot CompactState
+        best_state = None
+        best_score = current_score
     
-    temperature = initial_temp
-    stuck_count = 0
-    iteration = 0
+        if initial_temp is None:
+            initial_temp = estimate_initial_temperature(current_state, generate_neighbor)
+        result['initial_temp'] = initial_temp
+        temperature = initial_temp
+        stuck_count = 0
+        since_best = 0
+        reheats = 0
+        iteration = 0
     
-    print(f"Memulai SA. Skor Awal: {current_score:.2f}, Suhu Awal: {temperature:.2f}")
+        print(f"Memulai SA. Skor Awal: {current_score:.2f}, Suhu Awal: {temperature:.2f}")
     
-    start_time = time.time()
+        start_time = time.time()
+        stopping.start(problem)
+        schedule.start(temperature, iteration, min_temp)
     
-    # Loop utama SA
-    while temperature > 1e-3:
-        iteration += 1
-        
-        # Generate neighbor
-        neighbor_state = generate_neighbor(current_state)
-        neighbor_score = neighbor_state.count_penalty()
-        
-        delta_score = neighbor_score - current_score
-        acceptance_prob = 0.0
-        
-        # Evaluasi penerimaan neighbor
-        if delta_score < 0:
-            # Neighbor lebih baik, terima
-            current_state = neighbor_state
-            current_score = neighbor_score
-            acceptance_prob = 1.0
-            stuck_count = 0
-        else:
-            # Neighbor lebih buruk, terima dengan probabilitas tertentu
-            acceptance_prob = math.exp(-delta_score / temperature)
-            if random.random() < acceptance_prob:
-                current_state = neighbor_state
-                current_score = neighbor_score
+        # Loop utama SA
+        while temperature > min_temp and not schedule.finished(iteration):
+            iteration += 1
+        
+            # Pilih move, delta dihitung sebelum state diubah sehingga move yang ditolak tidak perlu di-undo
+            move = random_move(current_state)
+            delta_score = move.delta if move is not None else 0
+            acceptance_prob = 0.0
+            accepted = True
+        
+            # Evaluasi penerimaan neighbor
+            if delta_score < 0:
+                # Neighbor lebih baik, terima
+                acceptance_prob = 1.0
+            else:
+                # Neighbor lebih buruk, terima dengan probabilitas tertentu
+                acceptance_prob = math.exp(-delta_score / temperature)
+                accepted = random.random() < acceptance_prob
+            if accepted:
+                if move is not None:
+                    if best_state is None and delta_score > 0:
+                        best_state = CompactState.from_state(current_state, problem)
+                    current_state.apply_move(move, keep_order=False)
+                    current_score += delta_score
                 stuck_count = 0
             else:
                 stuck_count += 1
         
-        # Update best state
-        if current_score < best_score:
-            best_state = current_state.copy()
-            best_score = current_score
-        
-        # Simpan history
-        result['objective_history'].append(best_score)
-        result['temperature_history'].append(temperature)
-        result['acceptance_prob_history'].append(acceptance_prob)
-        
-        # Turunkan suhu
-        temperature = cool_down(temperature, cooling_rate)
-        
-        # Print progress
-        if iteration % 1000 == 0:
-            print(f"Iter: {iteration:5d} | Suhu: {temperature:8.4f} | "
-                  f"Current: {current_score:7.2f} | Best: {best_score:7.2f} | "
-                  f"AccProb: {acceptance_prob:.4f}")
-    
+            # Update best state
+            if current_score < best_score:
+                best_state = None
+                best_score = current_score
+                since_best = 0
+            else:
+                since_best += 1
+        
+            # Simpan history
+            result['objective_history'].append(best_score)
+            result['temperature_history'].append(temperature)
+            result['acceptance_prob_history'].append(acceptance_prob)
+        
+            # Turunkan suhu, atau reheat jika pencarian mandek
+            temperature = schedule.next(temperature, iteration, delta_score, accepted)
+            if reheat_after and since_best >= reheat_after and reheats < max_reheats:
+                reheats += 1
+                since_best = 0
+                temperature = max(temperature, initial_temp * reheat_ratio)
+                schedule.start(temperature, iteration, min_temp)
+            if stopping.record(best_score, 1):
+                break
+        
+            # Print progress
+            if iteration % 1000 == 0:
+                print(f"Iter: {iteration:5d} | Suhu: {temperature:8.4f} | "
+                      f"Current: {current_score:7.2f} | Best: {best_score:7.2f} | "
+                      f"AccProb: {acceptance_prob:.4f}")
+
+    if profiler is not None:
+        result['profile'] = profiler.report()
+
+    best_state = current_state if best_state is None else best_state.to_state()
     result['stuck_iterations'] = stuck_count
     result['duration'] = time.time() - start_time
     result['final_score'] = best_score
     result['iterations'] = iteration
+    result['reheats'] = reheats
+    result['stop_reason'] = stopping.finish('temperature' if temperature <= min_temp else 'schedule')
     
-    print(f"\nPencarian Selesai. Suhu terlalu rendah.")
+    if result['stop_reason'] == 'temperature':
+        print(f"\nPencarian Selesai. Suhu terlalu rendah.")
+    else:
+        print(f"\nPencarian Selesai ({result['stop_reason']}).")
     print(f"Skor terbaik: {best_score:.2f} setelah {iteration} iterasi.")
     print(f"Durasi: {result['duration']:.4f} detik")
     
     return best_state, result
 
 
+def _run_replica(state: State, score: float, temperature: float, steps: int, seed: int):
+    """Menjalankan satu replika pada suhu tetap selama beberapa langkah"""
+    random.seed(seed)
+    best_state = state.copy()
+    best_score = score
+    accepted = 0
+    
+    for _ in range(steps):
+        neighbor_state = generate_neighbor(state)
+        neighbor_score = neighbor_state.count_penalty()
+        delta_score = neighbor_score - score
+        if delta_score < 0 or random.random() < math.exp(-delta_score / temperature):
+            state = neighbor_state
+            score = neighbor_score
+            accepted += 1
+            if score < best_score:
+                best_state = state.copy()
+                best_score = score
+    
+    return state, score, best_state, best_score, accepted
+
+
+def temperature_ladder(t_min: float, t_max: float, num_replicas: int) -> list:
+    """Membuat tangga suhu geometrik dari t_min sampai t_max"""
+    if num_replicas == 1:
+        return [t_min]
+    ratio = (t_max / t_min) ** (1 / (num_replicas - 1))
+    return [t_min * ratio ** k for k in range(num_replicas)]
+
+
+def adapt_ladder(temperatures: list, swap_rates: list, target_rate: float, gain: float = 0.5) -> list:
+    """Menggeser suhu antar replika agar swap rate mendekati target, ujung tangga tetap"""
+    gaps = [math.log(temperatures[k + 1] / temperatures[k]) for k in range(len(temperatures) - 1)]
+    # swap rate rendah berarti jarak suhu terlalu lebar, jadi dipersempit
+    gaps = [gap * math.exp(gain * (rate - target_rate)) for gap, rate in zip(gaps, swap_rates)]
+    scale = math.log(temperatures[-1] / temperatures[0]) / sum(gaps)
+    ladder = [temperatures[0]]
+    for gap in gaps:
+        ladder.append(ladder[-1] * math.exp(gap * scale))
+    ladder[-1] = temperatures[-1]
+    return ladder
+
+
+def parallel_tempering(file_path, num_replicas: int = 4, t_min: float = 1.0, t_max: float = 1000.0,
+                       temperatures: list = None, iterations: int = 10000, swap_interval: int = 100,
+                       adaptive: bool = False, target_swap_rate: float = 0.25, workers: int = None,
+                       stopping: StoppingPolicy = None):
+    """Menjalankan Parallel Tempering (replica exchange) dengan beberapa rantai SA bersuhu tetap"""
+    problem = get_problem(file_path)
+    stopping = stopping or StoppingPolicy()
+    temperatures = list(temperatures) if temperatures else temperature_ladder(t_min, t_max, num_replicas)
+    num_replicas = len(temperatures)
+    
+    result = {
+        'algorithm': 'Parallel Tempering',
+        'initial_score': None,
+        'final_score': None,
+        'duration': 0.0,
+        'iterations': 0,
+        'temperatures': [],
+        'acceptance_rates': [],
+        'swap_rates': [],
+        'swap_rate': 0.0,
+        'stop_reason': None,
+        'objective_history': make_recorder()
+    }
+    
+    states = []
+    for _ in range(num_replicas):
+        state = State()
+        state.generate_random_state(problem)
+        states.append(state)
+    scores = [state.count_penalty() for state in states]
+    
+    best_idx = min(range(num_replicas), key=lambda k: scores[k])
+    best_state = states[best_idx].copy()
+    best_score = scores[best_idx]
+    result['initial_score'] = best_score
+    
+    accepted = [0] * num_replicas
+    swap_attempts = [0] * (num_replicas - 1)
+    swap_accepts = [0] * (num_replicas - 1)
+    epoch_attempts = [0] * (num_replicas - 1)
+    epoch_accepts = [0] * (num_replicas - 1)
+    
+    print(f"Memulai PT. Skor Awal Terbaik: {best_score:.2f}, Replika: {num_replicas}, "
+          f"Suhu: {temperatures[0]:.2f} - {temperatures[-1]:.2f}")
+    
+    start_time = time.time()
+    stopping.start(problem)
+    executor = make_executor(workers) if workers != 1 else None
+    try:
+        done = 0
+        epoch = 0
+        while done < iterations:
+            steps = min(swap_interval, iterations - done)
+            seeds = spawn_seeds(num_replicas)
+            jobs = list(zip(states, scores, temperatures, [steps] * num_replicas, seeds))
+            if executor is None:
+                outcomes = [_run_replica(*job) for job in jobs]
+            else:
+                outcomes = list(executor.map(_run_replica, *zip(*jobs)))
+            
+            for k, (state, score, replica_best, replica_best_score, replica_accepted) in enumerate(outcomes):
+                states[k] = state
+                scores[k] = score
+                accepted[k] += replica_accepted
+                if replica_best_score < best_score:
+                    best_state = replica_best
+                    best_score = replica_best_score
+            done += steps
+            
+            # Tukar state replika bertetangga, pasangan genap/ganjil bergantian
+            for k in range(epoch % 2, num_replicas - 1, 2):
+                swap_attempts[k] += 1
+                epoch_attempts[k] += 1
+                exponent = (1 / temperatures[k] - 1 / temperatures[k + 1]) * (scores[k] - scores[k + 1])
+                if exponent >= 0 or random.random() < math.exp(exponent):
+                    states[k], states[k + 1] = states[k + 1], states[k]
+                    scores[k], scores[k + 1] = scores[k + 1], scores[k]
+                    swap_accepts[k] += 1
+                    epoch_accepts[k] += 1
+            epoch += 1
+            
+            if adaptive and num_replicas > 2 and epoch % 10 == 0:
+                rates = [a / n if n else target_swap_rate for a, n in zip(epoch_accepts, epoch_attempts)]
+                temperatures = adapt_ladder(temperatures, rates, target_swap_rate)
+                epoch_attempts = [0] * (num_replicas - 1)
+                epoch_accepts = [0] * (num_replicas - 1)
+            
+            result['objective_history'].append(best_score)
+            if epoch % 10 == 0:
+                print(f"Iter: {done:7d} | Best: {best_score:7.2f} | "
+                      f"Current: {' '.join(f'{score:.1f}' for score in scores)}")
+            # kriteria berhenti diperiksa per epoch (swap_interval langkah untuk setiap replika)
+            if stopping.record(best_score, steps * num_replicas):
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    result['duration'] = time.time() - start_time
+    result['final_score'] = best_score
+    result['iterations'] = done
+    result['stop_reason'] = stopping.finish('max_iterations')
+    result['temperatures'] = temperatures
+    result['acceptance_rates'] = [a / done if done else 0.0 for a in accepted]
+    result['swap_rates'] = [a / n if n else 0.0 for a, n in zip(swap_accepts, swap_attempts)]
+    result['swap_rate'] = sum(swap_accepts) / sum(swap_attempts) if sum(swap_attempts) else 0.0
+    
+    print(f"\nPencarian Selesai. Skor terbaik: {best_score:.2f} setelah {done} iterasi per replika.")
+    print(f"Acceptance rate per replika: {', '.join(f'{rate:.3f}' for rate in result['acceptance_rates'])}")
+    print(f"Swap rate: {result['swap_rate']:.3f}")
+    print(f"Durasi: {result['duration']:.4f} detik")
+    
+    return best_state, result
+
+
 class SimulatedAnnealing:
     @staticmethod
     def print_solution(state: State, title: str):
@@ -175,19 +410,26 @@ class SimulatedAnnealing:
                 
     
     @staticmethod
-    def run_simulated_annealing_experiments(file_path: str):
-        """Menjalankan multiple experiments SA"""
+    def run_simulated_annealing_experiments(file_path: str, parameters: list = None,
+                                            filename: str = None, show: bool = True, profile=False,
+                                            stopping: StoppingPolicy = None):
+        """Menjalankan multiple experiments SA, parameters berisi pasangan (T0, cooling_rate)"""
+        num_experiments = len(parameters) if parameters else 3
         print("=== MULTIPLE EXPERIMENTS - SIMULATED ANNEALING ===")
-        print("Anda akan menjalankan 3 eksperimen dengan parameter berbeda.\n")
+        print(f"Anda akan menjalankan {num_experiments} eksperimen dengan parameter berbeda.\n")
         
         experiments_results = []
+        problem = get_problem(file_path)
         
-        for i in range(3):
+        for i in range(num_experiments):
             print(f"\n{'='*80}")
-            print(f"EKSPERIMEN {i + 1} dari 3")
+            print(f"EKSPERIMEN {i + 1} dari {num_experiments}")
             print(f"{'='*80}")
             
-            while True:
+            if parameters:
+                T0, cooling_rate = parameters[i]
+            
+            while not parameters:
                 try:
                     T0 = float(input(f"Eksperimen {i + 1} - Masukkan suhu awal (T0): "))
                     if T0 <= 0:
@@ -197,7 +439,7 @@ class SimulatedAnnealing:
                 except ValueError:
                     print("Input tidak valid! Masukkan angka.")
             
-            while True:
+            while not parameters:
                 try:
                     cooling_rate = float(input(f"Eksperimen {i + 1} - Masukkan cooling rate (0-1): "))
                     if not (0 < cooling_rate < 1):
@@ -208,7 +450,7 @@ class SimulatedAnnealing:
                     print("Input tidak valid! Masukkan angka.")
             
             # Jalankan SA
-            final_state, result = simulated_annealing(file_path, T0, cooling_rate)
+            final_state, result = simulated_annealing(problem, T0, cooling_rate, profile=profile, stopping=stopping)
             
             experiment_label = f"Exp{i+1}: T0={T0}, α={cooling_rate}"
             experiments_results.append({
@@ -252,95 +494,41 @@ class SimulatedAnnealing:
         print(f"\n{'='*80}")
         print("VISUALISASI PERBANDINGAN EKSPERIMEN")
         print(f"{'='*80}")
-        SimulatedAnnealing.plot_experiments(experiments_results, file_path)
-        SimulatedAnnealing.save_results(experiments_results, file_path)
+        with profiling(profile) as profiler:
+            SimulatedAnnealing.plot_experiments(experiments_results, file_path, show=show)
+            SimulatedAnnealing.save_results(experiments_results, file_path, filename=filename)
+
+        if profiler is not None:
+            # plot dan penulisan hasil dilakukan sekali untuk semua eksperimen
+            shared = profiler.report()
+            for i, exp in enumerate(experiments_results):
+                exp['result']['profile'] = merge_reports(exp['result']['profile'], shared)
+                print_profile(exp['result']['profile'], f"Profil Eksperimen {i + 1}")
+        return experiments_results
     
     @staticmethod
-    def plot_experiments(experiments_results: list, file_path: str):
+    def plot_experiments(experiments_results: list, file_path: str, show: bool = True, plot_dir: str = None):
         """Plot hasil multiple experiments"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(script_dir)
-        project_root = os.path.dirname(parent_dir)
-        plot_dir = os.path.join(project_root, 'result', 'plot')
-        
-        if not os.path.exists(plot_dir):
-            os.makedirs(plot_dir)
-        
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        
-        # Plot 1: Objective Function
-        plt.figure(figsize=(10, 6))
-        for exp in experiments_results:
-            result = exp['result']
-            plt.plot(range(len(result['objective_history'])), 
-                    result['objective_history'], 
-                    label=exp['label'], 
-                    linewidth=2)
-        
-        plt.title("Perbandingan Nilai Objektif vs Iterasi - Simulated Annealing", 
-                 fontsize=14, fontweight="bold")
-        plt.xlabel("Iterasi")
-        plt.ylabel("Nilai Objektif (Penalti)")
-        plt.legend(loc="best")
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        filename_obj = f"sa_objective_{timestamp}.png"
-        filepath_obj = os.path.join(plot_dir, filename_obj)
-        plt.savefig(filepath_obj, dpi=300, bbox_inches="tight")
-        print(f"\nPlot Nilai Objektif disimpan ke: {filepath_obj}")
-        plt.show()
-        plt.close()
-        
-        
-        # Plot 2: Acceptance Probability (Moving Average)
-        plt.figure(figsize=(10, 6))
-        window_size = 50
-        
-        for exp in experiments_results:
-            result = exp['result']
-            acceptance_history = result['acceptance_prob_history']
-            
-            # Calculate moving average
-            smoothed = []
-            for i in range(len(acceptance_history)):
-                start_idx = max(0, i - window_size + 1)
-                window = acceptance_history[start_idx:i+1]
-                smoothed.append(sum(window) / len(window))
-            
-            plt.plot(range(len(smoothed)), smoothed, label=exp['label'], linewidth=2)
-        
-        plt.title("Perbandingan e^(ΔE/T) vs Iterasi - Simulated Annealing", 
-                 fontsize=14, fontweight="bold")
-        plt.xlabel("Iterasi")
-        plt.ylabel("e^(ΔE/T) (Moving Average)")
-        plt.legend(loc="best")
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        filename_acc = f"sa_acceptance_{timestamp}.png"
-        filepath_acc = os.path.join(plot_dir, filename_acc)
-        plt.savefig(filepath_acc, dpi=300, bbox_inches="tight")
-        print(f"Plot Acceptance Probability disimpan ke: {filepath_acc}")
-        plt.show()
-        plt.close()
+        plot_sa_experiments(experiments_results, show=show, plot_dir=plot_dir)
     
     @staticmethod
-    def save_results(experiments_results: list, file_path: str):
+    def save_results(experiments_results: list, file_path: str, filename: str = None, result_dir: str = None):
         """Menyimpan hasil eksperimen ke file"""
         print(f"\n{'='*80}")
         print("SIMPAN HASIL EKSPERIMEN SIMULATED ANNEALING")
         print(f"{'='*80}")
-        filename = input("Masukkan nama file untuk menyimpan hasil (tanpa .txt): ").strip()
+        if filename is None:
+            filename = input("Masukkan nama file untuk menyimpan hasil (tanpa .txt): ").strip()
         
         if not filename:
             print("Nama file tidak valid. Hasil tidak disimpan.")
             return
         
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(script_dir)
-        project_root = os.path.dirname(parent_dir)
-        result_dir = os.path.join(project_root, 'result')
+        if result_dir is None:
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            parent_dir = os.path.dirname(script_dir)
+            project_root = os.path.dirname(parent_dir)
+            result_dir = os.path.join(project_root, 'result')
         filepath = os.path.join(result_dir, f"{filename}.txt")
         
         if not os.path.exists(result_dir):
@@ -0,0 +1,87 @@
+import math
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithm.hill_climbing import HillClimbing
+from stopping import StoppingPolicy
+
+
+class TabuSearch(HillClimbing):
+    # Memakai neighborhood relokasi + swap dari HillClimbing. Barang yang baru dipindah
+    # menjadi tabu selama `tenure` iterasi kecuali move tersebut menghasilkan penalti terbaik
+    # baru (aspiration). State yang sudah pernah dikunjungi (canonical_hash) tidak dikunjungi lagi.
+    def __init__(self, problem_file, tenure=None, history_policy='full', history_options=None, initial='random'):
+        super().__init__(problem_file, "tabu", history_policy=history_policy, history_options=history_options,
+                         initial=initial)
+        self.tenure = tenure or max(5, int(math.sqrt(len(self.problem))))
+        self.aspirations = 0
+        self.revisits_avoided = 0
+
+    def hcTabu(self, max_iterations=1000, max_stall=100, save_plot=True, stopping=None):
+        stopping = (stopping or StoppingPolicy()).start(self.problem)
+        reason = 'max_iterations'
+        self.iterations = 0
+        self.aspirations = 0
+        self.revisits_avoided = 0
+        state = self.current_state
+        state.remove_empty_containers()
+        self.best_state = state.copy()
+        best_penalty = state.count_penalty()
+        self._start_values(best_penalty)
+        print(f"Initial Penalty: {best_penalty}")
+
+        current_hash = state.canonical_hash()
+        visited = {current_hash}
+        tabu_until = {}
+        stall = 0
+
+        while self.iterations < max_iterations and stall < max_stall:
+            self.iterations += 1
+            current_penalty = state.count_penalty()
+            evaluations = self.neighborhood_size(state)
+            chosen = None
+            chosen_hash = None
+            chosen_aspiration = False
+            for move in self.neighborhood(state):
+                if chosen is not None and move.delta >= chosen.delta:
+                    continue
+                aspiration = current_penalty + move.delta < best_penalty
+                tabu = (tabu_until.get(move.item['id'], 0) > self.iterations or
+                        (move.partner is not None and tabu_until.get(move.partner['id'], 0) > self.iterations))
+                if tabu and not aspiration:
+                    continue
+                new_hash = state.move_hash(move, current_hash)
+                if new_hash in visited:
+                    self.revisits_avoided += 1
+                    continue
+                chosen, chosen_hash, chosen_aspiration = move, new_hash, tabu
+
+            if chosen is None:
+                reason = 'no_admissible_move'
+                break
+            if chosen_aspiration:
+                self.aspirations += 1
+            state.apply_move(chosen)
+            current_hash = chosen_hash
+            visited.add(current_hash)
+            tabu_until[chosen.item['id']] = self.iterations + self.tenure
+            if chosen.partner is not None:
+                tabu_until[chosen.partner['id']] = self.iterations + self.tenure
+
+            penalty = state.count_penalty()
+            self.values.append(penalty)
+            if penalty < best_penalty:
+                best_penalty = penalty
+                self.best_state = state.copy()
+                stall = 0
+            else:
+                stall += 1
+            if stopping.record(best_penalty, evaluations):
+                break
+
+        if stall >= max_stall:
+            reason = 'max_stall'
+        self.stop_reason = stopping.finish(reason)
+        print(f"Aspirations: {self.aspirations}, Revisits Avoided: {self.revisits_avoided}")
+        fig = self.plot_progress("Tabu Search Progress", save=save_plot)
+        return self.best_state, fig
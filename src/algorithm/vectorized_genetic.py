@@ -0,0 +1,110 @@
+import os
+import sys
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from state import State, Container, CONTAINER_COST, OVERFLOW_WEIGHT, SLACK_WEIGHT
+
+# Populasi disimpan sebagai matriks (individu x barang) berisi nomor kontainer. Nomor kontainer
+# tiap baris selalu dipadatkan menjadi 0..k-1, jadi lebar matriks kontainer tidak pernah melebihi n.
+# Kontainer kosong tidak bisa direpresentasikan (dan memang hanya menambah penalti).
+NEW_CONTAINER_RATE = 0.1
+
+
+def random_population(rng, population_size, num_items):
+    # sama seperti State.generate_random_state: jumlah kontainer acak, tiap barang ke kontainer acak
+    num_containers = rng.integers(1, num_items + 1, size=(population_size, 1))
+    population = (rng.random((population_size, num_items)) * num_containers).astype(np.int32)
+    return compact(population)
+
+
+def compact(population):
+    rows = np.arange(population.shape[0])[:, None]
+    used = np.zeros((population.shape[0], int(population.max()) + 1), dtype=bool)
+    used[rows, population] = True
+    ranks = np.cumsum(used, axis=1, dtype=np.int32) - 1
+    return ranks[rows, population]
+
+
+def container_loads(population, sizes):
+    # satu bincount untuk seluruh populasi: baris i memakai label i*width .. i*width+width-1
+    count, num_items = population.shape
+    width = int(population.max()) + 1
+    labels = (population + (np.arange(count, dtype=np.int64) * width)[:, None]).ravel()
+    loads = np.bincount(labels, weights=np.broadcast_to(sizes, population.shape).ravel(), minlength=count * width)
+    used = np.bincount(labels, minlength=count * width) > 0
+    return loads.reshape(count, width), used.reshape(count, width)
+
+
+def evaluate(population, sizes, capacity):
+    # penalti semua individu sekaligus, sama dengan State.count_penalty()
+    loads, used = container_loads(population, sizes)
+    penalty = np.where(loads > capacity, (loads - capacity) * OVERFLOW_WEIGHT, (capacity - loads) * SLACK_WEIGHT)
+    penalties = np.where(used, penalty + CONTAINER_COST, 0.0).sum(axis=1)
+    return penalties, loads
+
+
+def tournament(rng, penalties, count, k=3):
+    contenders = rng.integers(0, len(penalties), size=(count, k))
+    winners = np.argmin(penalties[contenders], axis=1)
+    return contenders[np.arange(count), winners]
+
+
+def crossover(rng, parents1, parents2, loads1, capacity, crossover_rate):
+    # versi array dari group crossover: anak mewarisi kontainer utuh parent1 (peluang sebanding
+    # dengan tingkat keterisian, kontainer overflow tidak diwarisi), barang lainnya mengikuti
+    # pengelompokan parent2 dengan label yang digeser supaya tidak bertabrakan
+    width = loads1.shape[1]
+    fill = np.where(loads1 <= capacity, loads1 / capacity, 0.0)
+    keep = rng.random(loads1.shape) < fill
+    rows = np.arange(len(parents1))[:, None]
+    inherit = keep[rows, parents1]
+    inherit[rng.random(len(parents1)) >= crossover_rate] = True
+    return compact(np.where(inherit, parents1, parents2 + width))
+
+
+def mutate(rng, population, mutation_rate):
+    count, num_items = population.shape
+    rows = np.flatnonzero(rng.random(count) < mutation_rate)
+    if not len(rows) or num_items < 2:
+        return population
+    num_containers = population[rows].max(axis=1) + 1
+    move = (rng.integers(1, 3, size=len(rows)) == 1) | (num_containers < 2)
+    first = rng.integers(0, num_items, size=len(rows))
+    second = rng.integers(0, num_items, size=len(rows))
+
+    # relokasi: barang ke kontainer acak yang sudah ada atau (peluang 0.1) ke kontainer baru
+    target = (rng.random(len(rows)) * num_containers).astype(np.int32)
+    target = np.where(rng.random(len(rows)) < NEW_CONTAINER_RATE, num_containers, target)
+    # swap: tukar kontainer dua barang
+    swapped = population[rows, second]
+    population[rows[~move], second[~move]] = population[rows[~move], first[~move]]
+    population[rows, first] = np.where(move, target, swapped)
+    return compact(population)
+
+
+def next_generation(rng, population, penalties, loads, best_row, capacity, mutation_rate, crossover_rate):
+    count = len(population)
+    parents1 = tournament(rng, penalties, count - 1)
+    parents2 = tournament(rng, penalties, count - 1)
+    children = crossover(rng, population[parents1], population[parents2], loads[parents1], capacity, crossover_rate)
+    children = mutate(rng, children, mutation_rate)
+    # elitisme: individu terbaik sejauh ini selalu ada di baris 0
+    return np.concatenate([best_row[None, :], children])
+
+
+def to_state(row, problem):
+    state = State()
+    containers = [Container(problem.capacity) for _ in range(int(row.max()) + 1)]
+    for item, label in zip(problem.items, row.tolist()):
+        containers[label].add_item(item)
+    state.list_container = containers
+    return state
+
+
+def from_state(state, problem):
+    row = np.empty(len(problem), dtype=np.int32)
+    index = problem.index
+    for label, container in enumerate(c for c in state.list_container if c.item_list):
+        for item in container.item_list:
+            row[index[item['id']]] = label
+    return row
@@ -0,0 +1,74 @@
+import os
+import sys
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from state import Move, CONTAINER_COST, OVERFLOW_WEIGHT, SLACK_WEIGHT
+
+# Batas jumlah elemen matriks delta (relokasi maupun swap) yang dihitung sekaligus (per blok baris)
+BLOCK_ELEMENTS = 1 << 20
+
+
+def load_penalty(load, capacity):
+    return np.where(load > capacity, (load - capacity) * OVERFLOW_WEIGHT, (capacity - load) * SLACK_WEIGHT)
+
+
+def best_move(state):
+    """Mencari move relokasi/swap terbaik dengan operasi array NumPy"""
+    containers = state.list_container
+    items = [item for container in containers for item in container.item_list]
+    if not items:
+        return None
+
+    m = len(containers)
+    loads = np.fromiter((c.load for c in containers), dtype=np.float64, count=m)
+    capacity = np.fromiter((c.capacity for c in containers), dtype=np.float64, count=m)
+    counts = np.fromiter((len(c.item_list) for c in containers), dtype=np.int64, count=m)
+    sizes = np.fromiter((item['ukuran'] for item in items), dtype=np.float64, count=len(items))
+    source = np.repeat(np.arange(m), counts)
+
+    base = load_penalty(loads, capacity)
+    removal = CONTAINER_COST + load_penalty(0.0, capacity)
+    empty = counts == 0
+    empty_cost = removal[empty].sum()
+
+    src_load = loads[source]
+    src_cap = capacity[source]
+    src_term = load_penalty(src_load - sizes, src_cap) - base[source]
+    src_term -= np.where(counts[source] == 1, removal[source], 0.0)
+    src_term -= empty_cost
+    refill = np.where(empty, removal, 0.0) - base
+    best = None
+    best_delta = np.inf
+
+    # kolom 0..m-1: relokasi ke kontainer j, kolom m: kontainer baru
+    block = max(1, BLOCK_ELEMENTS // (m + 1))
+    for start in range(0, len(items), block):
+        rows = slice(start, start + block)
+        count = len(sizes[rows])
+        relocate = np.empty((count, m + 1))
+        relocate[:, :m] = load_penalty(loads[None, :] + sizes[rows, None], capacity[None, :]) + refill[None, :]
+        relocate[:, m] = CONTAINER_COST + load_penalty(sizes[rows], src_cap[rows])
+        relocate += src_term[rows, None]
+        relocate[np.arange(count), source[rows]] = np.inf
+        flat = int(np.argmin(relocate))
+        if relocate.flat[flat] < best_delta:
+            best_delta = relocate.flat[flat]
+            r, j = divmod(flat, m + 1)
+            i = start + r
+            best = Move(float(best_delta), items[i], int(source[i]), None if j == m else j, None)
+
+    base_source = base[source]
+    block = max(1, BLOCK_ELEMENTS // len(items))
+    for start in range(0, len(items), block):
+        rows = slice(start, start + block)
+        diff = sizes[None, :] - sizes[rows, None]
+        swap = (load_penalty(src_load[rows, None] + diff, src_cap[rows, None]) - base_source[rows, None]
+                + load_penalty(src_load[None, :] - diff, src_cap[None, :]) - base_source[None, :])
+        swap[source[rows, None] >= source[None, :]] = np.inf
+        flat = int(np.argmin(swap))
+        if swap.flat[flat] < best_delta:
+            best_delta = swap.flat[flat]
+            r, k = divmod(flat, len(items))
+            i = start + r
+            best = Move(float(best_delta), items[i], int(source[i]), int(source[k]), items[k])
+    return best
@@ -0,0 +1,348 @@
+import argparse
+import contextlib
+import glob
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Benchmark tidak pernah membuka jendela plot
+os.environ.setdefault('MPLBACKEND', 'Agg')
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from input_manager import get_problem, DATA_DIR, PROJECT_ROOT
+from generator import generate_problem
+from state import State
+from construction import CONSTRUCTORS
+from algorithm.hill_climbing import HillClimbing
+from algorithm.tabu_search import TabuSearch
+from algorithm.simulated_annealing import simulated_annealing, generate_neighbor, random_move
+from algorithm.genetic_algorithm import GeneticAlgorithm
+
+BENCHMARK_DIR = os.path.join(PROJECT_ROOT, 'result', 'benchmark')
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, 'latest.json')
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+
+ALGORITHMS = ('hc_steepest', 'hc_sideways', 'hc_stochastic', 'hc_random_restart', 'tabu', 'sa', 'ga')
+MICROS = ('state_copy', 'count_penalty', 'generate_successors', 'generate_neighbor', 'random_move', 'crossover',
+          'repair', 'construction')
+
+SETTINGS = {
+    'max_iterations': 1000,
+    'max_sideways': 10,
+    'max_restarts': 5,
+    'iterations_per_restart': 100,
+    'max_stall': 100,
+    't0': 1000.0,
+    'cooling_rate': 0.99,
+    'population': 30,
+    'generations': 50,
+    'mutation_rate': 0.1,
+    'crossover_rate': 0.8,
+    'micro_calls': 1000,
+    'successor_calls': 3,
+}
+QUICK_SETTINGS = dict(SETTINGS, max_iterations=100, max_restarts=3, iterations_per_restart=30, max_stall=30,
+                      cooling_rate=0.95, population=10, generations=10, micro_calls=200, successor_calls=1)
+GENERATED_SIZES = (100, 200)
+QUICK_GENERATED_SIZES = (100,)
+# generate_successors menyalin state untuk setiap tetangga (O(n^2) salinan), hanya dijalankan di instance kecil
+MAX_SUCCESSOR_ITEMS = 200
+
+
+def load_instances(problems, sizes, seed):
+    if not problems:
+        problems = sorted(glob.glob(os.path.join(DATA_DIR, 'problem*.json')))
+    instances = [(problem.name, problem) for problem in map(get_problem, problems)]
+    for size in sizes:
+        instances.append((f'generated_{size}', generate_problem('uniform', size, seed + size)))
+    return instances
+
+
+def run_algorithm(name, problem, settings):
+    # mengembalikan (penalti akhir, jumlah iterasi)
+    if name.startswith('hc_'):
+        hc = HillClimbing(problem, name[3:])
+        if name == 'hc_steepest':
+            final_state, _ = hc.hcSteepest(max_iterations=settings['max_iterations'], save_plot=False)
+        elif name == 'hc_sideways':
+            final_state, _ = hc.hcSideways(max_sideways=settings['max_sideways'],
+                                           max_iterations=settings['max_iterations'], save_plot=False)
+        elif name == 'hc_stochastic':
+            final_state, _ = hc.hcStochastic(max_iterations=settings['max_iterations'], save_plot=False)
+        else:
+            final_state, _ = hc.hcRandomRestart(max_restarts=settings['max_restarts'],
+                                                max_iterations_per_restart=settings['iterations_per_restart'],
+                                                save_plot=False)
+        return final_state.count_penalty(), hc.iterations
+    if name == 'tabu':
+        ts = TabuSearch(problem)
+        final_state, _ = ts.hcTabu(max_iterations=settings['max_iterations'], max_stall=settings['max_stall'],
+                                   save_plot=False)
+        return final_state.count_penalty(), ts.iterations
+    if name == 'sa':
+        final_state, result = simulated_annealing(problem, settings['t0'], settings['cooling_rate'])
+        return final_state.count_penalty(), result['iterations']
+    ga = GeneticAlgorithm(problem, settings['population'], settings['mutation_rate'],
+                          settings['crossover_rate'], settings['generations'])
+    _, final_state, _, _ = ga.run()
+    return final_state.count_penalty(), settings['generations']
+
+
+def _unrepaired_child(parent1, parent2):
+    # potongan dua parent seperti GeneticAlgorithm.crossover, sebelum repair
+    child = State()
+    cut1 = random.randint(0, len(parent1.list_container))
+    cut2 = random.randint(0, len(parent2.list_container))
+    child.list_container = ([c.copy() for c in parent1.list_container[:cut1]] +
+                            [c.copy() for c in parent2.list_container[cut2:]])
+    return child
+
+
+def prepare_micro(name, problem, settings):
+    # persiapan tidak ikut diukur; mengembalikan (fungsi yang diukur, jumlah pemanggilan)
+    calls = settings['micro_calls']
+    state = State()
+    state.generate_random_state(problem)
+    other = State()
+    other.generate_random_state(problem)
+
+    if name == 'state_copy':
+        def run():
+            for _ in range(calls):
+                state.copy()
+    elif name == 'count_penalty':
+        def run():
+            for _ in range(calls):
+                state._penalty = None  # paksa hitung ulang, bukan nilai memo
+                state.count_penalty()
+    elif name == 'generate_successors':
+        calls = settings['successor_calls']
+        hc = HillClimbing(problem)
+
+        def run():
+            for _ in range(calls):
+                hc.generate_successors(state)
+    elif name == 'generate_neighbor':
+        def run():
+            for _ in range(calls):
+                generate_neighbor(state)
+    elif name == 'random_move':
+        # move in place SA: pilih move lalu terapkan, seperti iterasi yang selalu menerima
+        state.remove_empty_containers()
+
+        def run():
+            for _ in range(calls):
+                move = random_move(state)
+                if move is not None:
+                    state.apply_move(move, keep_order=False)
+    elif name == 'construction':
+        # satu pemanggilan = keempat heuristik konstruktif
+        calls = max(1, calls // 10)
+
+        def run():
+            for _ in range(calls):
+                for construct in CONSTRUCTORS.values():
+                    construct(problem)
+    else:
+        ga = GeneticAlgorithm(problem, 2, 0.0, 1.0, 1)
+        if name == 'crossover':
+            def run():
+                for _ in range(calls):
+                    ga.crossover(state, other)
+        else:
+            children = [_unrepaired_child(state, other) for _ in range(calls)]
+
+            def run():
+                for child in children:
+                    ga.repair(child)
+    return run, calls
+
+
+def measure(run, seed, repeat):
+    # waktu diukur tanpa tracemalloc; peak memory dari satu run tambahan yang di-trace
+    times = []
+    outcome = None
+    for _ in range(repeat):
+        random.seed(seed)
+        start = time.perf_counter()
+        outcome = run()
+        times.append(time.perf_counter() - start)
+    random.seed(seed)
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return outcome, times, peak
+
+
+def _record(kind, benchmark, instance_name, problem, seed, times, peak, iterations, quality):
+    wall_time = statistics.median(times)
+    return {
+        'name': f'{kind}/{benchmark}/{instance_name}',
+        'kind': kind,
+        'benchmark': benchmark,
+        'instance': instance_name,
+        'items': len(problem),
+        'seed': seed,
+        'repeat': len(times),
+        'wall_time': wall_time,
+        'wall_time_min': min(times),
+        'iterations': iterations,
+        'iterations_per_second': iterations / wall_time if wall_time > 0 else None,
+        'peak_memory_bytes': peak,
+        'quality': quality,
+    }
+
+
+def run_benchmarks(options):
+    settings = QUICK_SETTINGS if options['quick'] else SETTINGS
+    sizes = options['sizes']
+    if sizes is None:
+        sizes = QUICK_GENERATED_SIZES if options['quick'] else GENERATED_SIZES
+    seed = options['seed']
+    records = []
+
+    def selected(name):
+        return not options['only'] or any(pattern in name for pattern in options['only'])
+
+    for instance_name, problem in load_instances(options['problems'], sizes, seed):
+        for algorithm in ALGORITHMS:
+            if not selected(f'algorithm/{algorithm}/{instance_name}'):
+                continue
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                (quality, iterations), times, peak = measure(
+                    lambda: run_algorithm(algorithm, problem, settings), seed, options['repeat'])
+            records.append(_record('algorithm', algorithm, instance_name, problem, seed, times, peak, iterations, quality))
+            _print_record(records[-1])
+
+        for micro in MICROS:
+            if not selected(f'micro/{micro}/{instance_name}'):
+                continue
+            if micro == 'generate_successors' and len(problem) > MAX_SUCCESSOR_ITEMS:
+                continue
+            random.seed(seed)
+            run, calls = prepare_micro(micro, problem, settings)
+            _, times, peak = measure(run, seed, options['repeat'])
+            records.append(_record('micro', micro, instance_name, problem, seed, times, peak, calls, None))
+            _print_record(records[-1])
+    return records
+
+
+def _print_record(record):
+    quality = '' if record['quality'] is None else f" quality={record['quality']}"
+    print(f"{record['name']:<50} {record['wall_time']:10.4f}s {record['iterations_per_second'] or 0:12.1f} it/s "
+          f"peak={record['peak_memory_bytes'] / 1024:10.1f} KiB{quality}")
+
+
+def compare(records, baseline, tolerance):
+    # status 'slower'/'faster' jika rasio waktu melewati batas toleransi relatif
+    previous = {record['name']: record for record in baseline.get('results', [])}
+    comparison = []
+    for record in records:
+        base = previous.get(record['name'])
+        if base is None or not base['wall_time']:
+            continue
+        time_ratio = record['wall_time'] / base['wall_time']
+        if time_ratio > 1 + tolerance:
+            status = 'slower'
+        elif time_ratio < 1 - tolerance:
+            status = 'faster'
+        else:
+            status = 'same'
+        entry = {
+            'name': record['name'],
+            'status': status,
+            'time_ratio': time_ratio,
+            'memory_ratio': (record['peak_memory_bytes'] / base['peak_memory_bytes']
+                             if base['peak_memory_bytes'] else None),
+            'baseline_quality': base['quality'],
+            'quality': record['quality'],
+        }
+        comparison.append(entry)
+    return comparison
+
+
+def print_comparison(comparison):
+    if not comparison:
+        print("\nTidak ada benchmark yang cocok dengan baseline.")
+        return
+    print(f"\n{'='*80}")
+    print("PERBANDINGAN DENGAN BASELINE")
+    print(f"{'='*80}")
+    for entry in comparison:
+        memory = '-' if entry['memory_ratio'] is None else f"{entry['memory_ratio']:.2f}x"
+        quality = ''
+        if entry['quality'] != entry['baseline_quality']:
+            quality = f" quality {entry['baseline_quality']} -> {entry['quality']}"
+        print(f"{entry['name']:<50} {entry['status']:<7} waktu {entry['time_ratio']:.2f}x memori {memory}{quality}")
+    for status in ('faster', 'same', 'slower'):
+        print(f"{status}: {sum(1 for entry in comparison if entry['status'] == status)}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark algoritma local search dan operasi dasarnya")
+    parser.add_argument('--problem', dest='problems', action='append', default=[],
+                        help="nama problem di data/ atau path .json (default: semua data/problem*.json)")
+    parser.add_argument('--sizes', type=int, nargs='*',
+                        help="ukuran instance acak yang dibangkitkan (default: 100 200, --quick: 100)")
+    parser.add_argument('--only', action='append', default=[],
+                        help="hanya jalankan benchmark yang namanya memuat teks ini, boleh berulang")
+    parser.add_argument('--repeat', type=int, default=3, help="jumlah pengulangan pengukuran waktu (median)")
+    parser.add_argument('--seed', type=int, default=12345)
+    parser.add_argument('--quick', action='store_true', help="parameter kecil untuk pengecekan cepat")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="file JSON hasil benchmark")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="file JSON baseline pembanding")
+    parser.add_argument('--save-baseline', action='store_true', help="simpan hasil run ini sebagai baseline")
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help="selisih waktu relatif yang masih dianggap sama (default 0.10)")
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help="exit code 1 jika ada benchmark yang lebih lambat dari baseline")
+    return parser
+
+
+def main(argv=None):
+    options = vars(build_parser().parse_args(argv))
+    records = run_benchmarks(options)
+    report = {
+        'meta': {
+            'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': options['seed'],
+            'repeat': options['repeat'],
+            'quick': options['quick'],
+        },
+        'results': records,
+    }
+
+    comparison = []
+    if os.path.exists(options['baseline']) and not options['save_baseline']:
+        with open(options['baseline'], 'r', encoding='utf-8') as file:
+            comparison = compare(records, json.load(file), options['tolerance'])
+        report['baseline'] = options['baseline']
+        report['comparison'] = comparison
+        print_comparison(comparison)
+
+    paths = [options['output']]
+    if options['save_baseline']:
+        paths.append(options['baseline'])
+    for path in paths:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"Hasil benchmark disimpan ke: {path}")
+
+    if options['fail_on_regression'] and any(entry['status'] == 'slower' for entry in comparison):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
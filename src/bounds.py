@@ -0,0 +1,133 @@
+import math
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from itertools import accumulate
+
+from input_manager import get_problem
+from state import CONTAINER_COST, OVERFLOW_WEIGHT, SLACK_WEIGHT
+
+# lower_bound = max(l1, l2, l3), jumlah kontainer minimum untuk packing tanpa overflow. optimal_penalty
+# adalah lower bound count_penalty untuk semua packing (termasuk yang overflow dengan kontainer lebih
+# sedikit), None jika ada barang yang lebih besar dari kapasitas (optimalitas tidak bisa dibuktikan).
+Bounds = namedtuple('Bounds', ['l1', 'l2', 'l3', 'lower_bound', 'optimal_penalty'])
+
+_cache = weakref.WeakKeyDictionary()
+
+
+def lower_bound_l1(sizes, capacity):
+    return math.ceil(sum(sizes) / capacity) if sizes else 0
+
+
+def lower_bound_l2(sizes, capacity):
+    # Martello-Toth L2: untuk setiap K <= C/2, barang > C-K butuh kontainer sendiri, barang di (C/2, C-K]
+    # juga, dan barang di [K, C/2] hanya bisa mengisi sisa kontainer barang (C/2, C-K] atau kontainer baru
+    if not sizes:
+        return 0
+    ordered = sorted(sizes)
+    prefix = [0] + list(accumulate(ordered))
+    n = len(ordered)
+    half = bisect_right(ordered, capacity // 2)  # indeks barang pertama > C/2
+    best = 0
+    for k in {0, *ordered[:half]}:
+        big = bisect_right(ordered, capacity - k)  # barang > C-K mulai dari indeks ini
+        j1 = n - big
+        j2 = max(0, big - half)
+        j2_size = prefix[max(big, half)] - prefix[half]
+        small = bisect_left(ordered, k)
+        j3_size = prefix[half] - prefix[small]
+        free = j2 * capacity - j2_size
+        extra = max(0, -(-(j3_size - free) // capacity))
+        best = max(best, j1 + j2 + extra)
+    return best
+
+
+def lower_bound_l3(sizes, capacity):
+    # L3 versi sederhana dari reduction procedure Martello-Toth: barang j dimasukkan ke kontainer tetap
+    # bersama barang terbesar k yang masih muat jika (a) tidak ada barang lain yang muat, (b) s_j + s_k = C,
+    # atau (c) tidak ada dua barang lain yang muat bersama j. Sisa barang dihitung dengan L2.
+    ordered = sorted(sizes)
+    n = len(ordered)
+    # union-find: indeks barang tersedia terdekat ke kiri (prev) dan ke kanan (next)
+    prev = list(range(n + 1))
+    nxt = list(range(n + 1))
+
+    def find(parent, i):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def remove(i):
+        prev[i + 1] = i
+        nxt[i] = i + 1
+
+    def largest_at_most(i, excluded):
+        if i < 0:
+            return -1
+        found = find(prev, i + 1) - 1
+        if found == excluded:
+            found = find(prev, found) - 1
+        return found
+
+    def smallest_from(i, excluded):
+        found = find(nxt, i)
+        if found == excluded:
+            found = find(nxt, found + 1)
+        return found if found < n else -1
+
+    fixed = 0
+    for j in range(n - 1, -1, -1):
+        if find(prev, j + 1) - 1 != j:
+            continue
+        slack = capacity - ordered[j]
+        k = largest_at_most(bisect_right(ordered, slack) - 1, j) if slack >= 0 else -1
+        if k < 0:
+            fixed += 1
+            remove(j)
+            continue
+        a = smallest_from(0, j)
+        b = smallest_from(a + 1, j)
+        if ordered[j] + ordered[k] == capacity or b < 0 or ordered[a] + ordered[b] > slack:
+            fixed += 1
+            remove(j)
+            remove(k)
+    remaining = [ordered[i] for i in range(n) if find(prev, i + 1) - 1 == i]
+    return fixed + lower_bound_l2(remaining, capacity)
+
+
+def optimal_penalty(lower_bound, total_size, capacity):
+    # penalti = m * (CONTAINER_COST + SLACK_WEIGHT * C) - SLACK_WEIGHT * total + (OVERFLOW_WEIGHT + SLACK_WEIGHT)
+    # * overflow. Dengan m < lower_bound kontainer pasti ada overflow, minimal max(total - m * C, 1) karena
+    # ukuran barang bilangan bulat, sehingga packing yang sedikit overflow bisa lebih murah dari packing
+    # tanpa overflow dengan lower_bound kontainer. Diambil minimum untuk semua m <= lower_bound
+    # (m > lower_bound selalu lebih mahal dari m = lower_bound tanpa overflow).
+    per_container = CONTAINER_COST + SLACK_WEIGHT * capacity
+    best = lower_bound * per_container - SLACK_WEIGHT * total_size
+    for m in range(1, lower_bound):
+        overflow = max(total_size - m * capacity, 1)
+        best = min(best, m * per_container - SLACK_WEIGHT * total_size + (OVERFLOW_WEIGHT + SLACK_WEIGHT) * overflow)
+    return best
+
+
+def problem_bounds(problem):
+    problem = get_problem(problem)
+    bounds = _cache.get(problem)
+    if bounds is None:
+        sizes = list(problem.sizes)
+        l1 = lower_bound_l1(sizes, problem.capacity)
+        l2 = lower_bound_l2(sizes, problem.capacity)
+        l3 = lower_bound_l3(sizes, problem.capacity)
+        lower_bound = max(l1, l2, l3)
+        best = None
+        if problem.max_size <= problem.capacity:
+            best = optimal_penalty(lower_bound, problem.total_size, problem.capacity)
+        bounds = _cache[problem] = Bounds(l1, l2, l3, lower_bound, best)
+    return bounds
+
+
+def is_proven_optimal(state, problem):
+    bounds = problem_bounds(problem)
+    return bounds.optimal_penalty is not None and state.count_penalty() <= bounds.optimal_penalty
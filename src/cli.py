@@ -0,0 +1,354 @@
+import argparse
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import as_completed
+
+# Tanpa TTY/GUI: matplotlib wajib memakai backend non-interaktif
+os.environ.setdefault('MPLBACKEND', 'Agg')
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from input_manager import get_problem, PROJECT_ROOT
+from parallel import make_executor
+from recorder import POLICIES
+from profiler import profiling
+from stopping import StoppingPolicy
+from bounds import problem_bounds
+from construction import INITIAL_STATES
+
+HILL_CLIMBING = ('steepest', 'sideways', 'stochastic', 'random_restart')
+ALGORITHMS = HILL_CLIMBING + ('tabu', 'sa', 'pt', 'ga', 'ga_islands')
+
+DEFAULTS = {
+    'problems': [],
+    'runs': 3,
+    'workers': 1,
+    'seed': None,
+    'output': os.path.join(PROJECT_ROOT, 'result', 'batch'),
+    'verbose': False,
+    'history_policy': 'full',
+    'history_capacity': 10000,
+    'history_dir': None,
+    'profile': False,
+    'initial': 'random',
+    'time_limit': None,
+    'max_evaluations': None,
+    'stall_limit': None,
+    'target_penalty': None,
+    'max_iterations': 1000,
+    'max_sideways': 10,
+    'max_restarts': 10,
+    'iterations_per_restart': 100,
+    'stochastic_mode': 'full',
+    'max_samples': 1000,
+    'vectorized': False,
+    'tabu_tenure': None,
+    'max_stall': 100,
+    't0': 1000.0,
+    'cooling_rate': 0.99,
+    'schedule': 'geometric',
+    'auto_t0': False,
+    'sa_steps': 10000,
+    'reheat_after': None,
+    'replicas': 4,
+    't_min': 1.0,
+    't_max': 1000.0,
+    'pt_iterations': 10000,
+    'swap_interval': 100,
+    'adaptive': False,
+    'population': 50,
+    'generations': 100,
+    'mutation_rate': 0.1,
+    'crossover_rate': 0.8,
+    'crossover_type': 'cut',
+    'islands': 4,
+    'migration_interval': 10,
+    'migration_size': 2,
+    'topology': 'ring',
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Batch runner local search bin packing (tanpa prompt interaktif)")
+    parser.add_argument('--config', help="file JSON berisi argumen (nama key = nama opsi dengan '_')")
+    parser.add_argument('--algorithm', choices=ALGORITHMS)
+    parser.add_argument('--problem', dest='problems', action='append',
+                        help="nama problem di data/ (tanpa .json) atau path file .json, boleh berulang")
+    parser.add_argument('--runs', type=int, help="jumlah run per problem")
+    parser.add_argument('--workers', type=int, help="jumlah proses paralel (0 = semua core)")
+    parser.add_argument('--seed', type=int, help="seed dasar agar batch reproducible")
+    parser.add_argument('--output', help="folder output hasil")
+    parser.add_argument('--verbose', action='store_true', default=None, help="tampilkan log tiap algoritma")
+    parser.add_argument('--history-policy', choices=POLICIES, help="cara menyimpan riwayat nilai objektif")
+    parser.add_argument('--history-capacity', type=int, help="jumlah titik riwayat maksimum (stride/reservoir/minmax)")
+    parser.add_argument('--history-dir', help="folder file riwayat untuk policy mmap")
+    parser.add_argument('--profile', action='store_const', const=True, help="catat waktu dan jumlah panggilan per phase")
+    parser.add_argument('--profile-memory', dest='profile', action='store_const', const='memory',
+                        help="seperti --profile, ditambah peak memory per phase (tracemalloc, lebih lambat)")
+    parser.add_argument('--initial', choices=INITIAL_STATES,
+                        help="state awal: random atau heuristik konstruktif (warm start, kecuali pt)")
+
+    stop = parser.add_argument_group('kriteria berhenti (berlaku untuk semua algoritma)')
+    stop.add_argument('--time-limit', type=float, help="batas waktu wall-clock per run (detik)")
+    stop.add_argument('--max-evaluations', type=int, help="batas jumlah evaluasi penalti/tetangga per run")
+    stop.add_argument('--stall-limit', type=int, help="berhenti setelah sekian iterasi/generasi tanpa perbaikan")
+    stop.add_argument('--target-penalty', type=float, help="berhenti begitu penalti terbaik <= nilai ini")
+
+    hc = parser.add_argument_group('hill climbing')
+    hc.add_argument('--max-iterations', type=int)
+    hc.add_argument('--max-sideways', type=int)
+    hc.add_argument('--max-restarts', type=int)
+    hc.add_argument('--iterations-per-restart', type=int)
+    hc.add_argument('--stochastic-mode', choices=('full', 'first', 'sampled'),
+                    help="full (acak di antara semua move yang memperbaiki), first (telusuri neighborhood dalam "
+                         "urutan acak) atau sampled (move acak), dua terakhir menerima move pertama yang memperbaiki")
+    hc.add_argument('--max-samples', type=int,
+                    help="batas move yang dievaluasi per langkah stochastic sebelum dianggap local optimum "
+                         "(0: seluruh neighborhood, hanya untuk mode first)")
+    hc.add_argument('--vectorized', action='store_true', default=None,
+                    help="pakai mode NumPy (steepest, sideways dan ga)")
+    hc.add_argument('--tabu-tenure', type=int, help="lama barang menjadi tabu (default: max(5, sqrt(n)))")
+    hc.add_argument('--max-stall', type=int, help="tabu berhenti setelah sekian iterasi tanpa perbaikan")
+
+    sa = parser.add_argument_group('simulated annealing / parallel tempering')
+    sa.add_argument('--t0', type=float)
+    sa.add_argument('--cooling-rate', type=float, help="laju pendinginan schedule geometric")
+    sa.add_argument('--schedule', choices=('geometric', 'linear', 'logarithmic', 'lundy_mees', 'adaptive'),
+                    help="cooling schedule SA (default geometric)")
+    sa.add_argument('--auto-t0', action='store_true', default=None,
+                    help="estimasi T0 dari sampel tetangga state awal (mengabaikan --t0)")
+    sa.add_argument('--sa-steps', type=int, help="panjang schedule selain geometric, dalam iterasi")
+    sa.add_argument('--reheat-after', type=int, help="reheat setelah sekian iterasi tanpa perbaikan")
+    sa.add_argument('--replicas', type=int)
+    sa.add_argument('--t-min', type=float)
+    sa.add_argument('--t-max', type=float)
+    sa.add_argument('--pt-iterations', type=int)
+    sa.add_argument('--swap-interval', type=int)
+    sa.add_argument('--adaptive', action='store_true', default=None)
+
+    ga = parser.add_argument_group('genetic algorithm')
+    ga.add_argument('--population', type=int)
+    ga.add_argument('--generations', type=int)
+    ga.add_argument('--mutation-rate', type=float)
+    ga.add_argument('--crossover-rate', type=float)
+    ga.add_argument('--crossover-type', choices=('cut', 'group'),
+                    help="cut (potong daftar kontainer) atau group (warisi kontainer utuh)")
+    ga.add_argument('--islands', type=int)
+    ga.add_argument('--migration-interval', type=int)
+    ga.add_argument('--migration-size', type=int)
+    ga.add_argument('--topology', choices=('ring', 'fully_connected', 'random'))
+    return parser
+
+
+def parse_args(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    options = dict(DEFAULTS)
+    if args.config:
+        with open(args.config, 'r') as file:
+            config = json.load(file)
+        if 'problem' in config:
+            config.setdefault('problems', [])
+            config['problems'] = list(config['problems']) + [config.pop('problem')]
+        unknown = set(config) - set(DEFAULTS) - {'algorithm'}
+        if unknown:
+            parser.error(f"key tidak dikenal di config: {', '.join(sorted(unknown))}")
+        options.update(config)
+    options.update({key: value for key, value in vars(args).items() if value is not None and key != 'config'})
+    if options.get('algorithm') not in ALGORITHMS:
+        parser.error("--algorithm wajib diisi (lewat argumen atau config)")
+    if not options['problems']:
+        parser.error("minimal satu --problem wajib diisi")
+    return options
+
+
+def run_job(job):
+    random.seed(job['seed'])
+    with profiling(job['options']['profile']) as profiler:
+        if job['verbose']:
+            record = _run_job(job)
+        else:
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                record = _run_job(job)
+    if profiler is not None:
+        record['profile'] = profiler.report()
+    return record
+
+
+def _run_job(job):
+    from algorithm.hill_climbing import HillClimbing
+    from algorithm.tabu_search import TabuSearch
+    from algorithm.simulated_annealing import simulated_annealing, parallel_tempering
+    from algorithm.genetic_algorithm import GeneticAlgorithm
+
+    options = job['options']
+    algorithm = job['algorithm']
+    problem = get_problem(job['problem'])
+    start_time = time.time()
+    extra = {}
+    history_policy = options['history_policy']
+    history_options = {'capacity': options['history_capacity']}
+    if history_policy == 'mmap':
+        history_options = {'directory': options['history_dir']}
+    stopping = StoppingPolicy(time_limit=options['time_limit'], max_evaluations=options['max_evaluations'],
+                              stall_limit=options['stall_limit'], target_penalty=options['target_penalty'])
+
+    if algorithm in HILL_CLIMBING:
+        hc = HillClimbing(problem, algorithm, vectorized=options['vectorized'],
+                          history_policy=history_policy, history_options=history_options,
+                          initial=options['initial'])
+        initial_penalty = hc.original_state.count_penalty()
+        if algorithm == 'steepest':
+            final_state, _ = hc.hcSteepest(max_iterations=options['max_iterations'], save_plot=False,
+                                           stopping=stopping)
+        elif algorithm == 'sideways':
+            final_state, _ = hc.hcSideways(max_sideways=options['max_sideways'],
+                                           max_iterations=options['max_iterations'], save_plot=False,
+                                           stopping=stopping)
+        elif algorithm == 'stochastic':
+            final_state, _ = hc.hcStochastic(max_iterations=options['max_iterations'], save_plot=False,
+                                             stopping=stopping, mode=options['stochastic_mode'],
+                                             max_samples=options['max_samples'] or None)
+        else:
+            final_state, _ = hc.hcRandomRestart(max_restarts=options['max_restarts'],
+                                                max_iterations_per_restart=options['iterations_per_restart'],
+                                                save_plot=False, stopping=stopping)
+            extra['restarts'] = hc.restarts
+        iterations = hc.iterations
+    elif algorithm == 'tabu':
+        ts = TabuSearch(problem, tenure=options['tabu_tenure'],
+                        history_policy=history_policy, history_options=history_options,
+                        initial=options['initial'])
+        initial_penalty = ts.original_state.count_penalty()
+        final_state, _ = ts.hcTabu(max_iterations=options['max_iterations'], max_stall=options['max_stall'],
+                                   save_plot=False, stopping=stopping)
+        iterations = ts.iterations
+        extra['aspirations'] = ts.aspirations
+        extra['revisits_avoided'] = ts.revisits_avoided
+    elif algorithm == 'sa':
+        final_state, result = simulated_annealing(problem, None if options['auto_t0'] else options['t0'],
+                                                  options['cooling_rate'],
+                                                  history_policy=history_policy, history_options=history_options,
+                                                  stopping=stopping, initial=options['initial'],
+                                                  schedule=options['schedule'], steps=options['sa_steps'],
+                                                  reheat_after=options['reheat_after'])
+        initial_penalty = result['initial_score']
+        iterations = result['iterations']
+        extra['stuck_iterations'] = result['stuck_iterations']
+        extra['initial_temp'] = result['initial_temp']
+        extra['reheats'] = result['reheats']
+    elif algorithm == 'pt':
+        final_state, result = parallel_tempering(problem, num_replicas=options['replicas'], t_min=options['t_min'],
+                                                 t_max=options['t_max'], iterations=options['pt_iterations'],
+                                                 swap_interval=options['swap_interval'],
+                                                 adaptive=options['adaptive'], workers=1, stopping=stopping)
+        initial_penalty = result['initial_score']
+        iterations = result['iterations']
+        extra['swap_rate'] = result['swap_rate']
+        extra['acceptance_rates'] = result['acceptance_rates']
+    else:
+        ga = GeneticAlgorithm(problem, options['population'], options['mutation_rate'],
+                              options['crossover_rate'], options['generations'],
+                              history_policy=history_policy, history_options=history_options,
+                              crossover_type=options['crossover_type'], vectorized=options['vectorized'],
+                              initial=options['initial'])
+        if algorithm == 'ga':
+            initial_state, final_state, history, _ = ga.run(stopping=stopping)
+        else:
+            initial_state, final_state, history, _ = ga.run_islands(
+                num_islands=options['islands'], migration_interval=options['migration_interval'],
+                migration_size=options['migration_size'], topology=options['topology'], workers=1,
+                stopping=stopping)
+        if 'offspring_reuse' in history:
+            extra['offspring_reuse_rate'] = history['offspring_reuse']['reuse_rate']
+        initial_penalty = initial_state.count_penalty()
+        iterations = stopping.iterations
+
+    record = {
+        'problem': problem.name,
+        'algorithm': algorithm,
+        'run': job['run'],
+        'seed': job['seed'],
+        'initial_penalty': initial_penalty,
+        'final_penalty': final_state.count_penalty(),
+        'containers': len(final_state.list_container),
+        'duration': time.time() - start_time,
+        'iterations': iterations,
+        'evaluations': stopping.evaluations,
+        'stop_reason': stopping.reason,
+        'lower_bound': problem_bounds(problem).lower_bound,
+    }
+    record.update(extra)
+    record['packing'] = [[item['id'] for item in container.item_list] for container in final_state.list_container]
+    return record
+
+
+def summarize(records):
+    groups = {}
+    for record in records:
+        groups.setdefault((record['problem'], record['algorithm']), []).append(record)
+    summary = []
+    for (problem, algorithm), group in groups.items():
+        summary.append({
+            'problem': problem,
+            'algorithm': algorithm,
+            'runs': len(group),
+            'avg_final_penalty': sum(r['final_penalty'] for r in group) / len(group),
+            'best_final_penalty': min(r['final_penalty'] for r in group),
+            'avg_duration': sum(r['duration'] for r in group) / len(group),
+            'avg_iterations': sum(r['iterations'] for r in group) / len(group),
+        })
+    return summary
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    rng = random.Random(options['seed'])
+    jobs = []
+    for problem in options['problems']:
+        get_problem(problem)
+        for run in range(1, options['runs'] + 1):
+            jobs.append({
+                'algorithm': options['algorithm'],
+                'problem': problem,
+                'run': run,
+                'seed': rng.getrandbits(64),
+                'verbose': options['verbose'],
+                'options': options,
+            })
+
+    os.makedirs(options['output'], exist_ok=True)
+    results_path = os.path.join(options['output'], 'results.jsonl')
+    records = []
+    with open(results_path, 'w', encoding='utf-8') as results_file:
+        def collect(record):
+            records.append(record)
+            results_file.write(json.dumps(record) + "\n")
+            results_file.flush()
+            print(f"[{len(records)}/{len(jobs)}] {record['problem']} {record['algorithm']} run={record['run']} "
+                  f"penalty={record['final_penalty']} durasi={record['duration']:.4f}s")
+
+        if options['workers'] == 1:
+            for job in jobs:
+                collect(run_job(job))
+        else:
+            with make_executor(options['workers']) as executor:
+                futures = [executor.submit(run_job, job) for job in jobs]
+                for future in as_completed(futures):
+                    collect(future.result())
+
+    records.sort(key=lambda r: (r['problem'], r['run']))
+    summary = summarize(records)
+    summary_path = os.path.join(options['output'], 'summary.json')
+    with open(summary_path, 'w', encoding='utf-8') as summary_file:
+        json.dump({'options': options, 'summary': summary}, summary_file, indent=2)
+    print(f"Hasil per run disimpan ke: {results_path}")
+    print(f"Ringkasan disimpan ke: {summary_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+from array import array
+from state import State, Container, CONTAINER_COST, load_penalty
+
+
+class CompactState:
+    # Representasi ringkas untuk menyimpan state yang tidak sedang diubah (snapshot terbaik SA, populasi
+    # pulau GA di antara epoch): assignment[i] = indeks bin untuk barang i, loads[b] = total ukuran bin b,
+    # ukuran barang diambil dari Problem yang dipakai bersama. Dua buffer array menggantikan satu list dan
+    # satu objek Container per kontainer, dan copy hanya menyalin buffer tersebut.
+    def __init__(self, problem, assignment=None, loads=None):
+        self.problem = problem
+        self.assignment = assignment if assignment is not None else array('l', [0] * len(problem))
+        self.loads = loads if loads is not None else array('q')
+        self._penalty = None
+
+    @classmethod
+    def from_state(cls, state, problem):
+        index = problem.index
+        assignment = array('l', [-1] * len(problem))
+        loads = array('q', [0] * len(state.list_container))
+        for b, container in enumerate(state.list_container):
+            for item in container.item_list:
+                assignment[index[item['id']]] = b
+            loads[b] = container.load
+        if -1 in assignment:
+            raise ValueError("State tidak memuat semua barang pada problem")
+        compact = cls(problem, assignment, loads)
+        compact._penalty = state._penalty
+        return compact
+
+    def to_state(self):
+        # urutan kontainer dipertahankan, barang di dalam kontainer mengikuti urutan pada problem
+        groups = [[] for _ in range(len(self.loads))]
+        for item, b in zip(self.problem.items, self.assignment):
+            groups[b].append(item)
+        containers = []
+        for items in groups:
+            container = Container(capacity=self.problem.capacity)
+            container.set_items(items)
+            containers.append(container)
+        state = State()
+        state.list_container = containers
+        state._penalty = self._penalty
+        return state
+
+    def copy(self):
+        new_state = CompactState(self.problem, array('l', self.assignment), array('q', self.loads))
+        new_state._penalty = self._penalty
+        return new_state
+
+    def num_bins(self):
+        return len(self.loads)
+
+    def count_penalty(self):
+        if self._penalty is None:
+            capacity = self.problem.capacity
+            self._penalty = sum(load_penalty(load, capacity) for load in self.loads) + len(self.loads) * CONTAINER_COST
+        return self._penalty
@@ -0,0 +1,160 @@
+import random
+from bisect import bisect_left, insort
+
+from input_manager import get_problem
+from residual_tree import ResidualTree
+from state import State, Container
+
+# Heuristik konstruktif untuk state awal (warm start). Setiap heuristik mencari kontainer tujuan
+# dalam O(log m) per barang (segment tree untuk first fit, bisect untuk best/worst fit), lalu State dibangun
+# sekali di akhir.
+HEURISTICS = ('first_fit', 'first_fit_decreasing', 'best_fit_decreasing', 'worst_fit')
+# pilihan state awal untuk HillClimbing, simulated_annealing dan GeneticAlgorithm
+INITIAL_STATES = ('random',) + HEURISTICS
+
+
+class _ResidualIndex:
+    # kontainer yang masih terbuka sebagai pasangan (residual, indeks) terurut, disimpan dalam potongan list
+    # berukuran <= 2 * CHUNK (seperti SortedList) agar insert/hapus tidak menggeser seluruh list. Ukuran dan
+    # waktu bergantung pada jumlah kontainer, bukan kapasitas. best_fit/worst_fit mengembalikan posisi
+    # (potongan, indeks) dari residual terkecil yang masih muat / residual terbesar, None jika tidak ada
+    CHUNK = 512
+
+    def __init__(self):
+        self._chunks = []
+        self._maxes = []
+
+    def put(self, index, residual):
+        entry = (residual, index)
+        chunks, maxes = self._chunks, self._maxes
+        if not chunks:
+            chunks.append([entry])
+            maxes.append(entry)
+            return
+        k = min(bisect_left(maxes, entry), len(maxes) - 1)
+        chunk = chunks[k]
+        insort(chunk, entry)
+        maxes[k] = chunk[-1]
+        if len(chunk) > 2 * self.CHUNK:
+            chunks[k:k + 1] = [chunk[:self.CHUNK], chunk[self.CHUNK:]]
+            maxes[k:k + 1] = [chunk[self.CHUNK - 1], chunk[-1]]
+
+    def take(self, position):
+        # menghapus dan mengembalikan (residual, indeks kontainer)
+        k, i = position
+        chunk = self._chunks[k]
+        entry = chunk.pop(i)
+        if chunk:
+            self._maxes[k] = chunk[-1]
+        else:
+            del self._chunks[k]
+            del self._maxes[k]
+        return entry
+
+    def best_fit(self, size):
+        k = bisect_left(self._maxes, (size,))
+        if k == len(self._maxes):
+            return None
+        return k, bisect_left(self._chunks[k], (size,))
+
+    def worst_fit(self, size):
+        maxes = self._maxes
+        if not maxes or maxes[-1][0] < size:
+            return None
+        return len(maxes) - 1, len(self._chunks[-1]) - 1
+
+
+def _build_state(problem, assignment):
+    state = State()
+    containers = [Container(problem.capacity) for _ in range(max(assignment, default=-1) + 1)]
+    members = [[] for _ in containers]
+    for item, index in zip(problem.items, assignment):
+        members[index].append(item)
+    for container, items in zip(containers, members):
+        container.set_items(items)
+    state.list_container = containers
+    return state
+
+
+def _order(problem, decreasing):
+    if decreasing:
+        return sorted(range(len(problem)), key=problem.sizes.__getitem__, reverse=True)
+    return range(len(problem))
+
+
+def first_fit(problem, order=None):
+    # order: urutan indeks barang yang dimasukkan (default urutan di problem)
+    problem = get_problem(problem)
+    capacity = problem.capacity
+    sizes = problem.sizes
+    assignment = [0] * len(problem)
+    residuals = ResidualTree()
+    for i in (range(len(problem)) if order is None else order):
+        size = sizes[i]
+        index = residuals.first_fit(size)
+        if index < 0:
+            index = residuals.append(capacity)
+        residuals.update(index, residuals.residual(index) - size)
+        assignment[i] = index
+    return _build_state(problem, assignment)
+
+
+def first_fit_decreasing(problem):
+    problem = get_problem(problem)
+    return first_fit(problem, _order(problem, decreasing=True))
+
+
+def _fit_by_residual(problem, decreasing, choose):
+    problem = get_problem(problem)
+    capacity = problem.capacity
+    sizes = problem.sizes
+    assignment = [0] * len(problem)
+    index = _ResidualIndex()
+    count = 0
+    for i in _order(problem, decreasing):
+        size = sizes[i]
+        position = choose(index, size)
+        if position is None:
+            # kontainer baru (barang lebih besar dari kapasitas juga mendapat kontainer sendiri)
+            container, residual = count, capacity
+            count += 1
+        else:
+            residual, container = index.take(position)
+        assignment[i] = container
+        if residual - size >= 0:
+            index.put(container, residual - size)
+    return _build_state(problem, assignment)
+
+
+def best_fit_decreasing(problem):
+    return _fit_by_residual(problem, True, _ResidualIndex.best_fit)
+
+
+def worst_fit(problem):
+    return _fit_by_residual(problem, False, _ResidualIndex.worst_fit)
+
+
+CONSTRUCTORS = {
+    'first_fit': first_fit,
+    'first_fit_decreasing': first_fit_decreasing,
+    'best_fit_decreasing': best_fit_decreasing,
+    'worst_fit': worst_fit,
+}
+
+
+def initial_state(problem, initial='random'):
+    if initial not in INITIAL_STATES:
+        raise ValueError(f"State awal tidak dikenal: {initial}")
+    if initial == 'random':
+        state = State()
+        state.generate_random_state(problem)
+        return state
+    return CONSTRUCTORS[initial](problem)
+
+
+def shuffled_first_fit(problem):
+    # first fit dengan urutan barang acak: state awal yang cukup baik tetapi tetap beragam (populasi GA)
+    problem = get_problem(problem)
+    order = list(range(len(problem)))
+    random.shuffle(order)
+    return first_fit(problem, order)
@@ -0,0 +1,128 @@
+import argparse
+import json
+import math
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from input_manager import Problem, DATA_DIR
+
+FAMILIES = ('uniform', 'triplets', 'heavy_tailed', 'duplicates')
+DEFAULT_CAPACITY = {
+    'uniform': 150,
+    'triplets': 1000,
+    'heavy_tailed': 1000,
+    'duplicates': 1000,
+}
+MIN_ITEMS = 1
+MAX_ITEMS = 1000000
+
+
+def _uniform_sizes(rng, num_items, capacity):
+    # kelas "u" Falkenauer: ukuran seragam di [20, 100] untuk kapasitas 150 (diskalakan untuk kapasitas lain)
+    low = max(1, capacity * 20 // 150)
+    high = max(low, capacity * 100 // 150)
+    return [rng.randint(low, high) for _ in range(num_items)]
+
+
+def _triplet_sizes(rng, num_items, capacity):
+    # kelas "t" Falkenauer: setiap kontainer optimal berisi tepat tiga barang yang jumlahnya = kapasitas
+    sizes = []
+    for _ in range(num_items // 3):
+        first = rng.randint(capacity * 380 // 1000, capacity * 490 // 1000)
+        second = rng.randint(capacity // 4, (capacity - first) // 2)
+        sizes.extend([first, second, capacity - first - second])
+    rng.shuffle(sizes)
+    return sizes
+
+
+def _heavy_tailed_sizes(rng, num_items, capacity, alpha=1.5):
+    # Pareto: kebanyakan barang kecil, sedikit barang hampir sebesar kontainer
+    scale = max(1, capacity // 50)
+    return [min(capacity, math.ceil(scale * rng.paretovariate(alpha))) for _ in range(num_items)]
+
+
+def _duplicate_sizes(rng, num_items, capacity, distinct=10):
+    values = [rng.randint(1, capacity) for _ in range(min(distinct, num_items))]
+    return [rng.choice(values) for _ in range(num_items)]
+
+
+def generate_instance(family, num_items, seed=None, capacity=None):
+    if family not in FAMILIES:
+        raise ValueError(f"Family instance tidak dikenal: {family}")
+    if not MIN_ITEMS <= num_items <= MAX_ITEMS:
+        raise ValueError(f"Jumlah barang harus di antara {MIN_ITEMS} dan {MAX_ITEMS}")
+    if family == 'triplets' and num_items < 3:
+        raise ValueError("Family triplets membutuhkan minimal 3 barang")
+    capacity = capacity or DEFAULT_CAPACITY[family]
+    rng = random.Random(seed)
+
+    if family == 'uniform':
+        sizes = _uniform_sizes(rng, num_items, capacity)
+    elif family == 'triplets':
+        sizes = _triplet_sizes(rng, num_items, capacity)
+    elif family == 'heavy_tailed':
+        sizes = _heavy_tailed_sizes(rng, num_items, capacity)
+    else:
+        sizes = _duplicate_sizes(rng, num_items, capacity)
+
+    width = max(3, len(str(len(sizes))))
+    instance = {
+        'kapasitas_kontainer': capacity,
+        'barang': [{'id': f'BRG{i + 1:0{width}d}', 'ukuran': size} for i, size in enumerate(sizes)],
+    }
+    if family == 'triplets':
+        # jumlah barang dibulatkan ke bawah ke kelipatan 3, optimum diketahui
+        instance['optimal_kontainer'] = len(sizes) // 3
+    return instance
+
+
+def generate_problem(family, num_items, seed=None, capacity=None):
+    instance = generate_instance(family, num_items, seed, capacity)
+    return Problem(instance['barang'], instance['kapasitas_kontainer'])
+
+
+def write_instance(instance, path):
+    # satu barang per baris seperti file di data/, tetap kecil untuk jutaan barang
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('{\n')
+        file.write(f'  "kapasitas_kontainer": {instance["kapasitas_kontainer"]},\n')
+        if 'optimal_kontainer' in instance:
+            file.write(f'  "optimal_kontainer": {instance["optimal_kontainer"]},\n')
+        file.write('  "barang": [\n')
+        last = len(instance['barang']) - 1
+        for i, item in enumerate(instance['barang']):
+            separator = ',' if i < last else ''
+            file.write(f'    {{ "id": {json.dumps(item["id"])}, "ukuran": {item["ukuran"]} }}{separator}\n')
+        file.write('  ]\n}\n')
+    return path
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Generator instance bin packing sintetis (format data/)")
+    parser.add_argument('--family', choices=FAMILIES, required=True)
+    parser.add_argument('--items', type=int, required=True, help=f"jumlah barang ({MIN_ITEMS}..{MAX_ITEMS})")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--capacity', type=int, help="kapasitas kontainer (default tergantung family)")
+    parser.add_argument('--output', help="path file .json (default: data/<family>_<items>.json)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        instance = generate_instance(args.family, args.items, args.seed, args.capacity)
+    except ValueError as error:
+        parser.error(str(error))
+    path = args.output or os.path.join(DATA_DIR, f'{args.family}_{args.items}.json')
+    write_instance(instance, path)
+    print(f"{len(instance['barang'])} barang ({args.family}) disimpan ke: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,58 @@
 import json
+import os
+from array import array
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
+
+_problem_cache = {}
 
 def load_problem(file_path: str):
     with open(file_path, 'r') as file:
         data = json.load(file)
-    
+
     list_items = data.get("barang", [])
     capacity = data.get("kapasitas_kontainer", 0)
 
-    return list_items, capacity
\ No newline at end of file
+    return list_items, capacity
+
+
+class Problem:
+    def __init__(self, list_items, capacity, path=None):
+        self.items = tuple(list_items)
+        self.ids = tuple(item['id'] for item in self.items)
+        self.sizes = array('l', (item['ukuran'] for item in self.items))
+        self.capacity = capacity
+        self.path = path
+        self.total_size = sum(self.sizes)
+        self.max_size = max(self.sizes, default=0)
+        self.index = {item_id: i for i, item_id in enumerate(self.ids)}
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def name(self):
+        if self.path is None:
+            return None
+        return os.path.splitext(os.path.basename(self.path))[0]
+
+
+def problem_path(problem_file: str):
+    if problem_file.endswith('.json'):
+        return os.path.abspath(problem_file)
+    return os.path.abspath(os.path.join(DATA_DIR, f'{problem_file}.json'))
+
+
+def get_problem(problem):
+    if isinstance(problem, Problem):
+        return problem
+    path = problem_path(problem)
+    mtime = os.path.getmtime(path)
+    cached = _problem_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    list_items, capacity = load_problem(path)
+    loaded = Problem(list_items, capacity, path)
+    _problem_cache[path] = (mtime, loaded)
+    return loaded
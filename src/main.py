@@ -4,22 +4,21 @@ import time
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from input_manager import load_problem
-from state import State
-from algorithm.genetic_algorithm import GeneticAlgorithm
-from algorithm.hill_climbing import HillClimbing
-from algorithm.simulated_annealing import SimulatedAnnealing
+# modul algoritma (dan matplotlib) baru di-import saat menunya dipilih
 
 
 def hill_climbing_menu(file_path):
+    from algorithm.hill_climbing import HillClimbing
+
     print(f"\n{'='*80}")
     print("PILIH TIPE HILL CLIMBING:")
     print("1. Steepest Ascent Hill Climbing")
     print("2. Hill Climbing with Sideways Move")
     print("3. Stochastic Hill Climbing")
     print("4. Random Restart Hill Climbing")
-    print("5. Compare All Hill Climbing Types")
-    print("6. Back to Main Menu")
+    print("5. Tabu Search")
+    print("6. Compare All Hill Climbing Types")
+    print("7. Back to Main Menu")
     
     choice = input("Masukkan pilihan: ").strip()
     
@@ -32,14 +31,18 @@ def hill_climbing_menu(file_path):
     elif choice == "4":
         HillClimbing.run_hill_climbing_experiments(file_path, "random_restart")
     elif choice == "5":
-        HillClimbing.compare_algorithms(file_path)
+        HillClimbing.run_hill_climbing_experiments(file_path, "tabu")
     elif choice == "6":
+        HillClimbing.compare_algorithms(file_path)
+    elif choice == "7":
         return
     else:
         print("Pilihan tidak valid!")
 
 
 def compare_all_algorithms(file_path):
+    from algorithm.hill_climbing import HillClimbing
+
     print(f"\n{'='*80}")
     print("COMPARING ALL ALGORITHMS")
     print("This will run all algorithms and compare their performance...")
@@ -83,10 +86,12 @@ def main():
         
         print()
         if algorithm_choice == "1":
+            from algorithm.genetic_algorithm import GeneticAlgorithm
             GeneticAlgorithm.run_genetic_algorithm_experiments(file_path)
         elif algorithm_choice == "2":
             hill_climbing_menu(file_path)
         elif algorithm_choice == "3":
+            from algorithm.simulated_annealing import SimulatedAnnealing
             SimulatedAnnealing.run_simulated_annealing_experiments(file_path)
         elif algorithm_choice == "4":
             print("bye")
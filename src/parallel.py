@@ -0,0 +1,18 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+
+def resolve_workers(workers):
+    if workers is None or workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def spawn_seeds(count, rng=random):
+    # seed diambil dari RNG pemanggil supaya random.seed() tetap membuat run reproducible
+    return [rng.getrandbits(64) for _ in range(count)]
+
+
+def make_executor(workers):
+    return ProcessPoolExecutor(max_workers=resolve_workers(workers))
@@ -0,0 +1,281 @@
+import importlib
+import inspect
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+# (modul, atribut, phase) yang dibungkus selama profiling aktif.
+# Tanpa profiler aktif tidak ada yang dibungkus, jadi tidak ada overhead sama sekali.
+INSTRUMENTED = (
+    ('state', 'State.copy', 'copy'),
+    ('state', 'State.count_penalty', 'penalty'),
+    ('algorithm.hill_climbing', 'HillClimbing.neighborhood', 'neighbors'),
+    ('algorithm.hill_climbing', 'HillClimbing.generate_successors', 'neighbors'),
+    ('algorithm.hill_climbing', 'HillClimbing.best_move', 'neighbors'),
+    ('algorithm.hill_climbing', 'HillClimbing.first_improving_move', 'neighbors'),
+    ('algorithm.hill_climbing', 'plot_hill_climbing_progress', 'plotting'),
+    ('algorithm.hill_climbing', 'plot_hill_climbing_runs', 'plotting'),
+    ('algorithm.simulated_annealing', 'generate_neighbor', 'neighbors'),
+    ('algorithm.simulated_annealing', 'random_move', 'neighbors'),
+    ('algorithm.simulated_annealing', 'plot_sa_experiments', 'plotting'),
+    ('algorithm.simulated_annealing', 'SimulatedAnnealing.save_results', 'result_writing'),
+    ('algorithm.genetic_algorithm', 'GeneticAlgorithm.initialize_population', 'initialization'),
+    ('algorithm.genetic_algorithm', 'GeneticAlgorithm._selection', 'selection'),
+    ('algorithm.genetic_algorithm', 'GeneticAlgorithm.crossover', 'crossover'),
+    ('algorithm.genetic_algorithm', 'GeneticAlgorithm.repair', 'repair'),
+    ('algorithm.genetic_algorithm', 'GeneticAlgorithm._mutate', 'mutation'),
+    ('algorithm.vectorized_genetic', 'random_population', 'initialization'),
+    ('algorithm.vectorized_genetic', 'evaluate', 'penalty'),
+    ('algorithm.vectorized_genetic', 'tournament', 'selection'),
+    ('algorithm.vectorized_genetic', 'crossover', 'crossover'),
+    ('algorithm.vectorized_genetic', 'mutate', 'mutation'),
+    ('algorithm.genetic_algorithm', 'plot_ga_experiments', 'plotting'),
+    ('algorithm.genetic_algorithm', 'GeneticAlgorithm.save_ga', 'result_writing'),
+)
+
+_active = []
+_patches = []
+
+
+class _Frame:
+    __slots__ = ('phase', 'count', 'start', 'child_time', 'start_memory', 'peak_memory')
+
+    def __init__(self, phase, start, memory, count=True):
+        self.phase = phase
+        self.count = count
+        self.start = start
+        self.child_time = 0.0
+        self.start_memory = memory
+        self.peak_memory = memory
+
+
+class PhaseProfiler:
+    # Waktu per phase adalah waktu eksklusif: waktu phase lain yang dipanggil di dalamnya
+    # (misalnya copy di dalam crossover) dihitung ke phase tersebut, bukan ke pemanggilnya.
+    # Peak memory per phase = puncak memori tracemalloc selama phase dikurangi memori saat masuk.
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.phases = {}
+        self._stack = []
+        self._started_tracing = False
+        self._start = None
+        self._total_time = None
+
+    def start(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self.trace_memory:
+            _update_peaks()
+            tracemalloc.reset_peak()
+        if not _active:
+            _install()
+        _active.append(self)
+        self._start = time.perf_counter()
+        self._stack = [_Frame(None, self._start, _current_memory(self.trace_memory))]
+        return self
+
+    def stop(self):
+        now = time.perf_counter()
+        if self.trace_memory:
+            _update_peaks()
+        root = self._stack[0]
+        self._total_time = now - self._start
+        self.peak_memory = root.peak_memory - root.start_memory if self.trace_memory else None
+        self._stack = []
+        _active.remove(self)
+        if not _active:
+            _uninstall()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return self.report()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def _enter(self, phase, now, memory, count):
+        self._stack.append(_Frame(phase, now, memory, count))
+
+    def _exit(self, now):
+        if len(self._stack) == 1:
+            # phase yang sudah berjalan sebelum profiler ini dimulai
+            return
+        frame = self._stack.pop()
+        elapsed = now - frame.start
+        stats = self.phases.setdefault(frame.phase, {'calls': 0, 'time': 0.0, 'peak_memory': None})
+        parent = self._stack[-1]
+        # phase yang sama di dalam dirinya (best_move -> neighborhood) dihitung satu panggilan
+        if frame.count and parent.phase != frame.phase:
+            stats['calls'] += 1
+        stats['time'] += elapsed - frame.child_time
+        if self.trace_memory:
+            peak = frame.peak_memory - frame.start_memory
+            stats['peak_memory'] = max(stats['peak_memory'] or 0, peak)
+        parent.child_time += elapsed
+        parent.peak_memory = max(parent.peak_memory, frame.peak_memory)
+
+    @contextmanager
+    def phase(self, name):
+        # phase manual untuk kode yang tidak ada di INSTRUMENTED
+        _enter_all(name)
+        try:
+            yield
+        finally:
+            _exit_all()
+
+    def report(self):
+        total = self._total_time if self._total_time is not None else time.perf_counter() - self._start
+        phases = {name: dict(stats) for name, stats in sorted(self.phases.items(), key=lambda entry: -entry[1]['time'])}
+        profiled = sum(stats['time'] for stats in phases.values())
+        return {
+            'total_time': total,
+            'other_time': max(0.0, total - profiled),
+            'peak_memory': getattr(self, 'peak_memory', None),
+            'trace_memory': self.trace_memory,
+            'phases': phases,
+        }
+
+
+def _current_memory(trace_memory):
+    if trace_memory and tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return 0
+
+
+def _update_peaks():
+    # simpan puncak global ke frame teratas setiap profiler sebelum puncak di-reset
+    peak = tracemalloc.get_traced_memory()[1]
+    for profiler in _active:
+        if profiler.trace_memory and profiler._stack:
+            top = profiler._stack[-1]
+            top.peak_memory = max(top.peak_memory, peak)
+
+
+def _tracing():
+    return tracemalloc.is_tracing() and any(profiler.trace_memory for profiler in _active)
+
+
+def _enter_all(phase, count=True):
+    memory = 0
+    if _tracing():
+        _update_peaks()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    now = time.perf_counter()
+    for profiler in _active:
+        profiler._enter(phase, now, memory, count)
+
+
+def _exit_all():
+    now = time.perf_counter()
+    if _tracing():
+        _update_peaks()
+    for profiler in _active:
+        profiler._exit(now)
+
+
+def _wrap_function(function, phase):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        _enter_all(phase)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _exit_all()
+    return wrapper
+
+
+def _wrap_generator(function, phase):
+    # generator diukur per langkah (next), tetapi dihitung satu panggilan
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        generator = function(*args, **kwargs)
+        first = True
+        while True:
+            _enter_all(phase, count=first)
+            first = False
+            try:
+                value = next(generator)
+            except StopIteration:
+                return
+            finally:
+                _exit_all()
+            yield value
+    return wrapper
+
+
+def _install():
+    for module_name, attribute, phase in INSTRUMENTED:
+        try:
+            owner = importlib.import_module(module_name)
+        except ImportError:
+            # modul dengan dependensi opsional (numpy) yang tidak terpasang
+            continue
+        *parents, name = attribute.split('.')
+        for parent in parents:
+            owner = getattr(owner, parent)
+        original = inspect.getattr_static(owner, name)
+        function = original.__func__ if isinstance(original, staticmethod) else original
+        if inspect.isgeneratorfunction(function):
+            wrapped = _wrap_generator(function, phase)
+        else:
+            wrapped = _wrap_function(function, phase)
+        setattr(owner, name, staticmethod(wrapped) if isinstance(original, staticmethod) else wrapped)
+        _patches.append((owner, name, original))
+
+
+def _uninstall():
+    while _patches:
+        owner, name, original = _patches.pop()
+        setattr(owner, name, original)
+
+
+def profiling(profile=True):
+    # profile: False (tanpa instrumentasi), True (waktu dan jumlah panggilan), 'memory' (juga peak memori)
+    if not profile:
+        return nullcontext()
+    return PhaseProfiler(trace_memory=profile == 'memory')
+
+
+def merge_reports(*reports):
+    reports = [report for report in reports if report]
+    if not reports:
+        return None
+    merged = {
+        'total_time': sum(report['total_time'] for report in reports),
+        'other_time': sum(report['other_time'] for report in reports),
+        'peak_memory': None,
+        'trace_memory': any(report['trace_memory'] for report in reports),
+        'phases': {},
+    }
+    peaks = [report['peak_memory'] for report in reports if report['peak_memory'] is not None]
+    if peaks:
+        merged['peak_memory'] = max(peaks)
+    for report in reports:
+        for name, stats in report['phases'].items():
+            target = merged['phases'].setdefault(name, {'calls': 0, 'time': 0.0, 'peak_memory': None})
+            target['calls'] += stats['calls']
+            target['time'] += stats['time']
+            if stats['peak_memory'] is not None:
+                target['peak_memory'] = max(target['peak_memory'] or 0, stats['peak_memory'])
+    return merged
+
+
+def print_profile(report, title="Profil per Phase"):
+    if not report:
+        return
+    print(f"\n--- {title} ---")
+    print(f"{'Phase':<16} {'Calls':>10} {'Waktu (s)':>12} {'%':>7} {'Peak Memori':>14}")
+    total = report['total_time'] or 1.0
+    rows = list(report['phases'].items()) + [('lainnya', {'calls': None, 'time': report['other_time'], 'peak_memory': None})]
+    for name, stats in rows:
+        calls = '' if stats['calls'] is None else stats['calls']
+        memory = '' if stats['peak_memory'] is None else f"{stats['peak_memory'] / 1024:.1f} KiB"
+        print(f"{name:<16} {calls:>10} {stats['time']:>12.4f} {100 * stats['time'] / total:>6.1f}% {memory:>14}")
+    print(f"Total: {report['total_time']:.4f} detik")
@@ -0,0 +1,271 @@
+import mmap
+import os
+import random
+import shutil
+import tempfile
+import weakref
+from array import array
+
+POLICIES = ('full', 'stride', 'reservoir', 'minmax', 'mmap')
+ITEM_SIZE = array('d').itemsize
+
+
+class _TrajectoryFile:
+    # file biner policy mmap beserta handle tulisnya. File sementara (owned) dihapus oleh release(),
+    # yang dipanggil close() atau weakref.finalize saat recorder di-garbage-collect
+    def __init__(self, path, owned):
+        self.path = path
+        self.owned = owned
+        self.writer = None
+
+    def _writer(self):
+        if self.writer is None:
+            self.writer = open(self.path, 'ab')
+        return self.writer
+
+    def write(self, data):
+        self._writer().write(data)
+
+    def copy_from(self, path):
+        with open(path, 'rb') as source:
+            shutil.copyfileobj(source, self._writer())
+
+    def flush(self):
+        if self.writer is not None:
+            self.writer.flush()
+
+    def release(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if self.owned:
+            self.owned = False
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+def _temporary_path(directory=None, name=None):
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+    fd, path = tempfile.mkstemp(suffix='.bin', prefix=f"{name or 'trajectory'}_", dir=directory)
+    os.close(fd)
+    return path
+
+
+class TrajectoryRecorder:
+    # Menyimpan deret nilai per iterasi dengan memori terbatas sesuai policy:
+    #   full      : semua nilai dalam array bertipe (8 byte per nilai)
+    #   stride    : tiap `stride` iterasi; stride digandakan saat melebihi capacity
+    #   reservoir : sampel acak seragam berukuran capacity (Algorithm R)
+    #   minmax    : nilai min dan max per bucket; bucket digabung saat melebihi capacity
+    #   mmap      : semua nilai ditulis ke file di disk, dibaca lewat memory map. Tanpa path, file sementara
+    #               dibuat di directory (default folder temp sistem) dan dihapus oleh close(), saat keluar dari
+    #               blok with, atau saat recorder di-garbage-collect. Path dari pemanggil tidak pernah dihapus.
+    def __init__(self, policy='full', capacity=10000, stride=1, path=None, seed=None, directory=None, name=None):
+        if policy not in POLICIES:
+            raise ValueError(f"Policy recorder tidak dikenal: {policy}")
+        self.policy = policy
+        self.capacity = max(2, capacity)
+        self.stride = max(1, stride)
+        self.count = 0
+        self.first = None
+        self.last = None
+        self._values = array('d')
+        self._indices = array('q')
+        self._rng = random.Random(seed)
+        self._bucket = None
+        self.directory = directory
+        self.name = name
+        self.path = None
+        self._file = None
+        self._finalizer = None
+        if policy == 'mmap':
+            owned = path is None
+            if owned:
+                path = _temporary_path(directory, name)
+            else:
+                open(path, 'wb').close()
+            self.path = path
+            self._attach(_TrajectoryFile(path, owned))
+
+    def _attach(self, trajectory_file):
+        self._file = trajectory_file
+        self._finalizer = weakref.finalize(self, trajectory_file.release)
+
+    def append(self, value):
+        index = self.count
+        self.count += 1
+        if self.first is None:
+            self.first = value
+        self.last = value
+
+        if self.policy == 'full':
+            self._values.append(value)
+        elif self.policy == 'stride':
+            if index % self.stride == 0:
+                self._values.append(value)
+                self._indices.append(index)
+                if len(self._values) > self.capacity:
+                    self.stride *= 2
+                    self._values = self._values[::2]
+                    self._indices = self._indices[::2]
+        elif self.policy == 'reservoir':
+            if len(self._values) < self.capacity:
+                self._values.append(value)
+                self._indices.append(index)
+            else:
+                slot = self._rng.randrange(self.count)
+                if slot < self.capacity:
+                    self._values[slot] = value
+                    self._indices[slot] = index
+        elif self.policy == 'minmax':
+            self._append_minmax(index, value)
+        else:
+            self._file.write(array('d', [value]).tobytes())
+
+    def _append_minmax(self, index, value):
+        # _bucket = [indeks min, nilai min, indeks max, nilai max] untuk bucket yang sedang diisi
+        if self._bucket is None:
+            self._bucket = [index, value, index, value]
+        else:
+            if value < self._bucket[1]:
+                self._bucket[0:2] = [index, value]
+            if value > self._bucket[3]:
+                self._bucket[2:4] = [index, value]
+        if (index + 1) % self.stride == 0:
+            self._flush_bucket()
+            if len(self._values) > self.capacity:
+                self._merge_buckets()
+
+    def _flush_bucket(self):
+        if self._bucket is None:
+            return
+        min_index, min_value, max_index, max_value = self._bucket
+        first, second = sorted([(min_index, min_value), (max_index, max_value)])
+        self._indices.extend([first[0], second[0]])
+        self._values.extend([first[1], second[1]])
+        self._bucket = None
+
+    def _merge_buckets(self):
+        indices = array('q')
+        values = array('d')
+        for start in range(0, len(self._values), 4):
+            points = list(zip(self._indices[start:start + 4], self._values[start:start + 4]))
+            low = min(points, key=lambda point: point[1])
+            high = max(points, key=lambda point: point[1])
+            for point in sorted([low, high]):
+                indices.append(point[0])
+                values.append(point[1])
+        self._indices = indices
+        self._values = values
+        self.stride *= 2
+
+    def indices(self):
+        if self.policy in ('full', 'mmap'):
+            return range(len(self))
+        pairs = self._points()
+        return [index for index, _ in pairs]
+
+    def values(self):
+        if self.policy == 'full':
+            return list(self._values)
+        if self.policy == 'mmap':
+            return list(self._read_mmap())
+        return [value for _, value in self._points()]
+
+    def _points(self):
+        pairs = list(zip(self._indices, self._values))
+        if self.policy == 'minmax' and self._bucket is not None:
+            min_index, min_value, max_index, max_value = self._bucket
+            pairs.extend(sorted({(min_index, min_value), (max_index, max_value)}))
+        if self.policy == 'reservoir':
+            pairs.sort()
+        if self.policy == 'minmax':
+            # bucket berisi satu titik menghasilkan min dan max yang sama
+            pairs = [pair for k, pair in enumerate(pairs) if k == 0 or pair[0] != pairs[k - 1][0]]
+        return pairs
+
+    def _read_mmap(self, start=0, stop=None):
+        # nilai [start, stop) dari file, hanya bagian itu yang di-decode
+        stop = self.count if stop is None else stop
+        data = array('d')
+        if stop <= start:
+            return data
+        self._file.flush()
+        with open(self.path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data.frombytes(mapped[start * ITEM_SIZE:stop * ITEM_SIZE])
+        return data
+
+    def __len__(self):
+        if self.policy in ('full', 'mmap'):
+            return self.count
+        if self.policy in ('stride', 'reservoir'):
+            return len(self._values)
+        return len(self._points())
+
+    def __iter__(self):
+        return iter(self.values())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) or self.policy not in ('full', 'mmap'):
+            return self.values()[index]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError('indeks trajectory di luar jangkauan')
+        if self.policy == 'full':
+            return self._values[index]
+        return self._read_mmap(index, index + 1)[0]
+
+    def copy(self):
+        if self.policy == 'mmap':
+            new_recorder = TrajectoryRecorder('mmap', directory=self.directory, name=self.name)
+            self._file.flush()
+            new_recorder._file.copy_from(self.path)
+        else:
+            new_recorder = TrajectoryRecorder(self.policy, self.capacity, self.stride)
+            new_recorder._values = array('d', self._values)
+            new_recorder._indices = array('q', self._indices)
+            new_recorder._bucket = list(self._bucket) if self._bucket is not None else None
+        new_recorder.stride = self.stride
+        new_recorder.count = self.count
+        new_recorder.first = self.first
+        new_recorder.last = self.last
+        return new_recorder
+
+    def close(self):
+        # menutup handle tulis dan menghapus file sementara; nilai mmap tidak bisa dibaca lagi sesudahnya
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self):
+        # pickling (hasil worker ke proses utama) memindahkan kepemilikan file sementara ke salinan yang
+        # di-unpickle, sehingga file tidak terhapus saat recorder di worker di-garbage-collect
+        state = self.__dict__.copy()
+        state['_finalizer'] = None
+        if self._file is not None:
+            self._file.flush()
+            state['_file'] = (self._file.path, self._file.owned)
+            self._file.owned = False
+        return state
+
+    def __setstate__(self, state):
+        trajectory_file = state.pop('_file')
+        self.__dict__.update(state)
+        self._file = None
+        if trajectory_file is not None:
+            self._attach(_TrajectoryFile(*trajectory_file))
+
+
+def make_recorder(policy='full', name=None, directory=None, **options):
+    if policy == 'mmap':
+        options.update(directory=directory, name=name)
+    return TrajectoryRecorder(policy, **options)
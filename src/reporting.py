@@ -0,0 +1,205 @@
+import os
+import sys
+import time
+
+from input_manager import PROJECT_ROOT
+
+DEFAULT_PLOT_DIR = os.path.join(PROJECT_ROOT, 'result', 'plot')
+
+_pyplot = None
+
+
+def is_headless():
+    if os.environ.get('MPLBACKEND'):
+        return os.environ['MPLBACKEND'].lower() == 'agg'
+    if sys.platform.startswith('linux'):
+        return not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    return False
+
+
+def get_pyplot():
+    # matplotlib baru di-import saat pertama kali ada plot yang dibuat
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        if is_headless():
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        _pyplot = plt
+    return _pyplot
+
+
+def finish_figure(plt, show):
+    if show and not is_headless():
+        plt.show()
+    plt.close()
+
+
+def prepare_plot_dir(plot_dir=None):
+    if plot_dir is None:
+        plot_dir = DEFAULT_PLOT_DIR
+    if not os.path.exists(plot_dir):
+        os.makedirs(plot_dir)
+    return plot_dir
+
+
+def plot_hill_climbing_progress(values, algorithm_type, title="Hill Climbing Progress", save=True, plot_dir=None):
+    plt = get_pyplot()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    x_vals = [i + 1 for i in values.indices()]
+    if algorithm_type == 'random_restart':
+        ax.plot(x_vals, values.values(), linestyle='-', marker='o', color='b', linewidth=1.5, markersize=4)
+        ax.set_title('Random Restart - Final Penalty per Restart')
+        ax.set_xlabel('Restart')
+        ax.set_ylabel('Final Penalty')
+    else:
+        ax.plot(x_vals, values.values(), linestyle='-', marker='o', color='b', linewidth=1.5, markersize=4)
+        ax.set_title(f'{title} - Objective Function')
+        ax.set_xlabel('Iteration')
+        ax.set_ylabel('Penalty Value')
+    ax.grid(True, linestyle='--', alpha=0.6)
+    plt.tight_layout()
+    if save:
+        plot_dir = prepare_plot_dir(plot_dir)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filename = f"hill_{algorithm_type}_{timestamp}.png"
+        filepath = os.path.join(plot_dir, filename)
+        plt.savefig(filepath, dpi=300, bbox_inches='tight')
+        print(f"Plot saved to: {filepath}")
+    plt.close(fig)
+    return fig
+
+
+def plot_hill_climbing_runs(results, algorithm_type, save=True, plot_dir=None):
+    plt = get_pyplot()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    colors = ['b', 'g', 'r']
+
+    for i, result in enumerate(results):
+        if algorithm_type == 'random_restart':
+            num_runs = len(results)
+            bar_width = 0.8 / num_runs
+
+            iterations_per_restart = result['iterations_per_restart']
+            num_restarts = len(iterations_per_restart)
+
+            base_x = list(range(1, num_restarts + 1))
+            bar_positions = [x + i * bar_width for x in base_x]
+
+            ax.bar(bar_positions, iterations_per_restart, width=bar_width, color=colors[i % len(colors)], label=f"Run {i+1}")
+
+            ax.set_xticks([r + bar_width * (num_runs - 1) / 2 for r in base_x])
+            ax.set_xticklabels(base_x)
+        else:
+            values = result['values']
+            x_vals = [i + 1 for i in values.indices()]
+            ax.plot(x_vals, values.values(), linestyle='-', marker='o', color=colors[i % len(colors)], linewidth=1.5, markersize=4, label=f"Run {i+1}")
+
+    if algorithm_type == 'random_restart':
+        ax.set_title(f'Random Restart - Iterations Until Stop per Restart')
+        ax.set_xlabel('Restart Number (Grouped by Run)')
+        ax.set_ylabel('Iterations Until Stop')
+    else:
+        ax.set_title(f'{algorithm_type.replace("_", " ").title()} - Objective Function ({len(results)} Runs)')
+        ax.set_xlabel('Iteration')
+        ax.set_ylabel('Penalty Value')
+
+    ax.legend()
+    ax.grid(True, linestyle='--', alpha=0.6)
+    plt.tight_layout()
+
+    if save:
+        plot_dir = prepare_plot_dir(plot_dir)
+        filename = f"hill_{algorithm_type}.png"
+        filepath = os.path.join(plot_dir, filename)
+        plt.savefig(filepath, dpi=300, bbox_inches='tight')
+        print(f"Plot disimpan ke: {filepath}")
+    plt.close(fig)
+    return fig
+
+
+def plot_sa_experiments(experiments_results, show=True, plot_dir=None):
+    plt = get_pyplot()
+    plot_dir = prepare_plot_dir(plot_dir)
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+
+    # Plot 1: Objective Function
+    plt.figure(figsize=(10, 6))
+    for exp in experiments_results:
+        result = exp['result']
+        plt.plot(result['objective_history'].indices(),
+                result['objective_history'].values(),
+                label=exp['label'],
+                linewidth=2)
+
+    plt.title("Perbandingan Nilai Objektif vs Iterasi - Simulated Annealing",
+             fontsize=14, fontweight="bold")
+    plt.xlabel("Iterasi")
+    plt.ylabel("Nilai Objektif (Penalti)")
+    plt.legend(loc="best")
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+
+    filename_obj = f"sa_objective_{timestamp}.png"
+    filepath_obj = os.path.join(plot_dir, filename_obj)
+    plt.savefig(filepath_obj, dpi=300, bbox_inches="tight")
+    print(f"\nPlot Nilai Objektif disimpan ke: {filepath_obj}")
+    finish_figure(plt, show)
+
+    # Plot 2: Acceptance Probability (Moving Average)
+    plt.figure(figsize=(10, 6))
+    window_size = 50
+
+    for exp in experiments_results:
+        result = exp['result']
+        acceptance_history = result['acceptance_prob_history'].values()
+
+        # Calculate moving average
+        smoothed = []
+        window_sum = 0.0
+        for i, value in enumerate(acceptance_history):
+            window_sum += value
+            if i >= window_size:
+                window_sum -= acceptance_history[i - window_size]
+            smoothed.append(window_sum / min(i + 1, window_size))
+
+        plt.plot(result['acceptance_prob_history'].indices(), smoothed, label=exp['label'], linewidth=2)
+
+    plt.title("Perbandingan e^(ΔE/T) vs Iterasi - Simulated Annealing",
+             fontsize=14, fontweight="bold")
+    plt.xlabel("Iterasi")
+    plt.ylabel("e^(ΔE/T) (Moving Average)")
+    plt.legend(loc="best")
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+
+    filename_acc = f"sa_acceptance_{timestamp}.png"
+    filepath_acc = os.path.join(plot_dir, filename_acc)
+    plt.savefig(filepath_acc, dpi=300, bbox_inches="tight")
+    print(f"Plot Acceptance Probability disimpan ke: {filepath_acc}")
+    finish_figure(plt, show)
+
+
+def plot_ga_experiments(experiments_data, show=True, plot_dir=None):
+    plt = get_pyplot()
+    plot_dir = prepare_plot_dir(plot_dir)
+
+    plt.figure(figsize=(10, 6))
+
+    for label, history in experiments_data:
+        plt.plot(history['best_objective'].indices(), history['best_objective'].values(), label=f"{label} (Best)", linewidth=2)
+        plt.plot(history['avg_objective'].indices(), history['avg_objective'].values(), label=f"{label} (Avg)", linewidth=2, linestyle='--', alpha=0.7)
+
+    plt.title('Perbandingan Nilai Objektif (Best & Average) vs. Generasi', fontsize=14, fontweight='bold')
+    plt.xlabel('Generasi')
+    plt.ylabel('Nilai Objektif (Penalti)')
+    plt.legend(loc='best')
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    filename = f"ga_plot_{timestamp}.png"
+    filepath = os.path.join(plot_dir, filename)
+    plt.savefig(filepath, dpi=300, bbox_inches='tight')
+    print(f"\nPlot perbandingan disimpan ke: {filepath}")
+    finish_figure(plt, show)
@@ -0,0 +1,63 @@
+NO_SPACE = float('-inf')
+
+
+class ResidualTree:
+    # Segment tree berisi sisa kapasitas (residual) tiap kontainer. Setiap node menyimpan
+    # residual maksimum di subtree-nya, sehingga kontainer pertama (indeks terkecil) yang
+    # masih muat untuk ukuran tertentu bisa dicari dalam O(log m), begitu juga update-nya.
+    def __init__(self, residuals=()):
+        residuals = list(residuals)
+        self._count = len(residuals)
+        self._size = 1
+        while self._size < self._count:
+            self._size *= 2
+        self._tree = [NO_SPACE] * (2 * self._size)
+        self._tree[self._size:self._size + self._count] = residuals
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def __len__(self):
+        return self._count
+
+    def residual(self, index):
+        return self._tree[self._size + index]
+
+    def update(self, index, residual):
+        tree = self._tree
+        node = self._size + index
+        tree[node] = residual
+        node >>= 1
+        while node:
+            left = tree[2 * node]
+            right = tree[2 * node + 1]
+            value = left if left >= right else right
+            if tree[node] == value:
+                break
+            tree[node] = value
+            node >>= 1
+
+    def append(self, residual):
+        if self._count == self._size:
+            # kapasitas penuh: bangun ulang dengan ukuran dua kali lipat (amortized O(1))
+            residuals = self._tree[self._size:self._size + self._count]
+            self.__init__(residuals + [residual])
+        else:
+            self.update(self._count, residual)
+            self._count += 1
+        return self._count - 1
+
+    def first_fit(self, size):
+        # indeks kontainer pertama dengan residual >= size, atau -1 jika tidak ada
+        tree = self._tree
+        if tree[1] < size:
+            return -1
+        node = 1
+        leaves = self._size
+        while node < leaves:
+            node *= 2
+            if tree[node] < size:
+                node += 1
+        return node - leaves
+
+    def max_residual(self):
+        return self._tree[1]
@@ -0,0 +1,200 @@
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from input_manager import PROJECT_ROOT
+from generator import FAMILIES
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000, 1000000)
+DEFAULT_OUTPUT = os.path.join(PROJECT_ROOT, 'result', 'scaling', 'scaling.json')
+
+
+def _peak_rss_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KiB, macOS byte
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_case(case):
+    # dijalankan di proses terpisah supaya peak RSS dan timeout per kasus tidak saling mempengaruhi
+    import contextlib
+    import random
+    from benchmark import ALGORITHMS, SETTINGS, QUICK_SETTINGS, run_algorithm, prepare_micro
+    from generator import generate_problem
+
+    settings = QUICK_SETTINGS if case['quick'] else SETTINGS
+    start = time.perf_counter()
+    problem = generate_problem(case['family'], case['items'], case['seed'])
+    generate_time = time.perf_counter() - start
+    rss_before = _peak_rss_bytes()
+
+    random.seed(case['seed'])
+    quality = None
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        if case['benchmark'] in ALGORITHMS:
+            start = time.perf_counter()
+            quality, iterations = run_algorithm(case['benchmark'], problem, settings)
+        else:
+            run, iterations = prepare_micro(case['benchmark'], problem, settings)
+            start = time.perf_counter()
+            run()
+    wall_time = time.perf_counter() - start
+
+    return {
+        'generate_time': generate_time,
+        'wall_time': wall_time,
+        'iterations': iterations,
+        'iterations_per_second': iterations / wall_time if wall_time > 0 else None,
+        'rss_before_bytes': rss_before,
+        'peak_rss_bytes': _peak_rss_bytes(),
+        'quality': quality,
+    }
+
+
+def run_case_subprocess(case, timeout):
+    command = [sys.executable, os.path.abspath(__file__), '--worker', json.dumps(case)]
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {'status': 'timeout'}
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()
+        return {'status': 'error', 'error': error[-1] if error else f'exit code {completed.returncode}'}
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result['status'] = 'ok'
+    return result
+
+
+def _log_slope(small, large, key):
+    # None jika salah satu ukuran tidak punya nilai (mis. peak RSS di Windows) atau nilainya tidak positif
+    if not small.get(key) or not large.get(key):
+        return None
+    return math.log(large[key] / small[key]) / math.log(large['items'] / small['items'])
+
+
+def growth_exponents(records):
+    # kemiringan log-log antar ukuran berurutan untuk waktu dan peak RSS: ~1 linear, ~2 kuadratik.
+    # Peak RSS termasuk memori dasar interpreter, jadi eksponennya baru bermakna pada ukuran besar
+    exponents = {}
+    groups = {}
+    for record in records:
+        if record['status'] == 'ok':
+            groups.setdefault((record['family'], record['benchmark']), []).append(record)
+    for (family, benchmark), group in groups.items():
+        group.sort(key=lambda record: record['items'])
+        slopes = []
+        for small, large in zip(group, group[1:]):
+            time_exponent = _log_slope(small, large, 'wall_time')
+            memory_exponent = _log_slope(small, large, 'peak_rss_bytes')
+            if time_exponent is not None or memory_exponent is not None:
+                slopes.append({
+                    'from': small['items'],
+                    'to': large['items'],
+                    'time_exponent': time_exponent,
+                    'memory_exponent': memory_exponent,
+                })
+        exponents[f'{family}/{benchmark}'] = slopes
+    return exponents
+
+
+def _print_growth(growth):
+    print("Eksponen pertumbuhan (log-log):")
+    for name, slopes in growth.items():
+        for slope in slopes:
+            time_exponent = '-' if slope['time_exponent'] is None else f"{slope['time_exponent']:.2f}"
+            memory_exponent = '-' if slope['memory_exponent'] is None else f"{slope['memory_exponent']:.2f}"
+            print(f"{name:<35} {slope['from']:>8} -> {slope['to']:<8} waktu={time_exponent} memori={memory_exponent}")
+
+
+def run_study(options):
+    from benchmark import ALGORITHMS
+
+    benchmarks = options['benchmarks'] or list(ALGORITHMS)
+    records = []
+    for family in options['families']:
+        for benchmark in benchmarks:
+            broken_at = None
+            for items in sorted(options['sizes']):
+                record = {'family': family, 'benchmark': benchmark, 'items': items}
+                if broken_at is not None:
+                    # ukuran lebih kecil sudah timeout/error, ukuran lebih besar pasti lebih lambat
+                    record.update(status='skipped', reason=f'gagal di {broken_at} barang')
+                else:
+                    case = {'family': family, 'benchmark': benchmark, 'items': items,
+                            'seed': options['seed'], 'quick': options['quick']}
+                    record.update(run_case_subprocess(case, options['timeout']))
+                    if record['status'] != 'ok':
+                        broken_at = items
+                records.append(record)
+                _print_record(record)
+    return records
+
+
+def _print_record(record):
+    name = f"{record['family']}/{record['benchmark']}"
+    if record['status'] != 'ok':
+        detail = record.get('reason') or record.get('error') or ''
+        print(f"{name:<35} n={record['items']:<8} {record['status']} {detail}")
+        return
+    memory = '-' if record['peak_rss_bytes'] is None else f"{record['peak_rss_bytes'] / 2**20:.1f} MiB"
+    print(f"{name:<35} n={record['items']:<8} {record['wall_time']:10.4f}s peak_rss={memory}")
+
+
+def build_parser():
+    from benchmark import ALGORITHMS, MICROS
+
+    parser = argparse.ArgumentParser(description="Studi skalabilitas waktu dan memori terhadap jumlah barang")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--families', nargs='+', choices=FAMILIES, default=list(FAMILIES))
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--benchmarks', nargs='+', choices=ALGORITHMS + MICROS,
+                        help="algoritma/micro-benchmark yang diukur (default: semua algoritma)")
+    parser.add_argument('--timeout', type=float, default=120.0, help="batas waktu per kasus (detik)")
+    parser.add_argument('--seed', type=int, default=12345)
+    parser.add_argument('--quick', action='store_true', help="pakai parameter algoritma --quick dari benchmark")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    return parser
+
+
+def main(argv=None):
+    options = vars(build_parser().parse_args(argv))
+    if options['worker']:
+        print(json.dumps(run_case(json.loads(options['worker']))))
+        return 0
+
+    records = run_study(options)
+    growth = growth_exponents(records)
+    _print_growth(growth)
+    report = {
+        'meta': {
+            'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'seed': options['seed'],
+            'quick': options['quick'],
+            'timeout': options['timeout'],
+        },
+        'results': records,
+        'growth': growth,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(options['output'])), exist_ok=True)
+    with open(options['output'], 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f"Hasil studi skalabilitas disimpan ke: {options['output']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,42 @@
-from input_manager import load_problem
+from input_manager import get_problem
+from collections import namedtuple
+import hashlib
 import random
-import os
+
+CONTAINER_COST = 100
+OVERFLOW_WEIGHT = 50
+SLACK_WEIGHT = 0.5
+
+
+def load_penalty(load, capacity):
+    if load > capacity:
+        return (load - capacity) * OVERFLOW_WEIGHT
+    return (capacity - load) * SLACK_WEIGHT
+
+
+# Move relokasi (partner None) atau swap. target None berarti kontainer baru.
+Move = namedtuple('Move', ['delta', 'item', 'source', 'target', 'partner'])
+
+HASH_MASK = (1 << 64) - 1
+_item_keys = {}
+
+
+def item_key(item_id):
+    # kunci acak 64-bit yang tetap untuk setiap id barang (Zobrist hashing)
+    key = _item_keys.get(item_id)
+    if key is None:
+        digest = hashlib.blake2b(str(item_id).encode('utf-8'), digest_size=8).digest()
+        key = _item_keys[item_id] = int.from_bytes(digest, 'little')
+    return key
+
+
+def mix_key(key):
+    # finalizer splitmix64, supaya penjumlahan kunci kontainer tidak saling meniadakan
+    z = (key + 0x9E3779B97F4A7C15) & HASH_MASK
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & HASH_MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & HASH_MASK
+    return z ^ (z >> 31)
+
 
 class Item:
     id: str
@@ -9,76 +45,233 @@ class Item:
 class Container:
     capacity: int
     item_list: list[Item]
+    load: int
 
     def __init__(self, capacity : int):
         self.capacity = capacity
         self.item_list = []
+        self.load = 0
+        self._key = 0
+        self._mixed = None
+        self.owner = None
+
+    def add_item(self, item):
+        self.item_list.append(item)
+        self.load += item['ukuran']
+        self._invalidate()
+
+    def remove_item(self, item):
+        self.item_list.remove(item)
+        self.load -= item['ukuran']
+        self._invalidate()
+
+    def set_items(self, items):
+        self.item_list = list(items)
+        self.load = sum(item['ukuran'] for item in self.item_list)
+        self._invalidate()
+
+    def _invalidate(self):
+        # kunci Zobrist baru dihitung saat dibutuhkan (canonical_hash/move_hash), tidak setiap move
+        self._key = None
+        self._mixed = None
+        if self.owner is not None:
+            self.owner._penalty = None
+            self.owner._hash = None
 
     def total_size(self):
-        return sum(item['ukuran'] for item in self.item_list)
+        return self.load
 
-class State:
-    list_container: list[Container]
+    def penalty(self):
+        return load_penalty(self.load, self.capacity)
+
+    @property
+    def key(self):
+        if self._key is None:
+            key = 0
+            for item in self.item_list:
+                key ^= item_key(item['id'])
+            self._key = key
+        return self._key
+
+    def mixed_key(self):
+        if self._mixed is None:
+            self._mixed = mix_key(self.key)
+        return self._mixed
+
+    def copy(self):
+        new_container = Container(capacity=self.capacity)
+        new_container.item_list = self.item_list.copy()
+        new_container.load = self.load
+        new_container._key = self._key
+        new_container._mixed = self._mixed
+        return new_container
 
+class State:
     def __init__(self):
-        self.list_container = []
+        self._list_container = []
+        self._penalty = None
+        self._hash = None
+
+    @property
+    def list_container(self):
+        return self._list_container
+
+    @list_container.setter
+    def list_container(self, containers):
+        for container in containers:
+            container.owner = self
+        self._list_container = containers
+        self._penalty = None
+        self._hash = None
+
+    def add_container(self, container):
+        container.owner = self
+        self._list_container.append(container)
+        self._penalty = None
+        self._hash = None
+
+    def remove_container(self, container):
+        self._list_container.remove(container)
+        container.owner = None
+        self._penalty = None
+        self._hash = None
+
+    def remove_empty_containers(self):
+        if any(not c.item_list for c in self._list_container):
+            self.list_container = [c for c in self._list_container if c.item_list]
 
     def count_penalty(self):
-        penalty = 0
-        count = 0
-        for container in self.list_container:
-            count += 1
-            total_size = sum(item['ukuran'] for item in container.item_list)
-            if total_size > container.capacity:
-                penalty += (total_size - container.capacity)*50
-            else :
-                penalty += (container.capacity - total_size)*0.5
-        penalty += count * 100
-        return penalty
-    
-    def first_fit(self, filepath):
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(script_dir)
-        problem_path = os.path.join(parent_dir, 'data', f'{filepath}.json')
-        list_items, capacity = load_problem(problem_path)
-        self.list_container = [] 
+        if self._penalty is None:
+            penalty = 0
+            for container in self._list_container:
+                penalty += load_penalty(container.load, container.capacity)
+            penalty += len(self._list_container) * CONTAINER_COST
+            self._penalty = penalty
+        return self._penalty
+
+    def empty_container_cost(self):
+        return sum(CONTAINER_COST + load_penalty(0, c.capacity) for c in self._list_container if not c.item_list)
+
+    def relocate_delta(self, source, target, item, empty_cost=None):
+        if empty_cost is None:
+            empty_cost = self.empty_container_cost()
+        if target == source:
+            # barang kembali ke kontainer yang sama, hanya kontainer kosong lain yang dibuang apply_move
+            return -empty_cost
+        size = item['ukuran']
+        container_from = self._list_container[source]
+        delta = load_penalty(container_from.load - size, container_from.capacity) - container_from.penalty()
+        if len(container_from.item_list) == 1:
+            delta -= CONTAINER_COST + load_penalty(0, container_from.capacity)
+        if target is None:
+            delta += CONTAINER_COST + load_penalty(size, container_from.capacity)
+        else:
+            container_to = self._list_container[target]
+            delta += load_penalty(container_to.load + size, container_to.capacity) - container_to.penalty()
+            if not container_to.item_list:
+                empty_cost -= CONTAINER_COST + load_penalty(0, container_to.capacity)
+        return delta - empty_cost
+
+    def swap_delta(self, source, target, item, partner):
+        if target == source:
+            # swap di dalam satu kontainer tidak mengubah load
+            return 0
+        diff = partner['ukuran'] - item['ukuran']
+        container1 = self._list_container[source]
+        container2 = self._list_container[target]
+        return (load_penalty(container1.load + diff, container1.capacity) - container1.penalty()
+                + load_penalty(container2.load - diff, container2.capacity) - container2.penalty())
+
+    def canonical_hash(self):
+        # tidak bergantung pada urutan kontainer maupun urutan barang di dalam kontainer
+        if self._hash is None:
+            self._hash = sum(container.mixed_key() for container in self._list_container) & HASH_MASK
+        return self._hash
+
+    def move_hash(self, move, current_hash=None):
+        # hash state setelah apply_move(move) dalam O(1), dengan asumsi tidak ada kontainer kosong
+        if current_hash is None:
+            current_hash = self.canonical_hash()
+        container_from = self._list_container[move.source]
+        key = item_key(move.item['id'])
+        if move.partner is not None:
+            container_to = self._list_container[move.target]
+            key ^= item_key(move.partner['id'])
+            current_hash += (mix_key(container_from.key ^ key) - mix_key(container_from.key)
+                             + mix_key(container_to.key ^ key) - mix_key(container_to.key))
+            return current_hash & HASH_MASK
+        current_hash -= mix_key(container_from.key)
+        if len(container_from.item_list) > 1:
+            current_hash += mix_key(container_from.key ^ key)
+        if move.target is None:
+            current_hash += mix_key(key)
+        else:
+            container_to = self._list_container[move.target]
+            current_hash += mix_key(container_to.key ^ key) - mix_key(container_to.key)
+        return current_hash & HASH_MASK
+
+    def pop_container(self, index):
+        # O(1): kontainer terakhir menempati posisi index, urutan kontainer tidak dipertahankan
+        containers = self._list_container
+        container = containers[index]
+        containers[index] = containers[-1]
+        containers.pop()
+        container.owner = None
+        self._penalty = None
+        self._hash = None
+        return container
+
+    def apply_move(self, move, keep_order=True):
+        # keep_order=False: hanya kontainer sumber yang diperiksa kosong dan dibuang lewat pop_container,
+        # sehingga move O(1) terhadap jumlah kontainer (dipakai simulated annealing)
+        penalty = self._penalty
+        container_from = self._list_container[move.source]
+        if move.partner is None:
+            container_from.remove_item(move.item)
+            if move.target is None:
+                container_to = Container(capacity=container_from.capacity)
+                self.add_container(container_to)
+            else:
+                container_to = self._list_container[move.target]
+            container_to.add_item(move.item)
+            if keep_order:
+                self.remove_empty_containers()
+            elif not container_from.item_list:
+                self.pop_container(move.source)
+        else:
+            container_to = self._list_container[move.target]
+            container_from.remove_item(move.item)
+            container_to.remove_item(move.partner)
+            container_from.add_item(move.partner)
+            container_to.add_item(move.item)
+        if penalty is not None:
+            self._penalty = penalty + move.delta
+        return self
+
+    def first_fit(self, problem):
+        # O(n log m) lewat segment tree residual, lihat construction.py untuk heuristik lainnya
+        from construction import first_fit
+        self.list_container = first_fit(problem).list_container
 
-        for item in list_items:
-            item_placed = False
-            for container in self.list_container:
-                if container.total_size() + item['ukuran'] <= capacity:
-                    container.item_list.append(item)
-                    item_placed = True
-                    break
-            if not item_placed:
-                new_container = Container(capacity=capacity)
-                new_container.item_list.append(item)
-                self.list_container.append(new_container)
-    
     def copy(self):
         new_state = State()
-        for container in self.list_container:
-            new_container = Container(capacity=container.capacity)
-            new_container.item_list = container.item_list.copy()
-            new_state.list_container.append(new_container)
+        new_state.list_container = [container.copy() for container in self._list_container]
+        new_state._penalty = self._penalty
+        new_state._hash = self._hash
         return new_state
-    
-    def generate_random_state(self, filepath):
-        import random
-        import os
-        
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(script_dir)
-        problem_path = os.path.join(parent_dir, 'data', f'{filepath}.json')
-        list_items, capacity = load_problem(problem_path)
+
+    def generate_random_state(self, problem):
+        problem = get_problem(problem)
+        capacity = problem.capacity
+        list_items = list(problem.items)
         random.shuffle(list_items)
         num_containers = random.randint(1, len(list_items))
-        
+
         self.list_container = [Container(capacity=capacity) for _ in range(num_containers)]
-        
+
         for item in list_items:
-            random.choice(self.list_container).item_list.append(item)
+            random.choice(self.list_container).add_item(item)
         if random.random() < 0.2:
             extra_empty = random.randint(1, 3)
             for _ in range(extra_empty):
-                self.list_container.append(Container(capacity=capacity))
\ No newline at end of file
+                self.add_container(Container(capacity=capacity))
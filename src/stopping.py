@@ -0,0 +1,110 @@
+import time
+
+from bounds import problem_bounds
+
+# Alasan berhenti dari StoppingPolicy. Algoritma juga melaporkan alasan dari aturannya sendiri,
+# misalnya 'local_optimum', 'max_iterations', 'temperature' atau 'generations'.
+TIME_LIMIT = 'time_limit'
+MAX_EVALUATIONS = 'max_evaluations'
+STALL = 'stall'
+TARGET_PENALTY = 'target_penalty'
+PROVEN_OPTIMAL = 'proven_optimal'
+
+
+class StoppingPolicy:
+    # Kriteria berhenti yang sama untuk semua algoritma, semua batas opsional (None = tanpa batas):
+    # time_limit (detik wall-clock), max_evaluations (jumlah evaluasi penalti/tetangga),
+    # stall_limit (iterasi/generasi berturut-turut tanpa perbaikan penalti terbaik) dan
+    # target_penalty (berhenti begitu penalti terbaik <= target). Dengan stop_at_optimum, pencarian juga
+    # berhenti begitu penalti terbaik mencapai lower bound penalti (bounds.py): solusi terbukti optimal.
+    # start/finish boleh bersarang (random restart memakai policy yang sama untuk setiap restart),
+    # penghitung hanya di-reset oleh start paling luar.
+    def __init__(self, time_limit=None, max_evaluations=None, stall_limit=None, target_penalty=None,
+                 stop_at_optimum=True):
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self.stall_limit = stall_limit
+        self.target_penalty = target_penalty
+        self.stop_at_optimum = stop_at_optimum
+        self.bounds = None
+        self._depth = 0
+        self._reset()
+
+    def _reset(self):
+        self.reason = None
+        self.evaluations = 0
+        self.iterations = 0
+        self.stall = 0
+        self.best_penalty = float('inf')
+        self._start = time.monotonic()
+
+    def start(self, problem=None):
+        if self._depth == 0:
+            self._reset()
+            self.bounds = problem_bounds(problem) if problem is not None and self.stop_at_optimum else None
+        self._depth += 1
+        return self
+
+    def elapsed(self):
+        return time.monotonic() - self._start
+
+    def record(self, best_penalty, evaluations=0):
+        # dipanggil sekali per iterasi/generasi, mengembalikan True jika pencarian harus berhenti
+        self.iterations += 1
+        self.evaluations += evaluations
+        if best_penalty < self.best_penalty:
+            self.best_penalty = best_penalty
+            self.stall = 0
+        else:
+            self.stall += 1
+        return self.should_stop()
+
+    def merge(self, best_penalty, evaluations=0, iterations=0):
+        # statistik dari salinan policy di worker (satu restart/run penuh). Restart yang tidak memperbaiki
+        # penalti terbaik menambah stall sebanyak iterasinya, seperti jika dijalankan berurutan
+        self.evaluations += evaluations
+        self.iterations += iterations
+        if best_penalty < self.best_penalty:
+            self.best_penalty = best_penalty
+            self.stall = 0
+        else:
+            self.stall += iterations
+
+    def should_stop(self):
+        if self.reason is None:
+            if self.is_optimal():
+                self.reason = PROVEN_OPTIMAL
+            elif self.target_penalty is not None and self.best_penalty <= self.target_penalty:
+                self.reason = TARGET_PENALTY
+            elif self.max_evaluations is not None and self.evaluations >= self.max_evaluations:
+                self.reason = MAX_EVALUATIONS
+            elif self.stall_limit is not None and self.stall >= self.stall_limit:
+                self.reason = STALL
+            elif self.time_limit is not None and self.elapsed() >= self.time_limit:
+                self.reason = TIME_LIMIT
+        return self.reason is not None
+
+    def is_optimal(self):
+        # optimal_penalty adalah lower bound penalti semua packing (lihat bounds.optimal_penalty), jadi
+        # mencapainya membuktikan optimal apa pun jumlah kontainernya
+        bounds = self.bounds
+        return (bounds is not None and bounds.optimal_penalty is not None
+                and self.best_penalty <= bounds.optimal_penalty)
+
+    def finish(self, reason):
+        # reason: alasan berhenti dari aturan algoritma sendiri, dipakai jika policy tidak menghentikannya
+        self._depth = max(0, self._depth - 1)
+        if self.reason is not None:
+            return self.reason
+        if self._depth == 0:
+            self.reason = reason
+        return reason
+
+    def summary(self):
+        return {
+            'stop_reason': self.reason,
+            'elapsed': self.elapsed(),
+            'evaluations': self.evaluations,
+            'iterations': self.iterations,
+            'lower_bound': self.bounds.lower_bound if self.bounds is not None else None,
+        }
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# modul di src/ saling import tanpa package (seperti saat dijalankan dari src/)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
@@ -0,0 +1,66 @@
+import random
+
+from input_manager import Problem
+from state import load_penalty, CONTAINER_COST
+from bounds import problem_bounds, optimal_penalty
+from stopping import StoppingPolicy
+
+
+def make_problem(sizes, capacity):
+    return Problem([{'id': f'BRG{i:03d}', 'ukuran': size} for i, size in enumerate(sizes)], capacity)
+
+
+def brute_force(sizes, capacity):
+    # (penalti minimum semua packing, jumlah kontainer minimum tanpa overflow) lewat enumerasi partisi
+    best_penalty = float('inf')
+    best_feasible = float('inf')
+
+    def assign(i, loads):
+        nonlocal best_penalty, best_feasible
+        if i == len(sizes):
+            penalty = sum(load_penalty(load, capacity) for load in loads) + CONTAINER_COST * len(loads)
+            best_penalty = min(best_penalty, penalty)
+            if all(load <= capacity for load in loads):
+                best_feasible = min(best_feasible, len(loads))
+            return
+        for k in range(len(loads)):
+            loads[k] += sizes[i]
+            assign(i + 1, loads)
+            loads[k] -= sizes[i]
+        loads.append(sizes[i])
+        assign(i + 1, loads)
+        loads.pop()
+
+    assign(0, [])
+    return best_penalty, best_feasible
+
+
+def test_overflowing_packing_with_fewer_containers():
+    sizes, capacity = [2, 9, 17, 16, 13, 10, 16], 18
+    bounds = problem_bounds(make_problem(sizes, capacity))
+    assert bounds.lower_bound == 6
+    assert bounds.optimal_penalty == brute_force(sizes, capacity)[0] == 554
+
+
+def test_bounds_are_valid_on_tiny_instances():
+    rng = random.Random(0)
+    for _ in range(300):
+        capacity = rng.randint(5, 30)
+        sizes = [rng.randint(1, capacity) for _ in range(rng.randint(1, 7))]
+        bounds = problem_bounds(make_problem(sizes, capacity))
+        best_penalty, best_feasible = brute_force(sizes, capacity)
+        assert bounds.lower_bound <= best_feasible, (sizes, capacity)
+        assert bounds.optimal_penalty <= best_penalty, (sizes, capacity)
+
+
+def test_optimal_penalty_without_overflow_branch():
+    # satu kontainer per lower bound tanpa overflow lebih murah dari semua m yang lebih kecil
+    assert optimal_penalty(2, 20, 10) == 2 * (CONTAINER_COST + 5) - 10
+
+
+def test_stopping_policy_only_stops_at_penalty_bound():
+    sizes, capacity = [2, 9, 17, 16, 13, 10, 16], 18
+    policy = StoppingPolicy().start(make_problem(sizes, capacity))
+    assert not policy.record(612.5)
+    assert policy.record(554)
+    assert policy.reason == 'proven_optimal'
@@ -0,0 +1,61 @@
+import random
+import time
+import tracemalloc
+
+from input_manager import Problem
+from construction import CONSTRUCTORS, best_fit_decreasing, worst_fit
+
+
+def make_problem(sizes, capacity):
+    return Problem([{'id': f'BRG{i:05d}', 'ukuran': size} for i, size in enumerate(sizes)], capacity)
+
+
+def reference_fit(sizes, capacity, decreasing, choose):
+    # versi O(n*m) langsung dari definisinya: jumlah kontainer yang dihasilkan
+    order = sorted(sizes, reverse=True) if decreasing else sizes
+    residuals = []
+    for size in order:
+        fits = [k for k, residual in enumerate(residuals) if residual >= size]
+        if fits:
+            k = choose(fits, key=lambda k: residuals[k])
+            residuals[k] -= size
+        else:
+            residuals.append(capacity - size)
+    return len(residuals)
+
+
+def test_every_item_packed_once():
+    rng = random.Random(1)
+    problem = make_problem([rng.randint(1, 100) for _ in range(300)], 100)
+    for construct in CONSTRUCTORS.values():
+        state = construct(problem)
+        packed = sorted(item['id'] for c in state.list_container for item in c.item_list)
+        assert packed == sorted(problem.ids)
+        assert all(c.load <= c.capacity for c in state.list_container)
+
+
+def test_best_and_worst_fit_match_reference():
+    rng = random.Random(2)
+    for _ in range(50):
+        capacity = rng.randint(10, 60)
+        sizes = [rng.randint(1, capacity) for _ in range(rng.randint(1, 80))]
+        problem = make_problem(sizes, capacity)
+        assert len(best_fit_decreasing(problem).list_container) == reference_fit(sizes, capacity, True, min)
+        assert len(worst_fit(problem).list_container) == reference_fit(sizes, capacity, False, max)
+
+
+def test_large_capacity_does_not_scale_with_capacity():
+    rng = random.Random(3)
+    capacity = 50_000_000
+    problem = make_problem([rng.randint(1, capacity) for _ in range(1000)], capacity)
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        best_fit_decreasing(problem)
+        worst_fit(problem)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert elapsed < 2.0
+    assert peak < 20 * 1024 * 1024
@@ -0,0 +1,73 @@
+import gc
+import os
+import pickle
+
+from recorder import TrajectoryRecorder, make_recorder
+
+
+def filled(policy, count=50, **options):
+    recorder = make_recorder(policy, **options)
+    for k in range(count):
+        recorder.append(float(k % 7))
+    return recorder
+
+
+def test_mmap_indexing_matches_values():
+    recorder = filled('mmap')
+    values = recorder.values()
+    assert len(recorder) == 50
+    assert [recorder[k] for k in range(50)] == values
+    assert recorder[-1] == values[-1]
+    assert recorder[3:6] == values[3:6]
+    recorder.close()
+
+
+def test_mmap_temporary_file_is_removed(tmp_path):
+    recorder = filled('mmap', name='objective', directory=str(tmp_path))
+    path = recorder.path
+    assert os.path.dirname(path) == str(tmp_path)
+    with recorder:
+        assert os.path.exists(path)
+    assert not os.path.exists(path)
+
+    recorder = filled('mmap', directory=str(tmp_path))
+    path = recorder.path
+    del recorder
+    gc.collect()
+    assert not os.path.exists(path)
+
+
+def test_mmap_copy_keeps_directory_and_name(tmp_path):
+    recorder = filled('mmap', name='objective', directory=str(tmp_path))
+    duplicate = recorder.copy()
+    assert os.path.dirname(duplicate.path) == str(tmp_path)
+    assert os.path.basename(duplicate.path).startswith('objective_')
+    assert duplicate.values() == recorder.values()
+    recorder.close()
+    duplicate.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_mmap_pickle_moves_file_ownership(tmp_path):
+    recorder = filled('mmap', directory=str(tmp_path))
+    restored = pickle.loads(pickle.dumps(recorder))
+    del recorder
+    gc.collect()
+    assert restored.values() == [float(k % 7) for k in range(50)]
+    restored.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_caller_path_is_kept(tmp_path):
+    path = str(tmp_path / 'trajectory.bin')
+    recorder = TrajectoryRecorder('mmap', path=path)
+    recorder.append(1.0)
+    recorder.close()
+    assert os.path.exists(path)
+
+
+def test_length_of_sampled_policies():
+    for policy in ('stride', 'reservoir', 'minmax'):
+        recorder = filled(policy, count=1000, capacity=64)
+        assert len(recorder) == len(recorder.values())
+        assert recorder[0] == recorder.values()[0]
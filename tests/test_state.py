@@ -0,0 +1,78 @@
+import random
+
+from input_manager import Problem
+from state import State, Container, Move
+
+
+def make_problem(sizes, capacity):
+    return Problem([{'id': f'BRG{i:05d}', 'ukuran': size} for i, size in enumerate(sizes)], capacity)
+
+
+def random_state(rng, problem, num_containers, empty=0):
+    state = State()
+    state.list_container = [Container(capacity=problem.capacity) for _ in range(num_containers + empty)]
+    for item in problem.items:
+        state.list_container[rng.randrange(num_containers)].add_item(item)
+    return state
+
+
+def actual_delta(state, move):
+    # penalti dihitung ulang dari awal setelah move, bukan dari delta yang ditambahkan apply_move
+    moved = state.copy().apply_move(move)
+    moved._penalty = None
+    return moved.count_penalty() - state.count_penalty()
+
+
+def test_relocate_delta_matches_apply_move():
+    rng = random.Random(1)
+    for _ in range(60):
+        capacity = rng.randint(10, 40)
+        # ukuran sampai 2x kapasitas: ada overflow dan kontainer berisi satu barang
+        problem = make_problem([rng.randint(1, 2 * capacity) for _ in range(rng.randint(1, 12))], capacity)
+        state = random_state(rng, problem, rng.randint(1, 6), empty=rng.randint(0, 2))
+        containers = state.list_container
+        for i, container in enumerate(containers):
+            for item in container.item_list:
+                for j in [None] + list(range(len(containers))):
+                    move = Move(state.relocate_delta(i, j, item), item, i, j, None)
+                    assert abs(move.delta - actual_delta(state, move)) < 1e-9
+
+
+def test_relocate_delta_emptying_source():
+    problem = make_problem([7, 5, 30], 10)
+    state = State()
+    state.list_container = [Container(capacity=10) for _ in range(3)]
+    for k, item in enumerate(problem.items):
+        state.list_container[k].add_item(item)
+    item = problem.items[0]
+    for target in (None, 0, 1, 2):
+        move = Move(state.relocate_delta(0, target, item), item, 0, target, None)
+        assert abs(move.delta - actual_delta(state, move)) < 1e-9
+
+
+def test_swap_delta_matches_apply_move():
+    rng = random.Random(2)
+    for _ in range(60):
+        capacity = rng.randint(10, 40)
+        problem = make_problem([rng.randint(1, 2 * capacity) for _ in range(rng.randint(2, 12))], capacity)
+        state = random_state(rng, problem, rng.randint(1, 5))
+        containers = state.list_container
+        for i, container in enumerate(containers):
+            for j, other in enumerate(containers):
+                for item in container.item_list:
+                    for partner in other.item_list:
+                        if partner is item:
+                            continue
+                        move = Move(state.swap_delta(i, j, item, partner), item, i, j, partner)
+                        assert abs(move.delta - actual_delta(state, move)) < 1e-9
+
+
+def test_swap_within_same_container_is_zero():
+    problem = make_problem([4, 9, 12], 10)
+    state = State()
+    state.list_container = [Container(capacity=10)]
+    for item in problem.items:
+        state.list_container[0].add_item(item)
+    first, second = problem.items[0], problem.items[2]
+    assert state.swap_delta(0, 0, first, second) == 0
+    assert actual_delta(state, Move(0, first, 0, 0, second)) == 0
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from input_manager import Problem
+from state import State
+from algorithm import vectorized_genetic as engine
+
+
+def make_problem(sizes, capacity):
+    return Problem([{'id': f'BRG{i:05d}', 'ukuran': size} for i, size in enumerate(sizes)], capacity)
+
+
+def random_states(seed, cases):
+    rng = random.Random(seed)
+    random.seed(seed)
+    for _ in range(cases):
+        capacity = rng.randint(10, 60)
+        problem = make_problem([rng.randint(1, 2 * capacity) for _ in range(rng.randint(1, 40))], capacity)
+        state = State()
+        # generate_random_state kadang menambah kontainer kosong
+        state.generate_random_state(problem)
+        yield problem, state
+
+
+def test_evaluate_matches_count_penalty():
+    for problem, state in random_states(1, 100):
+        sizes = np.asarray(problem.sizes, dtype=np.float64)
+        # baris kedua: individu acak dari engine, dibandingkan lewat to_state
+        other = engine.random_population(np.random.default_rng(0), 1, len(problem))[0]
+        rows = np.stack([engine.from_state(state, problem), other])
+        penalties, _ = engine.evaluate(rows, sizes, problem.capacity)
+        # baris matriks tidak punya kontainer kosong, jadi dibandingkan dengan state tanpa kontainer kosong
+        state.remove_empty_containers()
+        assert penalties[0] == pytest.approx(state.count_penalty())
+        assert penalties[1] == pytest.approx(engine.to_state(rows[1], problem).count_penalty())
+
+
+def test_round_trip_keeps_every_item():
+    for problem, state in random_states(2, 100):
+        restored = engine.to_state(engine.from_state(state, problem), problem)
+        packed = sorted(item['id'] for container in restored.list_container for item in container.item_list)
+        assert packed == sorted(problem.ids)
+        state.remove_empty_containers()
+        assert restored.canonical_hash() == state.canonical_hash()
+        assert restored.count_penalty() == pytest.approx(state.count_penalty())
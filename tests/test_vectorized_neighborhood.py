@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from input_manager import Problem
+from state import State, Container
+from algorithm import vectorized_neighborhood
+from algorithm.hill_climbing import HillClimbing
+
+
+def make_problem(sizes, capacity):
+    return Problem([{'id': f'BRG{i:05d}', 'ukuran': size} for i, size in enumerate(sizes)], capacity)
+
+
+def random_state(rng, problem, num_containers, empty=0):
+    state = State()
+    state.list_container = [Container(capacity=problem.capacity) for _ in range(num_containers + empty)]
+    for item in problem.items:
+        state.list_container[rng.randrange(num_containers)].add_item(item)
+    return state
+
+
+def check_best_move(rng, cases):
+    for _ in range(cases):
+        capacity = rng.randint(10, 40)
+        problem = make_problem([rng.randint(1, 2 * capacity) for _ in range(rng.randint(1, 25))], capacity)
+        state = random_state(rng, problem, rng.randint(1, 8), empty=rng.randint(0, 2))
+        hc = HillClimbing(problem)
+        expected = min(move.delta for move in hc.neighborhood(state))
+        move = vectorized_neighborhood.best_move(state)
+        assert move.delta == pytest.approx(expected)
+        # move yang dikembalikan memang menghasilkan delta tersebut
+        moved = state.copy().apply_move(move)
+        moved._penalty = None
+        assert moved.count_penalty() - state.count_penalty() == pytest.approx(move.delta)
+
+
+def test_best_move_matches_scalar_neighborhood():
+    check_best_move(random.Random(1), 80)
+
+
+def test_best_move_matches_scalar_neighborhood_in_small_blocks(monkeypatch):
+    # beberapa baris per blok, sehingga relokasi dan swap sama-sama melewati banyak blok
+    monkeypatch.setattr(vectorized_neighborhood, 'BLOCK_ELEMENTS', 32)
+    check_best_move(random.Random(2), 80)